@@ -0,0 +1,112 @@
+"""Asyncio subprocess helpers for AI Fleet.
+
+The managers' async variants start their git, tmux and setup processes
+through ``run`` so that many agents' I/O-bound steps can overlap in one
+event loop. Each kind of resource has its own concurrency limit, set
+from the project config by ``configure_limits``.
+"""
+
+import asyncio
+import os
+import weakref
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Processes of each kind allowed to run at once
+DEFAULT_LIMITS = {"git": 4, "tmux": 16, "setup": 4}
+
+_limits: Dict[str, int] = dict(DEFAULT_LIMITS)
+
+# Semaphores belong to the loop they are used in; every ``run_sync`` call
+# starts a new loop
+_semaphores: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def configure_limits(limits: Mapping[str, Any]) -> None:
+    """Set how many processes of each kind may run at once.
+
+    Args:
+        limits: Mapping of resource name (git, tmux, setup) to limit
+    """
+    for resource, limit in limits.items():
+        _limits[resource] = max(1, int(limit))
+
+
+def limiter(resource: str) -> asyncio.Semaphore:
+    """Get the running loop's semaphore for a kind of resource.
+
+    Args:
+        resource: Resource name
+
+    Returns:
+        Semaphore limiting concurrent processes of that kind
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.setdefault(loop, {})
+    if resource not in semaphores:
+        limit = _limits.get(resource, DEFAULT_LIMITS.get(resource, 1))
+        semaphores[resource] = asyncio.Semaphore(limit)
+    return semaphores[resource]
+
+
+async def run(
+    args: List[str],
+    resource: str,
+    cwd: Optional[str] = None,
+    input: Optional[str] = None,
+    shell: bool = False,
+    env: Optional[Dict[str, str]] = None,
+) -> Tuple[int, str, str]:
+    """Run a process once a slot for its resource is free.
+
+    Args:
+        args: Argument list; with ``shell`` a single command string
+        resource: Resource whose limit applies (git, tmux or setup)
+        cwd: Working directory
+        input: Text written to the process's stdin
+        shell: Run ``args[0]`` through the shell
+        env: Variables set on top of this process's environment
+
+    Returns:
+        (returncode, stdout, stderr)
+    """
+    async with limiter(resource):
+        stdin = asyncio.subprocess.PIPE if input is not None else None
+        pipe = asyncio.subprocess.PIPE
+        environ = {**os.environ, **env} if env else None
+        if shell:
+            process = await asyncio.create_subprocess_shell(
+                args[0], cwd=cwd, stdin=stdin, stdout=pipe, stderr=pipe, env=environ
+            )
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *args, cwd=cwd, stdin=stdin, stdout=pipe, stderr=pipe, env=environ
+            )
+        data = input.encode() if input is not None else None
+        stdout, stderr = await process.communicate(data)
+
+    returncode = process.returncode if process.returncode is not None else -1
+    return (
+        returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """Run an async manager call from synchronous code.
+
+    Args:
+        awaitable: Coroutine to run in a fresh event loop
+
+    Returns:
+        The coroutine's result
+    """
+
+    async def main() -> T:
+        return await awaitable
+
+    return asyncio.run(main())
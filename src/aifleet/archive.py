@@ -0,0 +1,275 @@
+"""Archiving killed agents' work for AI Fleet.
+
+Keeping every killed agent's branch bloats the ref namespace, deleting it
+loses the work. Archiving snapshots an agent's worktree, uncommitted and
+untracked (but not ignored) files included, as a commit stored under
+``refs/aifleet/archive/<batch>/<branch>``. In bundle mode a batch's
+archive refs are then moved into ``.aifleet/archive/<batch>.bundle``,
+which only holds the objects not already reachable from HEAD.
+``fleet revive`` recreates a worktree and session from an entry.
+"""
+
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .worktree import WorktreeManager
+
+ARCHIVE_NAMESPACE = "refs/aifleet/archive"
+
+# Subject of the commit holding an agent's uncommitted changes; its
+# parent is the commit the agent's branch pointed to
+SNAPSHOT_SUBJECT = "aifleet: uncommitted changes"
+
+# Ref in a clone workspace through which its snapshot is fetched
+CLONE_SNAPSHOT_REF = "refs/aifleet/snapshot"
+
+
+@dataclass
+class ArchiveEntry:
+    """One archived agent."""
+
+    batch: str
+    branch: str
+    commit: str
+    bundle: Optional[Path] = None
+
+    @property
+    def name(self) -> str:
+        """Name used to pick the entry, ``<batch>/<branch>``."""
+        return f"{self.batch}/{self.branch}"
+
+    @property
+    def ref(self) -> str:
+        """Archive ref of the entry."""
+        return archive_ref(self.batch, self.branch)
+
+
+def archive_ref(batch: str, branch: str) -> str:
+    """Get the archive ref for an agent."""
+    return f"{ARCHIVE_NAMESPACE}/{batch}/{branch}"
+
+
+def bundle_dir(project_root: Path) -> Path:
+    """Get the directory holding a project's archive bundles."""
+    return project_root / ".aifleet" / "archive"
+
+
+def snapshot_worktree(
+    worktree: WorktreeManager, path: Path, branch: str
+) -> Optional[str]:
+    """Record a worktree's full state as a commit without touching it.
+
+    The changes are staged into a temporary index, so the agent's own
+    index and files are left as they are.
+
+    Args:
+        worktree: Worktree manager
+        path: Worktree path
+        branch: Agent's branch, for the commit message
+
+    Returns:
+        The snapshot commit, HEAD if the worktree is clean, or None
+    """
+    success, head, _ = worktree._run_git(["rev-parse", "HEAD"], cwd=path)
+    if not success:
+        return None
+    head = head.strip()
+
+    with tempfile.TemporaryDirectory() as temp:
+        env = {"GIT_INDEX_FILE": str(Path(temp) / "index")}
+        for args in (["read-tree", "HEAD"], ["add", "-A"]):
+            success, _, stderr = worktree._run_git(args, cwd=path, env=env)
+            if not success:
+                print(f"Failed to snapshot {path}: {stderr.strip()}")
+                return None
+        success, tree, _ = worktree._run_git(["write-tree"], cwd=path, env=env)
+        if not success:
+            return None
+
+    success, head_tree, _ = worktree._run_git(["rev-parse", "HEAD^{tree}"], cwd=path)
+    if success and head_tree.strip() == tree.strip():
+        return head
+
+    message = f"{SNAPSHOT_SUBJECT} on {branch}"
+    success, commit, stderr = worktree._run_git(
+        ["commit-tree", tree.strip(), "-p", head, "-m", message], cwd=path
+    )
+    if not success:
+        print(f"Failed to snapshot {path}: {stderr.strip()}")
+        return None
+    return commit.strip()
+
+
+def archive_worktree(
+    worktree: WorktreeManager, path: Path, batch: str, branch: str
+) -> Optional[str]:
+    """Snapshot an agent's worktree into its archive ref.
+
+    Without a worktree, the branch itself is archived.
+
+    Args:
+        worktree: Worktree manager
+        path: Worktree path
+        batch: Agent's batch ID
+        branch: Agent's branch
+
+    Returns:
+        Archived commit, or None if nothing could be archived
+    """
+    if path.exists():
+        commit = snapshot_worktree(worktree, path, branch)
+    else:
+        success, stdout, _ = worktree._run_git(
+            ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"]
+        )
+        commit = stdout.strip() if success else None
+    if not commit:
+        return None
+
+    if worktree.is_clone(path):
+        # The snapshot only exists in the clone until it is fetched over
+        worktree._run_git(["update-ref", CLONE_SNAPSHOT_REF, commit], cwd=path)
+        refspec = f"+{CLONE_SNAPSHOT_REF}:{archive_ref(batch, branch)}"
+        success, _, stderr = worktree._run_git(["fetch", "-q", str(path), refspec])
+    else:
+        success, _, stderr = worktree._run_git(
+            ["update-ref", archive_ref(batch, branch), commit]
+        )
+    if not success:
+        print(f"Failed to archive {branch}: {stderr.strip()}")
+        return None
+    return commit
+
+
+def bundle_batch(worktree: WorktreeManager, batch: str) -> Optional[Path]:
+    """Move a batch's archive refs into the batch's bundle.
+
+    Entries already in the bundle are kept. Refs whose commit is already
+    reachable from HEAD have no objects to bundle and stay refs.
+
+    Args:
+        worktree: Worktree manager
+        batch: Batch ID
+
+    Returns:
+        Bundle path, or None if no bundle was written
+    """
+    path = bundle_dir(worktree.repo_root) / f"{batch}.bundle"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prefix = f"{ARCHIVE_NAMESPACE}/{batch}"
+
+    _, stdout, _ = worktree._run_git(["for-each-ref", "--format=%(refname)", prefix])
+    refs = stdout.split()
+    if not refs:
+        return None
+
+    # Newly archived refs replace bundled entries of the same name
+    if path.exists():
+        older = [ref for _, ref in list_bundle(worktree, path) if ref not in refs]
+        if older:
+            specs = [f"{ref}:{ref}" for ref in older]
+            success, _, stderr = worktree._run_git(["fetch", "-q", str(path), *specs])
+            if not success:
+                print(f"Failed to read {path}: {stderr.strip()}")
+                return None
+            refs += older
+
+    temp = path.with_suffix(".tmp")
+    success, _, stderr = worktree._run_git(
+        ["bundle", "create", "-q", str(temp), *refs, "--not", "HEAD"]
+    )
+    if not success:
+        if "empty bundle" not in stderr:
+            print(f"Failed to bundle batch {batch}: {stderr.strip()}")
+        return None
+    temp.rename(path)
+
+    for _, ref in list_bundle(worktree, path):
+        worktree._run_git(["update-ref", "-d", ref])
+    return path
+
+
+def list_bundle(worktree: WorktreeManager, path: Path) -> List[Tuple[str, str]]:
+    """List a bundle's (commit, ref) pairs."""
+    success, stdout, _ = worktree._run_git(["bundle", "list-heads", str(path)])
+    if not success:
+        return []
+    return [
+        (commit, ref)
+        for commit, ref in (line.split(" ", 1) for line in stdout.splitlines())
+        if ref.startswith(ARCHIVE_NAMESPACE + "/")
+    ]
+
+
+def _entry(commit: str, ref: str, bundle: Optional[Path] = None) -> ArchiveEntry:
+    batch, _, branch = ref[len(ARCHIVE_NAMESPACE) + 1 :].partition("/")
+    return ArchiveEntry(batch, branch, commit, bundle)
+
+
+def list_archive(worktree: WorktreeManager) -> List[ArchiveEntry]:
+    """List archived agents, in refs and in bundles.
+
+    Args:
+        worktree: Worktree manager
+
+    Returns:
+        Entries; an agent in both a ref and a bundle is listed once, by ref
+    """
+    _, stdout, _ = worktree._run_git(
+        ["for-each-ref", "--format=%(objectname) %(refname)", ARCHIVE_NAMESPACE]
+    )
+    entries = [
+        _entry(commit, ref)
+        for commit, ref in (line.split(" ", 1) for line in stdout.splitlines())
+    ]
+    seen = {entry.ref for entry in entries}
+
+    for path in sorted(bundle_dir(worktree.repo_root).glob("*.bundle")):
+        for commit, ref in list_bundle(worktree, path):
+            if ref not in seen:
+                entries.append(_entry(commit, ref, path))
+                seen.add(ref)
+    return entries
+
+
+def find_entry(entries: List[ArchiveEntry], name: str) -> List[ArchiveEntry]:
+    """Find entries by ``<batch>/<branch>`` or by branch alone."""
+    exact = [entry for entry in entries if entry.name == name]
+    return exact or [entry for entry in entries if entry.branch == name]
+
+
+def restore_point(
+    worktree: WorktreeManager, entry: ArchiveEntry
+) -> Optional[Tuple[str, Optional[str]]]:
+    """Make an entry's commit available and split it into branch and changes.
+
+    Args:
+        worktree: Worktree manager
+        entry: Archive entry
+
+    Returns:
+        (commit the branch points to, snapshot of uncommitted changes or
+        None), or None if the entry can't be read
+    """
+    if entry.bundle:
+        success, _, stderr = worktree._run_git(
+            ["fetch", "-q", str(entry.bundle), f"+{entry.ref}:{entry.ref}"]
+        )
+        if not success:
+            print(f"Failed to read {entry.bundle}: {stderr.strip()}")
+            return None
+
+    success, subject, _ = worktree._run_git(["log", "-1", "--format=%s", entry.commit])
+    if not success:
+        return None
+    if subject.startswith(SNAPSHOT_SUBJECT):
+        success, parent, _ = worktree._run_git(["rev-parse", f"{entry.commit}^"])
+        return (parent.strip(), entry.commit) if success else None
+    return entry.commit, None
+
+
+def drop_entry(worktree: WorktreeManager, entry: ArchiveEntry) -> None:
+    """Delete an entry's archive ref (bundles are left unchanged)."""
+    worktree._run_git(["update-ref", "-d", entry.ref])
@@ -0,0 +1,241 @@
+"""Shared compiler and package caches for all agents.
+
+``setup.shared_caches.tools`` names the tools whose caches every agent
+shares. Each tool gets a directory under the fleet's cache root, and the
+variables pointing the tool at it are set in setup commands and agent
+sessions. This way a dependency downloaded or an object compiled by one
+agent is reused by all the others instead of being fetched and built once
+per worktree.
+
+ccache and sccache enforce their size limit themselves. The other caches
+grow until ``fleet cache --trim`` removes their least recently used files.
+
+Rust builds share compiled crates through sccache (``RUSTC_WRAPPER``)
+rather than a common ``CARGO_TARGET_DIR``: cargo locks a target directory
+for the whole build, and trimming one under a running build breaks it.
+Each worktree keeps its own ``target/``, which is never trimmed.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .config import ConfigManager
+
+
+@dataclass(frozen=True)
+class CacheTool:
+    """How a tool is pointed at its shared cache directory."""
+
+    # Variable -> path relative to the tool's cache directory ("" = itself)
+    paths: Dict[str, str]
+    # Variable the tool reads its own size limit from
+    limit_variable: Optional[str] = None
+    # Subdirectories whose files may be deleted to stay under the limit
+    trim: Tuple[str, ...] = ()
+    # Command printing the tool's hit statistics
+    stats: List[str] = field(default_factory=list)
+    # Variables with fixed values, e.g. a compiler wrapper
+    values: Dict[str, str] = field(default_factory=dict)
+    # Cache directory (and limit) of another tool whose cache this one uses
+    directory: Optional[str] = None
+    # Program that must be installed for the variables to be set
+    requires: Optional[str] = None
+
+
+CACHE_TOOLS = {
+    "ccache": CacheTool(
+        {"CCACHE_DIR": ""}, "CCACHE_MAXSIZE", stats=["ccache", "--show-stats"]
+    ),
+    "sccache": CacheTool(
+        {"SCCACHE_DIR": ""}, "SCCACHE_CACHE_SIZE", stats=["sccache", "--show-stats"]
+    ),
+    "pip": CacheTool({"PIP_CACHE_DIR": ""}, trim=("",)),
+    "npm": CacheTool({"npm_config_cache": ""}, trim=("",)),
+    "yarn": CacheTool({"YARN_CACHE_FOLDER": ""}, trim=("",)),
+    "go": CacheTool({"GOCACHE": "build", "GOMODCACHE": "mod"}, trim=("build",)),
+    "cargo": CacheTool(
+        {"SCCACHE_DIR": ""},
+        "SCCACHE_CACHE_SIZE",
+        stats=["sccache", "--show-stats"],
+        values={"RUSTC_WRAPPER": "sccache"},
+        directory="sccache",
+        requires="sccache",
+    ),
+    "bundler": CacheTool({"BUNDLE_PATH": ""}),
+}
+
+SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(size: str) -> int:
+    """Parse a size such as ``500M`` or ``10G`` into bytes.
+
+    Args:
+        size: Number with an optional K, M, G or T suffix
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size can't be parsed
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", str(size).upper())
+    if not match:
+        raise ValueError(f"Invalid size '{size}'")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def format_size(size: int) -> str:
+    """Format a byte count for display."""
+    value = float(size)
+    for unit in ("B", "K", "M", "G"):
+        if value < 1024:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}T"
+
+
+def cache_tools(config: ConfigManager) -> List[str]:
+    """Get the configured tools that have a known cache layout."""
+    return [tool for tool in config.shared_caches if tool in CACHE_TOOLS]
+
+
+def cache_name(tool: str) -> str:
+    """Get the name of the cache directory and limit a tool uses."""
+    return CACHE_TOOLS[tool].directory or tool
+
+
+def cache_environment(config: ConfigManager) -> Dict[str, str]:
+    """Provision the shared cache directories and get their variables.
+
+    Args:
+        config: Project configuration
+
+    Returns:
+        Variables to set for setup commands and agents (empty if none)
+    """
+    env: Dict[str, str] = {}
+    for tool in cache_tools(config):
+        spec = CACHE_TOOLS[tool]
+        if spec.requires and not shutil.which(spec.requires):
+            continue
+        directory = config.cache_root / cache_name(tool)
+        for variable, relative in spec.paths.items():
+            path = directory / relative
+            path.mkdir(parents=True, exist_ok=True)
+            env[variable] = str(path)
+        if spec.limit_variable:
+            env[spec.limit_variable] = config.cache_limit(cache_name(tool))
+        env.update(spec.values)
+
+    if "CCACHE_DIR" in env:
+        # Paths inside any worktree hash the same, so agents share hits
+        env["CCACHE_BASEDIR"] = str(config.worktree_root)
+        env["CCACHE_NOHASHDIR"] = "true"
+    return env
+
+
+def dir_size(path: Path) -> int:
+    """Get the total size of the files below a directory."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def trim_directory(path: Path, limit: int) -> int:
+    """Delete a directory's least recently used files until under a limit.
+
+    Args:
+        path: Cache directory
+        limit: Size to trim down to, in bytes
+
+    Returns:
+        Bytes freed
+    """
+    files = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            file = os.path.join(root, name)
+            try:
+                stat = os.lstat(file)
+            except OSError:
+                continue
+            files.append((max(stat.st_atime, stat.st_mtime), stat.st_size, file))
+
+    excess = sum(size for _, size, _ in files) - limit
+    freed = 0
+    for _, size, file in sorted(files):
+        if freed >= excess:
+            break
+        try:
+            os.unlink(file)
+            freed += size
+        except OSError:
+            pass
+    return freed
+
+
+def trim_cache(config: ConfigManager, tool: str) -> int:
+    """Trim a tool's cache to its size limit, if the tool doesn't itself.
+
+    Args:
+        config: Project configuration
+        tool: Tool name
+
+    Returns:
+        Bytes freed
+    """
+    spec = CACHE_TOOLS[tool]
+    directory = config.cache_root / cache_name(tool)
+    dirs = [directory / relative for relative in spec.trim]
+    dirs = [path for path in dirs if path.is_dir()]
+    if not dirs:
+        return 0
+
+    limit = parse_size(config.cache_limit(cache_name(tool)))
+    # Untrimmable parts of the cache still count against its limit
+    kept = dir_size(directory) - sum(dir_size(path) for path in dirs)
+    freed = 0
+    for path in dirs:
+        freed += trim_directory(path, max(0, limit - kept) // len(dirs))
+    return freed
+
+
+def cache_stats(tool: str, env: Dict[str, str]) -> List[str]:
+    """Get the hit statistics a tool reports for its cache.
+
+    Args:
+        tool: Tool name
+        env: Shared cache variables
+
+    Returns:
+        Hit and miss lines from the tool's statistics (empty if unavailable)
+    """
+    command = CACHE_TOOLS[tool].stats
+    if not command or not shutil.which(command[0]):
+        return []
+    try:
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            env={**os.environ, **env},
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    return [
+        " ".join(line.split())
+        for line in result.stdout.splitlines()
+        if re.search(r"\b(hits?|miss(es)?)\b", line, re.IGNORECASE)
+    ]
@@ -5,14 +5,21 @@ import sys
 import click
 
 from .commands.attach import attach
+from .commands.cache import cache
 from .commands.create import create
+from .commands.doctor import doctor
+from .commands.events import events
 from .commands.fanout import fanout
 from .commands.init import init
 from .commands.kill import kill
 from .commands.list import list
 from .commands.logs import logs
+from .commands.maintenance import maintenance
 from .commands.multi import multi
 from .commands.prompt import prompt
+from .commands.reconcile import reconcile
+from .commands.revive import revive
+from .commands.sync_creds import sync_creds
 from .commands.update import update
 from .config import ConfigManager
 
@@ -91,9 +98,16 @@ cli.add_command(list)
 cli.add_command(prompt)
 cli.add_command(attach)
 cli.add_command(logs)
+cli.add_command(events)
 cli.add_command(kill)
+cli.add_command(revive)
 cli.add_command(fanout)
 cli.add_command(multi)
+cli.add_command(reconcile)
+cli.add_command(doctor)
+cli.add_command(sync_creds)
+cli.add_command(cache)
+cli.add_command(maintenance)
 cli.add_command(update)
 
 # Add short alias for list command
@@ -3,8 +3,7 @@
 import click
 
 from ..state import StateManager
-from ..tmux import TmuxManager
-from .base import ensure_project_config
+from .base import ensure_project_config, get_session_manager
 
 
 @click.command()
@@ -17,7 +16,7 @@ def attach(branch: str) -> None:
     """
     config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux = TmuxManager(config.tmux_prefix)
+    tmux = get_session_manager(config)
 
     # Get the agent
     agent = state.get_agent(branch)
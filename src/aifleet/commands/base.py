@@ -1,8 +1,14 @@
 """Base utilities for commands."""
 
+from typing import Optional
+
 import click
 
+from .. import aio
 from ..config import ConfigManager
+from ..headless import HeadlessManager
+from ..tmux import TmuxManager
+from ..worktree import WorktreeManager
 
 
 def ensure_project_config() -> ConfigManager:
@@ -44,4 +50,46 @@ def ensure_project_config() -> ConfigManager:
 
         raise SystemExit(1)
 
+    aio.configure_limits(config.concurrency_limits)
     return config
+
+
+def get_session_manager(config: ConfigManager) -> TmuxManager:
+    """Create the session manager for the configured backend.
+
+    Args:
+        config: Project configuration
+
+    Returns:
+        HeadlessManager for the headless backend, TmuxManager otherwise
+    """
+    if config.session_backend == "headless":
+        return HeadlessManager(config.repo_root, config.tmux_prefix)
+    return TmuxManager(config.tmux_prefix, config.tmux_socket, config.tmux_shards)
+
+
+def pin_base(
+    config: ConfigManager, worktree: WorktreeManager, ref: Optional[str]
+) -> Optional[str]:
+    """Resolve a ``--base`` ref once for a whole batch.
+
+    Args:
+        config: Project configuration
+        worktree: Worktree manager
+        ref: Base ref given on the command line, if any
+
+    Returns:
+        Pinned commit SHA, or None when no base was requested
+
+    Raises:
+        SystemExit: If the ref can't be resolved
+    """
+    if not ref:
+        return None
+
+    base = worktree.resolve_base(ref, config.fetch_ttl)
+    if not base:
+        click.echo(f"Cannot resolve base '{ref}'", err=True)
+        raise SystemExit(1)
+    click.echo(f"Base: {ref} ({base[:12]})")
+    return base
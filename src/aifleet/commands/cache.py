@@ -0,0 +1,50 @@
+"""Cache command to report on the agents' shared caches."""
+
+import click
+
+from ..caches import (
+    CACHE_TOOLS,
+    cache_environment,
+    cache_name,
+    cache_stats,
+    cache_tools,
+    dir_size,
+    format_size,
+    parse_size,
+    trim_cache,
+)
+from .base import ensure_project_config
+
+
+@click.command()
+@click.option(
+    "--trim", is_flag=True, help="Delete least recently used files over the limits"
+)
+def cache(trim: bool) -> None:
+    """Show the size and hit statistics of the shared caches.
+
+    Caches are configured with setup.shared_caches. ccache and sccache
+    keep to their size limit themselves; the other caches are brought
+    under theirs with --trim.
+    """
+    config = ensure_project_config()
+    tools = cache_tools(config)
+    if not tools:
+        click.echo("No shared caches configured (setup.shared_caches.tools)")
+        return
+
+    env = cache_environment(config)
+    click.echo(f"Shared caches in {config.cache_root}:")
+    for tool in tools:
+        directory = config.cache_root / cache_name(tool)
+        if trim and CACHE_TOOLS[tool].trim:
+            freed = trim_cache(config, tool)
+            if freed:
+                click.echo(f"  Trimmed {format_size(freed)} from {tool}")
+
+        size = dir_size(directory)
+        limit = config.cache_limit(cache_name(tool))
+        marker = "  ⚠️  over limit" if size > parse_size(limit) else ""
+        click.echo(f"  {tool:<8} {format_size(size):>8} / {limit}{marker}")
+        for line in cache_stats(tool, env):
+            click.echo(f"           {line}")
@@ -4,13 +4,14 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from typing import Optional
 
 import click
 
+from ..launcher import launch_agent
 from ..state import Agent, StateManager
-from ..tmux import TmuxManager
-from ..worktree import WorktreeManager
-from .base import ensure_project_config
+from ..worktree import WorktreeManager, WorktreeSetup
+from .base import ensure_project_config, get_session_manager, pin_base
 
 
 def verify_agent_command(agent: str) -> bool:
@@ -33,7 +34,12 @@ def verify_agent_command(agent: str) -> bool:
 @click.argument("branch")
 @click.option("--prompt", "-p", help="Initial prompt to send to the agent")
 @click.option("--agent", "-a", help="Agent to use (default: from config)")
-def create(branch: str, prompt: str, agent: str):
+@click.option(
+    "--base",
+    "base_ref",
+    help="Branch new agents from this ref (remote refs are fetched first)",
+)
+def create(branch: str, prompt: str, agent: str, base_ref: Optional[str]):
     """Create a new AI agent on a branch.
 
     Creates a git worktree, sets up the environment, launches a tmux session,
@@ -54,8 +60,13 @@ def create(branch: str, prompt: str, agent: str):
         sys.exit(1)
 
     # Initialize managers
-    worktree_mgr = WorktreeManager(config.repo_root, config.worktree_root)
-    tmux_mgr = TmuxManager(config.tmux_prefix)
+    worktree_mgr = WorktreeManager(
+        config.repo_root,
+        config.worktree_root,
+        config.workspace_mode,
+        config.clone_filter,
+    )
+    tmux_mgr = get_session_manager(config)
 
     # Check if agent already exists
     if state.get_agent(branch):
@@ -63,42 +74,21 @@ def create(branch: str, prompt: str, agent: str):
         sys.exit(1)
 
     click.echo(f"Creating agent on branch '{branch}'...")
+    base = pin_base(config, worktree_mgr, base_ref)
 
     # Create and setup worktree
     click.echo("Setting up worktree...")
     worktree_path = worktree_mgr.setup_worktree(
-        branch, config.credential_files, config.setup_commands, config.quick_setup
+        branch, WorktreeSetup.from_config(config), base=base
     )
 
     if not worktree_path:
         click.echo("Failed to create worktree", err=True)
         sys.exit(1)
 
-    # Create tmux session
-    click.echo("Creating tmux session...")
-    session = tmux_mgr.create_session(branch, str(worktree_path))
-
-    if not session:
-        click.echo("Failed to create tmux session", err=True)
-        # Clean up worktree
-        worktree_mgr.remove_worktree(worktree_path, force=True)
-        sys.exit(1)
-
-    # Build agent command
-    agent_cmd = agent
-    if config.claude_flags and agent == "claude":
-        agent_cmd = f"{agent} {config.claude_flags}"
-
-    # Send agent startup command
+    # Create tmux session and start the agent in it
     click.echo(f"Starting {agent} agent...")
-    if prompt:
-        # Start agent with prompt
-        full_command = f"{agent_cmd} '{prompt}'"
-    else:
-        # Just start agent
-        full_command = agent_cmd
-
-    if not tmux_mgr.send_command(branch, full_command):
+    if not launch_agent(tmux_mgr, config, branch, str(worktree_path), agent, prompt):
         click.echo("Failed to start agent", err=True)
         # Clean up
         tmux_mgr.kill_session(branch)
@@ -138,12 +128,13 @@ def create(branch: str, prompt: str, agent: str):
     agent_record = Agent(
         branch=branch,
         worktree=str(worktree_path),
-        session=tmux_mgr._session_name(branch),
+        session=tmux_mgr.session_name(branch),
         batch_id=f"manual-{datetime.now().strftime('%Y%m%d')}",
         agent=agent,
         created_at=datetime.now().isoformat(),
         pid=pid,
         prompt=prompt,
+        base=base,
     )
     state.add_agent(agent_record)
 
@@ -0,0 +1,84 @@
+"""Doctor command to check the fleet's setup."""
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List
+
+import click
+
+from ..state import StateManager
+from ..worktree import WorktreeManager
+from .base import ensure_project_config
+
+
+def check_tools(backend: str) -> List[str]:
+    """Check that the external tools the fleet needs are installed.
+
+    Args:
+        backend: Session backend in use
+
+    Returns:
+        Problems found
+    """
+    problems = []
+    tools = ["git"] + (["tmux"] if backend == "tmux" else [])
+    for tool in tools:
+        if not shutil.which(tool):
+            problems.append(f"{tool} not found in PATH")
+            continue
+        result = subprocess.run(
+            [tool, "-V" if tool == "tmux" else "--version"],
+            capture_output=True,
+            text=True,
+        )
+        click.echo(f"  ✓ {result.stdout.strip() or tool}")
+    return problems
+
+
+@click.command()
+def doctor() -> None:
+    """Check configuration, tools and agent worktrees for problems."""
+    config = ensure_project_config()
+    state = StateManager(config.repo_root)
+    worktree = WorktreeManager(config.repo_root, config.worktree_root)
+    problems: List[str] = []
+
+    click.echo("Configuration:")
+    errors = config.validate()
+    for error in errors:
+        click.echo(f"  ✗ {error}")
+    if not errors:
+        click.echo("  ✓ Valid")
+    problems += errors
+
+    click.echo("\nTools:")
+    for problem in check_tools(config.session_backend):
+        click.echo(f"  ✗ {problem}")
+        problems.append(problem)
+
+    click.echo("\nGit performance profile:")
+    if not config.git_performance:
+        click.echo("  - setup.git_performance is off for new worktrees")
+    agents = [
+        a for a in state.list_agents() if a.worktree and Path(a.worktree).exists()
+    ]
+    if not agents:
+        click.echo("  No agent worktrees")
+    for agent in agents:
+        status = worktree.git_performance_status(
+            Path(agent.worktree), config.git_fsmonitor
+        )
+        missing = [key for key, active in status.items() if not active]
+        if not missing:
+            click.echo(f"  ✓ {agent.branch}: active")
+        elif len(missing) == len(status):
+            click.echo(f"  - {agent.branch}: inactive")
+        else:
+            click.echo(f"  ✗ {agent.branch}: partial (missing {', '.join(missing)})")
+            problems.append(f"{agent.branch}: partial git performance profile")
+
+    if problems:
+        click.echo(f"\n{len(problems)} problem(s) found")
+        raise SystemExit(1)
+    click.echo("\nNo problems found")
@@ -0,0 +1,63 @@
+"""Events command to show agent lifecycle events."""
+
+import fnmatch
+from datetime import datetime
+from typing import Dict, Optional
+
+import click
+
+from ..events import Event, event_log_path, follow_events, read_events
+from ..state import StateManager
+from .base import ensure_project_config
+
+
+def format_event(event: Event, branches: Dict[str, str]) -> str:
+    """Format an event for display.
+
+    Args:
+        event: Event to format
+        branches: Mapping of session name to branch name
+
+    Returns:
+        Display line
+    """
+    when = datetime.fromtimestamp(event.time).strftime("%H:%M:%S")
+    return f"{when}  {branches.get(event.session, event.session):<30} {event.kind}"
+
+
+@click.command()
+@click.argument("pattern", required=False)
+@click.option("-n", "--lines", default=20, help="Number of past events to show")
+@click.option("--follow", "-f", is_flag=True, help="Keep printing new events")
+def events(pattern: Optional[str], lines: int, follow: bool) -> None:
+    """Show idle, active and closed events pushed by tmux.
+
+    PATTERN filters by branch name or glob (e.g., 'feature-*').
+    """
+    config = ensure_project_config()
+    state = StateManager(config.repo_root)
+    path = event_log_path(config.repo_root)
+    branches = {agent.session: agent.branch for agent in state.list_agents()}
+
+    def matches(event: Event) -> bool:
+        branch = branches.get(event.session, event.session)
+        return pattern is None or fnmatch.fnmatch(branch, pattern)
+
+    past = [e for e in read_events(path) if matches(e)]
+    for event in past[-lines:] if lines > 0 else []:
+        click.echo(format_event(event, branches))
+
+    if not follow:
+        if not past:
+            click.echo("No events recorded")
+        return
+
+    try:
+        for event in follow_events(path):
+            if event.session not in branches:
+                # Pick up agents created since we started
+                branches = {a.session: a.branch for a in state.list_agents()}
+            if matches(event):
+                click.echo(format_event(event, branches))
+    except KeyboardInterrupt:
+        pass
@@ -2,14 +2,15 @@
 
 import string
 from datetime import datetime
+from typing import Optional
 
 import click
 
+from ..launcher import launch_agent
 from ..state import Agent, StateManager
-from ..tmux import TmuxManager
 from ..utils import generate_batch_id, safe_branch_name
-from ..worktree import WorktreeManager
-from .base import ensure_project_config
+from ..worktree import WorktreeManager, WorktreeSetup
+from .base import ensure_project_config, get_session_manager, pin_base
 
 
 def generate_suffix(index: int) -> str:
@@ -27,7 +28,19 @@ def generate_suffix(index: int) -> str:
 @click.option("--prompt", "-p", required=True, help="Prompt to send to all agents")
 @click.option("--agent", "-a", help="AI agent to use (overrides config)")
 @click.option("--quick", is_flag=True, help="Skip setup commands")
-def fanout(count: int, prefix: str, prompt: str, agent: str, quick: bool) -> None:
+@click.option(
+    "--base",
+    "base_ref",
+    help="Branch new agents from this ref (remote refs are fetched first)",
+)
+def fanout(
+    count: int,
+    prefix: str,
+    prompt: str,
+    agent: str,
+    quick: bool,
+    base_ref: Optional[str],
+) -> None:
     """Create multiple agents with the same prompt.
 
     Args:
@@ -36,19 +49,28 @@ def fanout(count: int, prefix: str, prompt: str, agent: str, quick: bool) -> Non
         prompt: The prompt to send to all agents
         agent: AI agent to use
         quick: Skip setup commands
+        base_ref: Ref every agent in the batch branches from
     """
     if count < 1:
         click.echo("Count must be at least 1")
         raise SystemExit(1)
 
-    if count > 100:
-        click.echo("Count cannot exceed 100")
+    config = ensure_project_config()
+    if count > config.max_agents:
+        click.echo(
+            f"Count cannot exceed {config.max_agents} "
+            "(raise tmux.shards or tmux.sessions_per_shard)"
+        )
         raise SystemExit(1)
 
-    config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux = TmuxManager(config.tmux_prefix)
-    worktree = WorktreeManager(config.repo_root, config.worktree_root)
+    tmux = get_session_manager(config)
+    worktree = WorktreeManager(
+        config.repo_root,
+        config.worktree_root,
+        config.workspace_mode,
+        config.clone_filter,
+    )
 
     # Use default prefix if not provided
     if not prefix:
@@ -62,31 +84,28 @@ def fanout(count: int, prefix: str, prompt: str, agent: str, quick: bool) -> Non
 
     # Create agents
     created_agents = []
-    for i in range(count):
-        suffix = generate_suffix(i)
-        branch_name = f"{prefix}-{suffix}"
-
-        click.echo(f"\nCreating agent {i + 1}/{count}: {branch_name}")
-
-        # Setup worktree
-        worktree_path = worktree.setup_worktree(
-            branch=branch_name,
-            credential_files=config.credential_files,
-            setup_commands=config.setup_commands,
-            quick_setup=quick,
-        )
+    branches = [f"{prefix}-{generate_suffix(i)}" for i in range(count)]
+
+    base = pin_base(config, worktree, base_ref)
+
+    # Prepare all worktrees concurrently; setup dominates creation time
+    click.echo(f"\nPreparing {count} worktree(s)...")
+    worktree_paths = worktree.setup_worktrees(
+        branches, WorktreeSetup.from_config(config, quick), base=base
+    )
+
+    for i, (branch_name, worktree_path) in enumerate(zip(branches, worktree_paths)):
+        click.echo(f"\nStarting agent {i + 1}/{count}: {branch_name}")
 
         if not worktree_path:
             click.echo(f"Failed to create worktree for branch '{branch_name}'")
             continue
 
         # Create tmux session
-        session_name = f"{config.tmux_prefix}{branch_name}"
-        if tmux.create_session(branch_name, str(worktree_path)):
-            # Send initial command
-            cmd = f"{agent_name} {config.claude_flags} '{prompt}'"
-            tmux.send_command(branch_name, cmd)
-
+        session_name = tmux.session_name(branch_name)
+        if launch_agent(
+            tmux, config, branch_name, str(worktree_path), agent_name, prompt
+        ):
             # Create agent record
             agent_obj = Agent(
                 branch=branch_name,
@@ -97,12 +116,14 @@ def fanout(count: int, prefix: str, prompt: str, agent: str, quick: bool) -> Non
                 created_at=datetime.now().isoformat(),
                 pid=None,  # Will be updated later
                 prompt=prompt,
+                base=base,
             )
             state.add_agent(agent_obj)
             created_agents.append(branch_name)
             click.echo(f"✓ Started agent on branch '{branch_name}'")
         else:
-            click.echo(f"Failed to create session for branch '{branch_name}'")
+            click.echo(f"Failed to start agent for branch '{branch_name}'")
+            tmux.kill_session(branch_name)
             worktree.remove_worktree(worktree_path)
 
     # Summary
@@ -6,10 +6,41 @@ from typing import List
 
 import click
 
+from ..archive import archive_worktree, bundle_batch
+from ..events import event_log_path
+from ..maintenance import due_reason, record_kills, start_background
+from ..scrollback import remove_spill
 from ..state import Agent, StateManager
-from ..tmux import TmuxManager
 from ..worktree import WorktreeManager
-from .base import ensure_project_config
+from .base import ensure_project_config, get_session_manager
+
+
+def delete_archived_branches(worktree: WorktreeManager, agents: List[Agent]) -> None:
+    """Delete archived agents' branches in one git call.
+
+    Args:
+        worktree: Worktree manager
+        agents: Archived agents
+    """
+    success, current_branch, _ = worktree._run_git(["branch", "--show-current"])
+    current = current_branch.strip() if success else None
+    branches = [a.branch for a in agents if a.branch != current]
+    if len(branches) < len(agents):
+        click.echo(f"\n⚠️  Kept branch '{current}' (currently checked out)")
+
+    _, stdout, _ = worktree._run_git(
+        ["for-each-ref", "--format=%(refname:short)", "refs/heads/"]
+    )
+    existing = set(stdout.splitlines())
+    branches = [b for b in branches if b in existing]
+    if not branches:
+        return
+
+    success, _, stderr = worktree._run_git(["branch", "-D", *branches])
+    if success:
+        click.echo(f"\n✓ Deleted {len(branches)} archived branch(es)")
+    else:
+        click.echo(f"\n⚠️  Failed to delete archived branches: {stderr.strip()}")
 
 
 @click.command()
@@ -17,15 +48,37 @@ from .base import ensure_project_config
 @click.option("--batch", "-b", help="Kill all agents in a batch")
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation")
 @click.option("--delete-branch", "-d", is_flag=True, help="Also delete the git branch")
-def kill(pattern: str, batch: str, force: bool, delete_branch: bool) -> None:
+@click.option(
+    "--archive", is_flag=True, help="Archive each agent's work, then delete its branch"
+)
+@click.option(
+    "--archive-format",
+    type=click.Choice(["ref", "bundle"]),
+    default="ref",
+    show_default=True,
+    help="Keep archives as refs or bundle them per batch",
+)
+def kill(
+    pattern: str,
+    batch: str,
+    force: bool,
+    delete_branch: bool,
+    archive: bool,
+    archive_format: str,
+) -> None:
     """Kill agents matching the pattern.
 
     Pattern can be a branch name or a glob pattern (e.g., 'feature-*').
     If no pattern is provided and --batch is not specified, shows an error.
+
+    With --archive, each agent's worktree (uncommitted changes included)
+    is saved under refs/aifleet/archive/<batch>/<branch>, or into one
+    bundle per batch with --archive-format=bundle, and the branches are deleted
+    together. Use 'fleet revive' to bring an agent back.
     """
     config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux = TmuxManager(config.tmux_prefix)
+    tmux = get_session_manager(config)
     worktree = WorktreeManager(config.repo_root, config.worktree_root)
 
     # Get agents to kill
@@ -61,23 +114,53 @@ def kill(pattern: str, batch: str, force: bool, delete_branch: bool) -> None:
             click.echo("Aborted.")
             raise SystemExit(0)
 
+    def release_worktree(path: Path, force: bool) -> bool:
+        # Recycled worktrees keep their dependencies for the next agent
+        if config.worktree_on_kill == "recycle":
+            return worktree.park_worktree(
+                path, config.keep_paths, config.pool_size, force=force
+            )
+        return worktree.remove_worktree(path, force=force)
+
     # Kill each agent
     killed_count = 0
     failed_agents = []
+    kept_branches = []
+    archived_agents: List[Agent] = []
 
     for agent in agents_to_kill:
         click.echo(f"\nProcessing agent '{agent.branch}'...")
 
-        # First, try to remove the worktree (this is the most likely to fail)
+        # Stop the agent before touching its worktree, so nothing it writes
+        # lands in an archived, recycled or removed tree
+        if tmux.session_exists(agent.branch):
+            if tmux.kill_session(agent.branch):
+                click.echo("  ✓ Killed tmux session")
+            else:
+                click.echo("  ⚠️  Failed to kill tmux session")
+
+        # Save the agent's work before its worktree is reset or removed
+        if archive:
+            commit = archive_worktree(
+                worktree, Path(agent.worktree), agent.batch_id, agent.branch
+            )
+            if not commit:
+                click.echo("  ❌ Failed to archive, keeping this agent's worktree")
+                failed_agents.append(agent)
+                continue
+            click.echo(f"  ✓ Archived as {agent.batch_id}/{agent.branch}")
+
+        # Then release the worktree (this is the most likely to fail);
+        # an archived worktree's changes are already saved
         if agent.worktree and Path(agent.worktree).exists():
-            if not worktree.remove_worktree(Path(agent.worktree), force=False):
+            if not release_worktree(Path(agent.worktree), force=archive):
                 # Try to get more info about why it failed
                 click.echo(f"  ⚠️  Failed to remove worktree at {agent.worktree}")
                 click.echo("  This usually happens when there are uncommitted changes.")
 
                 prompt = "  Force remove worktree (will lose uncommitted changes)?"
                 if force or click.confirm(prompt):
-                    if not worktree.remove_worktree(Path(agent.worktree), force=True):
+                    if not release_worktree(Path(agent.worktree), force=True):
                         click.echo("  ❌ Failed to force remove worktree")
                         failed_agents.append(agent)
                         continue
@@ -86,16 +169,10 @@ def kill(pattern: str, batch: str, force: bool, delete_branch: bool) -> None:
                     failed_agents.append(agent)
                     continue
 
-        # Only proceed if worktree was successfully removed
-        # Kill tmux session
-        if tmux.session_exists(agent.branch):
-            if tmux.kill_session(agent.branch):
-                click.echo("  ✓ Killed tmux session")
-            else:
-                click.echo("  ⚠️  Failed to kill tmux session")
+        remove_spill(config.repo_root, agent.session)
 
-        # Delete branch if requested
-        if delete_branch:
+        # Delete branch if requested (archived branches are deleted together)
+        if delete_branch and not archive:
             # Check if we're not on this branch
             success, current_branch, _ = worktree._run_git(["branch", "--show-current"])
             if success and current_branch.strip() == agent.branch:
@@ -113,8 +190,24 @@ def kill(pattern: str, batch: str, force: bool, delete_branch: bool) -> None:
         # Remove from state
         state.remove_agent(agent.branch)
         killed_count += 1
+        if archive:
+            archived_agents.append(agent)
+        elif not delete_branch:
+            kept_branches.append(agent.branch)
         click.echo(f"  ✅ Agent '{agent.branch}' killed successfully")
 
+    # The last agent is gone: take the fleet's hooks off the tmux server
+    if killed_count and config.event_hooks and not state.list_agents():
+        tmux.remove_event_hooks(str(event_log_path(config.repo_root)))
+
+    if archived_agents:
+        delete_archived_branches(worktree, archived_agents)
+        if archive_format == "bundle":
+            for batch_id in sorted({a.batch_id for a in archived_agents}):
+                bundle = bundle_batch(worktree, batch_id)
+                if bundle:
+                    click.echo(f"✓ Bundled batch '{batch_id}' into {bundle}")
+
     # Summary
     click.echo(f"\n{'=' * 50}")
     click.echo(f"Killed {killed_count} agent(s) successfully.")
@@ -126,5 +219,16 @@ def kill(pattern: str, batch: str, force: bool, delete_branch: bool) -> None:
         click.echo("\nTo force kill these agents, run:")
         click.echo(f"  fleet kill --force {' '.join(a.branch for a in failed_agents)}")
 
-    if not delete_branch and killed_count > 0:
+    if not delete_branch and not archive and killed_count > 0:
         click.echo("\n💡 Tip: Use --delete-branch/-d to also delete the git branches")
+
+    if killed_count > 0 and config.maintenance_schedule == "auto":
+        schedule = record_kills(config.repo_root, killed_count, kept_branches)
+        reason = due_reason(
+            schedule, config.maintenance_interval, config.maintenance_after_kills
+        )
+        if reason:
+            start_background(config.repo_root)
+            click.echo(
+                f"\n🧹 Started repository maintenance in the background ({reason})"
+            )
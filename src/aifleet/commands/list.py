@@ -1,29 +1,163 @@
 """List command for AI Fleet."""
 
+import fnmatch
+import json
 import sys
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import click
 import psutil
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.text import Text
 
 from ..config import ConfigManager
-from ..state import StateManager
+from ..reconcile import Reconciler
+from ..state import Agent, StateManager
+from ..status import StatusTracker
 from ..tmux import TmuxManager
 from ..utils import format_duration
-from .base import ensure_project_config
+from .base import ensure_project_config, get_session_manager
+
+if TYPE_CHECKING:
+    from rich.console import Console, JustifyMethod
+    from rich.table import Table
+
+# Rich is only imported when a table is rendered, so machine-readable
+# output formats never pay for it.
+console: Optional["Console"] = None
+
+# Every field an agent record can carry, in output order
+RECORD_FIELDS = [
+    "branch",
+    "batch_id",
+    "agent",
+    "status",
+    "cpu",
+    "memory",
+    "uptime",
+    "created",
+    "session",
+    "pid",
+    "worktree",
+]
+
+# Columns shown by the table format unless --columns is given
+TABLE_COLUMNS = ["branch", "batch_id", "agent", "status", "cpu", "memory", "uptime"]
+
+# Short names accepted by --columns
+COLUMN_ALIASES = {"batch": "batch_id", "mem": "memory"}
+
+# Fields that need a tmux or psutil probe per agent
+STATUS_FIELDS = {"status"}
+STATS_FIELDS = {"cpu", "memory"}
+
+STATUSES = ["ready", "running", "idle", "dead", "unknown"]
+
+
+@dataclass
+class ListQuery:
+    """Which agents to list and which columns to compute for them."""
+
+    columns: List[str] = field(default_factory=lambda: [*TABLE_COLUMNS])
+    pattern: Optional[str] = None
+    batch: Optional[str] = None
+    agent: Optional[str] = None
+    statuses: Tuple[str, ...] = ()
+
+    @property
+    def needs_status(self) -> bool:
+        """Whether pane content has to be captured."""
+        return bool(self.statuses) or any(c in STATUS_FIELDS for c in self.columns)
+
+    @property
+    def needs_stats(self) -> bool:
+        """Whether CPU and memory have to be sampled."""
+        return any(c in STATS_FIELDS for c in self.columns)
+
+    def selects(self, agent: Agent) -> bool:
+        """Apply the filters that need no probing."""
+        if self.batch and agent.batch_id != self.batch:
+            return False
+        if self.agent and agent.agent != self.agent:
+            return False
+        if self.pattern and not fnmatch.fnmatch(agent.branch, self.pattern):
+            return False
+        return True
+
+
+def parse_columns(value: Optional[str], default: List[str]) -> List[str]:
+    """Parse a comma-separated --columns value.
+
+    Raises:
+        click.BadParameter: If a column is unknown
+    """
+    if not value:
+        return [*default]
+
+    columns = []
+    for name in value.split(","):
+        name = COLUMN_ALIASES.get(name.strip().lower(), name.strip().lower())
+        if name not in RECORD_FIELDS:
+            raise click.BadParameter(
+                f"Unknown column '{name}'. Choose from: {', '.join(RECORD_FIELDS)}"
+            )
+        columns.append(name)
+    return columns
+
 
-console = Console()
+def get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    global console
+    if console is None:
+        from rich.console import Console
 
+        console = Console()
+    return console
 
-def get_process_stats(pid: Optional[int]) -> Tuple[float, float]:
+
+def prime_process_stats(pids: Iterable[Optional[int]]) -> Dict[int, psutil.Process]:
+    """Start CPU sampling for several processes at once.
+
+    Returns:
+        Primed process handles by pid, to pass to ``get_process_stats``
+    """
+    primed: Dict[int, psutil.Process] = {}
+    for pid in pids:
+        if not pid or pid in primed:
+            continue
+        try:
+            process = psutil.Process(pid)
+            process.cpu_percent(interval=None)
+            primed[pid] = process
+        except Exception:
+            continue
+    return primed
+
+
+def get_process_stats(
+    pid: Optional[int],
+    primed: Optional[Dict[int, psutil.Process]] = None,
+) -> Tuple[float, float]:
     """Get CPU and memory usage for a process.
 
+    Args:
+        pid: Process ID
+        primed: Handles from ``prime_process_stats``; CPU usage of a primed
+            process is measured since it was primed instead of sampling
+            for 100 ms
+
     Returns:
         (cpu_percent, memory_mb)
     """
@@ -31,65 +165,180 @@ def get_process_stats(pid: Optional[int]) -> Tuple[float, float]:
         return 0.0, 0.0
 
     try:
-        process = psutil.Process(pid)
-        cpu = process.cpu_percent(interval=0.1)
+        if primed is not None and pid in primed:
+            process = primed[pid]
+            cpu = process.cpu_percent(interval=None)
+        else:
+            process = psutil.Process(pid)
+            cpu = process.cpu_percent(interval=0.1)
         memory = process.memory_info().rss / 1024 / 1024  # MB
         return cpu, memory
     except Exception:
         return 0.0, 0.0
 
 
-def create_agents_table(
+def load_agents(
     config: ConfigManager,
     state: StateManager,
     tmux_mgr: TmuxManager,
-    grouped: bool,
     all: bool,
-) -> Table:
-    """Create a Rich table with agent data."""
+    query: Optional[ListQuery] = None,
+) -> Tuple[List[Agent], Dict[str, Optional[int]], List[str]]:
+    """Load agents from one tmux snapshot and one state read.
 
-    # Get active tmux sessions
-    active_sessions = [name for name, _ in tmux_mgr.list_sessions()]
+    Filters that need no probing are applied here, before anything else
+    touches the agents.
 
-    # Reconcile state with tmux
-    if not all:
-        removed = state.reconcile_with_tmux(active_sessions)
-        if removed:
-            msg = f"[dim]Cleaned up {len(removed)} dead agents from state[/dim]"
-            console.print(msg)
+    Returns:
+        (agents, sessions, removed) where sessions maps live session names
+        to pane pids and removed lists dead branches dropped from state
+    """
+    reconciler = Reconciler(config, state, tmux_mgr)
+    snapshot = reconciler.snapshot(include_worktrees=False)
+    report = reconciler.report(snapshot)
+
+    # Drop agents whose session is gone
+    removed: List[str] = []
+    if not all and report.dead:
+        removed = state.remove_agents(a.branch for a in report.dead)
+
+    dropped = set(removed)
+    agents = [
+        a
+        for a in snapshot.agents
+        if a.branch not in dropped and (query is None or query.selects(a))
+    ]
+    return agents, snapshot.sessions, removed
 
-    # Get all agents
-    agents = state.list_agents()
 
-    if not agents:
-        table = Table(title="No active agents", show_header=False)
-        return table
+def iter_agent_records(
+    agents: List[Agent],
+    sessions: Dict[str, Optional[int]],
+    tmux_mgr: TmuxManager,
+    query: Optional[ListQuery] = None,
+    tracker: Optional[StatusTracker] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one record per agent as soon as its status and stats are known.
+
+    Status and process stats are only probed when a requested column or
+    the status filter needs them. Pass the same ``tracker`` on every
+    refresh to skip capturing panes whose activity has not changed.
+    """
+    if query is None:
+        query = ListQuery(columns=[*RECORD_FIELDS])
+    if tracker is None:
+        tracker = StatusTracker(tmux_mgr)
+
+    pids = {a.branch: a.pid or sessions.get(a.session) for a in agents}
+
+    # Sample CPU for the whole fleet over one shared interval
+    primed: Dict[int, psutil.Process] = {}
+    if query.needs_stats:
+        primed = prime_process_stats(pids.values())
+        if primed:
+            time.sleep(0.1)
+
+    if query.needs_status:
+        # Captures for all agents overlap instead of running one by one
+        tracker.prefetch(
+            [(a.branch, a.session) for a in agents if a.session in sessions]
+        )
 
-    # Collect agent data
-    agent_data: List[Dict[str, Union[str, float]]] = []
     for agent in agents:
-        # Get agent status using new detection method
-        status = tmux_mgr.get_agent_status(agent.branch)
+        record: Dict[str, Any] = {
+            "branch": agent.branch,
+            "batch_id": agent.batch_id,
+            "agent": agent.agent,
+            "created": agent.created_at,
+            "session": agent.session,
+            "pid": pids[agent.branch],
+            "worktree": agent.worktree,
+        }
 
-        # Get process stats
-        cpu, memory = get_process_stats(agent.pid)
+        if query.needs_status:
+            # Sessions missing from the snapshot are dead; no need to probe them
+            alive = agent.session in sessions
+            status = tracker.status(
+                agent.branch, agent.session, alive, pid=sessions.get(agent.session)
+            )
+            if query.statuses and status not in query.statuses:
+                continue
+            record["status"] = status
+
+        if query.needs_stats:
+            cpu, memory = get_process_stats(pids[agent.branch], primed)
+            record["cpu"] = cpu
+            record["memory"] = memory
 
         # Calculate uptime
         created = datetime.fromisoformat(agent.created_at)
-        uptime = datetime.now() - created
-
-        agent_data.append(
-            {
-                "branch": agent.branch,
-                "batch_id": agent.batch_id,
-                "agent": agent.agent,
-                "status": status,
-                "cpu": cpu,
-                "memory": memory,
-                "uptime": format_duration(uptime.total_seconds()),
-                "created": created.strftime("%Y-%m-%d %H:%M"),
-            }
-        )
+        record["uptime"] = (datetime.now() - created).total_seconds()
+
+        yield record
+
+
+STATUS_COLORS = {
+    "ready": "green",
+    "running": "yellow",
+    "idle": "blue",
+    "dead": "red",
+    "unknown": "white",
+}
+
+
+class ColumnSpec(NamedTuple):
+    """How a column is rendered in the table."""
+
+    header: str
+    style: Optional[str]
+    justify: "JustifyMethod"
+    format: Callable[[Any], str]
+
+
+# Table header, style, justification and cell formatter for each column
+TABLE_COLUMN_SPECS: Dict[str, ColumnSpec] = {
+    "branch": ColumnSpec("BRANCH", "cyan", "left", lambda v: str(v)[:25]),
+    "batch_id": ColumnSpec("BATCH", "magenta", "left", lambda v: str(v)[:15]),
+    "agent": ColumnSpec("AGENT", "white", "left", str),
+    "status": ColumnSpec("STATUS", None, "center", str),
+    "cpu": ColumnSpec("CPU%", "yellow", "right", lambda v: f"{float(v):.1f}"),
+    "memory": ColumnSpec("MEM(MB)", "green", "right", lambda v: f"{float(v):.0f}"),
+    "uptime": ColumnSpec("UPTIME", "dim", "left", lambda v: format_duration(float(v))),
+    "created": ColumnSpec(
+        "CREATED", "dim", "left", lambda v: str(v)[:16].replace("T", " ")
+    ),
+    "session": ColumnSpec("SESSION", "white", "left", str),
+    "pid": ColumnSpec("PID", "dim", "right", lambda v: "" if v is None else str(v)),
+    "worktree": ColumnSpec("WORKTREE", "dim", "left", str),
+}
+
+
+def create_agents_table(
+    config: ConfigManager,
+    state: StateManager,
+    tmux_mgr: TmuxManager,
+    grouped: bool,
+    all: bool,
+    query: Optional[ListQuery] = None,
+) -> "Table":
+    """Create a Rich table with agent data."""
+    from rich.table import Table
+    from rich.text import Text
+
+    if query is None:
+        query = ListQuery()
+
+    agents, sessions, removed = load_agents(config, state, tmux_mgr, all, query)
+    if removed:
+        msg = f"[dim]Cleaned up {len(removed)} dead agents from state[/dim]"
+        get_console().print(msg)
+
+    # Collect agent data
+    agent_data = [*iter_agent_records(agents, sessions, tmux_mgr, query)]
+
+    if not agent_data:
+        table = Table(title="No active agents", show_header=False)
+        return table
 
     # Sort by batch_id if grouped, otherwise by created time
     if grouped:
@@ -105,13 +354,14 @@ def create_agents_table(
     )
 
     # Add columns
-    table.add_column("BRANCH", style="cyan", overflow="fold")
-    table.add_column("BATCH", style="magenta")
-    table.add_column("AGENT", style="white")
-    table.add_column("STATUS", justify="center")
-    table.add_column("CPU%", justify="right", style="yellow")
-    table.add_column("MEM(MB)", justify="right", style="green")
-    table.add_column("UPTIME", style="dim")
+    for column in query.columns:
+        spec = TABLE_COLUMN_SPECS[column]
+        table.add_column(
+            spec.header,
+            style=spec.style or "",
+            justify=spec.justify,
+            overflow="fold" if column == "branch" else "ellipsis",
+        )
 
     # Add rows
     current_batch = None
@@ -122,59 +372,80 @@ def create_agents_table(
                 table.add_section()
             current_batch = data["batch_id"]
 
-        # Format status with color
-        status_colors = {
-            "ready": "green",
-            "running": "yellow",
-            "idle": "blue",
-            "dead": "red",
-            "unknown": "white",
-        }
-        status_color = status_colors.get(str(data["status"]), "white")
-        status_text = Text(str(data["status"]), style=status_color)
-
-        table.add_row(
-            str(data["branch"])[:25],
-            str(data["batch_id"])[:15],
-            str(data["agent"]),
-            status_text,
-            f"{float(data['cpu']):.1f}",
-            f"{float(data['memory']):.0f}",
-            str(data["uptime"]),
-        )
+        cells: List[Any] = []
+        for column in query.columns:
+            if column == "status":
+                # Format status with color
+                status = str(data["status"])
+                cells.append(Text(status, style=STATUS_COLORS.get(status, "white")))
+            else:
+                cells.append(TABLE_COLUMN_SPECS[column].format(data[column]))
+        table.add_row(*cells)
+
+    # Add summary as a footer
+    table.caption_justify = "left"
+    summary_lines = summarize_records(agent_data, grouped)
+    if query.needs_stats:
+        summary_lines += tmux_memory_lines(tmux_mgr)
+    table.caption = "\n".join(summary_lines)
+
+    return table
+
+
+def tmux_memory_lines(tmux_mgr: TmuxManager) -> List[str]:
+    """Describe the memory held by the tmux servers, scrollback included.
+
+    Uses the server PIDs recorded by the last ``list_sessions`` snapshot.
+    """
+    total = 0
+    servers = 0
+    for pid in tmux_mgr.server_pids():
+        try:
+            total += psutil.Process(pid).memory_info().rss
+            servers += 1
+        except Exception:
+            continue
+    if not servers:
+        return []
+    return [f"tmux: {servers} server(s), {total / 1024 / 1024:.0f} MB RAM"]
+
+
+def summarize_records(agent_data: List[Dict[str, Any]], grouped: bool) -> List[str]:
+    """Build the summary lines shown below the agents table.
+
+    Status and resource lines are only included when those fields were
+    probed.
+    """
+    summary_lines = []
 
-    # Add summary panel
     status_counts: Dict[str, int] = {}
     for d in agent_data:
-        status = str(d["status"])
-        status_counts[status] = status_counts.get(status, 0) + 1
+        if "status" in d:
+            status = str(d["status"])
+            status_counts[status] = status_counts.get(status, 0) + 1
 
-    active_count = sum(
-        count for status, count in status_counts.items() if status != "dead"
-    )
-    total_cpu = sum(float(d["cpu"]) for d in agent_data)
-    total_memory = sum(float(d["memory"]) for d in agent_data)
+    if status_counts:
+        active_count = sum(
+            count for status, count in status_counts.items() if status != "dead"
+        )
+        summary_lines.append(f"Total: {len(agent_data)} agents ({active_count} active)")
+    else:
+        summary_lines.append(f"Total: {len(agent_data)} agents")
 
-    # Create summary text
-    summary_lines = [
-        f"Total: {len(agent_data)} agents ({active_count} active)",
-        f"Resources: {total_cpu:.1f}% CPU, {total_memory:.0f} MB RAM",
-    ]
+    if agent_data and "cpu" in agent_data[0]:
+        total_cpu = sum(float(d["cpu"]) for d in agent_data)
+        total_memory = sum(float(d["memory"]) for d in agent_data)
+        summary_lines.append(
+            f"Resources: {total_cpu:.1f}% CPU, {total_memory:.0f} MB RAM"
+        )
 
     # Add status breakdown
     if status_counts:
         status_parts = []
-        for status in ["ready", "running", "idle", "dead", "unknown"]:
+        for status in STATUSES:
             if status in status_counts:
                 count = status_counts[status]
-                status_colors = {
-                    "ready": "green",
-                    "running": "yellow",
-                    "idle": "blue",
-                    "dead": "red",
-                    "unknown": "white",
-                }
-                color = status_colors.get(status, "white")
+                color = STATUS_COLORS.get(status, "white")
                 status_parts.append(f"[{color}]{status}: {count}[/{color}]")
         summary_lines.append("Status: " + ", ".join(status_parts))
 
@@ -186,43 +457,179 @@ def create_agents_table(
         batches_summary = ", ".join(f"{b}: {c}" for b, c in batch_counts.items())
         summary_lines.append(f"Batches: {len(batch_counts)} ({batches_summary})")
 
-    # Add summary as a footer
-    table.caption_justify = "left"
-    table.caption = "\n".join(summary_lines)
+    return summary_lines
 
-    return table
+
+def watch_agents(
+    config: ConfigManager,
+    state: StateManager,
+    tmux_mgr: TmuxManager,
+    grouped: bool,
+    all: bool,
+    query: ListQuery,
+) -> None:
+    """Refresh a scrollable agent view every second until the user quits.
+
+    Agents are probed once per second; key presses only re-render the
+    visible window from the last probe.
+    """
+    from rich.live import Live
+
+    from .viewport import KeyReader, Viewport
+
+    console = get_console()
+    viewport = Viewport(query.columns, grouped)
+    tracker = StatusTracker(tmux_mgr, config.idle_after)
+
+    def probe() -> List[Dict[str, Any]]:
+        agents, sessions, _ = load_agents(config, state, tmux_mgr, all, query)
+        return [*iter_agent_records(agents, sessions, tmux_mgr, query, tracker)]
+
+    try:
+        with KeyReader() as keys:
+            with Live(console=console, screen=True, auto_refresh=False) as live:
+                records = probe()
+                next_refresh = time.monotonic() + 1
+                while True:
+                    height = console.size.height
+                    notes = tracker.summary() + tmux_memory_lines(tmux_mgr)
+                    view = viewport.render(records, height, notes)
+                    live.update(view, refresh=True)
+
+                    key = keys.read(next_refresh - time.monotonic())
+                    if key is None:
+                        records = probe()
+                        next_refresh = time.monotonic() + 1
+                    elif key in ("q", "Q"):
+                        break
+                    else:
+                        viewport.handle_key(key)
+    except KeyboardInterrupt:
+        pass
+
+    console.print("[dim]Exiting watch mode[/dim]")
+
+
+def _tsv_value(value: Any) -> str:
+    """Format a record value as a single TSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+
+def emit_agent_records(
+    config: ConfigManager,
+    state: StateManager,
+    tmux_mgr: TmuxManager,
+    all: bool,
+    output_format: str,
+    query: Optional[ListQuery] = None,
+) -> None:
+    """Write agent records to stdout in a machine-readable format.
+
+    ndjson and tsv stream one line per agent as soon as it has been probed;
+    json has to wait for the whole fleet to emit a single array.
+    """
+    if query is None:
+        query = ListQuery(columns=[*RECORD_FIELDS])
+
+    agents, sessions, removed = load_agents(config, state, tmux_mgr, all, query)
+    if removed:
+        click.echo(f"Cleaned up {len(removed)} dead agents from state", err=True)
+
+    fields = query.columns
+    records = (
+        {f: record[f] for f in fields}
+        for record in iter_agent_records(agents, sessions, tmux_mgr, query)
+    )
+    out = sys.stdout
+
+    if output_format == "json":
+        json.dump([*records], out, indent=2)
+        out.write("\n")
+    elif output_format == "ndjson":
+        for record in records:
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    else:
+        out.write("\t".join(fields) + "\n")
+        for record in records:
+            out.write("\t".join(_tsv_value(record[f]) for f in fields) + "\n")
+            out.flush()
 
 
 @click.command()
+@click.argument("pattern", required=False)
 @click.option("--grouped", "-g", is_flag=True, help="Group by batch ID")
 @click.option(
     "--all", "-a", is_flag=True, help="Show all agents (including dead sessions)"
 )
 @click.option("--watch", "-w", is_flag=True, help="Watch mode - refresh every second")
-def list(grouped: bool, all: bool, watch: bool):
-    """List all active AI agents."""
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json", "ndjson", "tsv"]),
+    default="table",
+    show_default=True,
+    help="Output format (json/ndjson/tsv skip table rendering)",
+)
+@click.option(
+    "--columns",
+    "-c",
+    help=f"Comma-separated columns to show ({', '.join(RECORD_FIELDS)})",
+)
+@click.option("--batch", "-b", help="Only show agents in this batch")
+@click.option("--agent", help="Only show agents running this agent command")
+@click.option(
+    "--status",
+    "-s",
+    "statuses",
+    multiple=True,
+    type=click.Choice(STATUSES),
+    help="Only show agents with this status (repeatable)",
+)
+def list(
+    pattern: Optional[str],
+    grouped: bool,
+    all: bool,
+    watch: bool,
+    output_format: str,
+    columns: Optional[str],
+    batch: Optional[str],
+    agent: Optional[str],
+    statuses: Tuple[str, ...],
+):
+    """List all active AI agents.
+
+    PATTERN is an optional branch glob (e.g. 'feature-*'). Filters on
+    branch, batch and agent are applied before any agent is probed, and
+    status, CPU and memory are only probed when a column or filter needs them.
+    """
+    if watch and output_format != "table":
+        raise click.UsageError("--watch only supports the table format")
+
+    default_columns = TABLE_COLUMNS if output_format == "table" else RECORD_FIELDS
+    query = ListQuery(
+        columns=parse_columns(columns, default_columns),
+        pattern=pattern,
+        batch=batch,
+        agent=agent,
+        statuses=statuses,
+    )
+
     config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux_mgr = TmuxManager(config.tmux_prefix)
+    tmux_mgr = get_session_manager(config)
+
+    if output_format != "table":
+        emit_agent_records(config, state, tmux_mgr, all, output_format, query)
+        return
 
     if watch:
-        # Run in watch mode with Live display
-        console.print("[dim]Press Ctrl+C to exit watch mode[/dim]")
-        try:
-            with Live(
-                create_agents_table(config, state, tmux_mgr, grouped, all),
-                refresh_per_second=1,
-                screen=True,
-                console=console,
-            ) as live:
-                while True:
-                    time.sleep(1)
-                    table = create_agents_table(config, state, tmux_mgr, grouped, all)
-                    live.update(table)
-        except KeyboardInterrupt:
-            console.print("\n[dim]Exiting watch mode[/dim]")
-            sys.exit(0)
+        watch_agents(config, state, tmux_mgr, grouped, all, query)
     else:
         # Display once
-        table = create_agents_table(config, state, tmux_mgr, grouped, all)
-        console.print(table)
+        table = create_agents_table(config, state, tmux_mgr, grouped, all, query)
+        get_console().print(table)
@@ -1,10 +1,12 @@
 """Logs command to view agent output."""
 
+from typing import Optional
+
 import click
 
+from ..scrollback import spill_dir, spilled_lines, stitch_output
 from ..state import StateManager
-from ..tmux import TmuxManager
-from .base import ensure_project_config
+from .base import ensure_project_config, get_session_manager
 
 
 @click.command()
@@ -19,7 +21,7 @@ def logs(branch: str, lines: int) -> None:
     """
     config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux = TmuxManager(config.tmux_prefix)
+    tmux = get_session_manager(config)
 
     # Get the agent
     agent = state.get_agent(branch)
@@ -34,9 +36,20 @@ def logs(branch: str, lines: int) -> None:
         state.remove_agent(branch)
         raise SystemExit(1)
 
-    # Get session output
-    output = tmux.get_session_output(branch, lines)
+    # The spill goes back further than tmux's scrollback, which holds the
+    # latest screen; where the two overlap, each line is shown once
+    spilled = spilled_lines(
+        spill_dir(config.repo_root, agent.session),
+        lines,
+        lambda: tmux.pane_size(branch),
+    )
+    live: Optional[str] = tmux.get_session_output(branch, lines)
+    live_lines = live.rstrip("\n").splitlines() if live else []
+    while live_lines and not live_lines[-1].strip():
+        live_lines.pop()
+
+    output = stitch_output(spilled, live_lines)[-lines:]
     if output:
-        click.echo(output)
+        click.echo("\n".join(output))
     else:
         click.echo(f"No output available from session '{agent.session}'")
@@ -0,0 +1,95 @@
+"""Maintenance command to keep a fleet-heavy repository fast."""
+
+from datetime import datetime
+from typing import Dict
+
+import click
+
+from ..maintenance import (
+    MaintenanceRun,
+    due_reason,
+    load_schedule,
+    maintain,
+    read_history,
+)
+from ..worktree import WorktreeManager
+from .base import ensure_project_config
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Counts shown before → after, in display order
+STAT_LABELS = {
+    "refs": "refs",
+    "loose_refs": "loose refs",
+    "loose_objects": "loose objects",
+    "packs": "packs",
+    "pack_kib": "pack KiB",
+    "worktree_admin": "worktree admin dirs",
+}
+
+
+def format_counts(before: Dict[str, int], after: Dict[str, int]) -> str:
+    """Format before/after counts as ``name: before → after`` pairs."""
+    return ", ".join(
+        f"{label}: {before[key]} → {after[key]}"
+        for key, label in STAT_LABELS.items()
+        if key in before and key in after
+    )
+
+
+def show_run(run: MaintenanceRun) -> None:
+    """Print one run's steps and counts."""
+    started = datetime.fromtimestamp(run.started).strftime(TIME_FORMAT)
+    mark = "✓" if run.ok else "✗"
+    click.echo(f"{mark} {started} ({run.trigger}) in {run.seconds:.1f}s")
+    for step in run.steps:
+        status = "ok" if step.ok else f"failed: {step.error}"
+        click.echo(f"    {step.name:<15} {step.seconds:>7.2f}s  {status}")
+    click.echo(f"    {format_counts(run.before, run.after)}")
+
+
+@click.command()
+@click.option(
+    "--if-due", is_flag=True, help="Only run if the schedule says so (for cron)"
+)
+@click.option("--status", "show_status", is_flag=True, help="Show schedule and runs")
+@click.option("--lines", "-n", default=5, help="Past runs shown with --status")
+def maintenance(if_due: bool, show_status: bool, lines: int) -> None:
+    """Prune, pack and repack the repository after heavy fleet use.
+
+    Runs git worktree prune, expires the reflogs of killed agents'
+    branches, packs refs, repacks incrementally and writes a commit-graph.
+    """
+    config = ensure_project_config()
+    schedule = load_schedule(config.repo_root)
+    reason = due_reason(
+        schedule, config.maintenance_interval, config.maintenance_after_kills
+    )
+
+    if show_status:
+        last = schedule["last_run"]
+        when = datetime.fromtimestamp(last).strftime(TIME_FORMAT) if last else "never"
+        click.echo(f"Last run: {when}")
+        click.echo(f"Kills since: {schedule['kills']}")
+        click.echo(f"Due: {reason or 'no'} (schedule: {config.maintenance_schedule})")
+        runs = read_history(config.repo_root, lines)
+        if runs:
+            click.echo("\nRecent runs:")
+        for past in runs:
+            show_run(past)
+        return
+
+    if if_due and not reason:
+        click.echo("Maintenance is not due")
+        return
+
+    worktree = WorktreeManager(config.repo_root, config.worktree_root)
+    click.echo("Running repository maintenance...")
+    run = maintain(config.repo_root, worktree, trigger=reason or "manual")
+    if run is None:
+        click.echo("Maintenance is already running")
+        raise SystemExit(1)
+
+    show_run(run)
+    if not run.ok:
+        raise SystemExit(1)
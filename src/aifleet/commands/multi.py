@@ -1,21 +1,27 @@
 """Multi command to create agents with different prompts."""
 
 from datetime import datetime
+from typing import Optional
 
 import click
 
+from ..launcher import launch_agent
 from ..state import Agent, StateManager
-from ..tmux import TmuxManager
 from ..utils import generate_batch_id, parse_branch_prompt_pairs
-from ..worktree import WorktreeManager
-from .base import ensure_project_config
+from ..worktree import WorktreeManager, WorktreeSetup
+from .base import ensure_project_config, get_session_manager, pin_base
 
 
 @click.command()
 @click.argument("pairs", nargs=-1, required=True)
 @click.option("--agent", "-a", help="AI agent to use (overrides config)")
 @click.option("--quick", is_flag=True, help="Skip setup commands")
-def multi(pairs: tuple, agent: str, quick: bool) -> None:
+@click.option(
+    "--base",
+    "base_ref",
+    help="Branch new agents from this ref (remote refs are fetched first)",
+)
+def multi(pairs: tuple, agent: str, quick: bool, base_ref: Optional[str]) -> None:
     """Create multiple agents with different prompts.
 
     Usage: fleet multi branch1:"prompt 1" branch2:"prompt 2" ...
@@ -24,6 +30,7 @@ def multi(pairs: tuple, agent: str, quick: bool) -> None:
         pairs: Branch:prompt pairs
         agent: AI agent to use
         quick: Skip setup commands
+        base_ref: Ref every agent in the batch branches from
     """
     if not pairs:
         click.echo("No branch:prompt pairs provided")
@@ -31,8 +38,13 @@ def multi(pairs: tuple, agent: str, quick: bool) -> None:
 
     config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux = TmuxManager(config.tmux_prefix)
-    worktree = WorktreeManager(config.repo_root, config.worktree_root)
+    tmux = get_session_manager(config)
+    worktree = WorktreeManager(
+        config.repo_root,
+        config.worktree_root,
+        config.workspace_mode,
+        config.clone_filter,
+    )
 
     # Parse branch:prompt pairs
     try:
@@ -47,35 +59,38 @@ def multi(pairs: tuple, agent: str, quick: bool) -> None:
 
     # Create agents
     created_agents = []
-    total = len(branch_prompts)
-
-    for i, (branch_name, prompt) in enumerate(branch_prompts):
-        click.echo(f"\nCreating agent {i + 1}/{total}: {branch_name}")
-
+    pending = []
+    for branch_name, prompt in branch_prompts:
         # Check if agent already exists
         if state.get_agent(branch_name):
             click.echo(f"Agent already exists on branch '{branch_name}', skipping")
             continue
+        pending.append((branch_name, prompt))
+
+    base = pin_base(config, worktree, base_ref)
 
-        # Setup worktree
-        worktree_path = worktree.setup_worktree(
-            branch=branch_name,
-            credential_files=config.credential_files,
-            setup_commands=config.setup_commands,
-            quick_setup=quick,
-        )
+    # Prepare all worktrees concurrently; setup dominates creation time
+    click.echo(f"\nPreparing {len(pending)} worktree(s)...")
+    worktree_paths = worktree.setup_worktrees(
+        [branch_name for branch_name, _ in pending],
+        WorktreeSetup.from_config(config, quick),
+        base=base,
+    )
+
+    for i, ((branch_name, prompt), worktree_path) in enumerate(
+        zip(pending, worktree_paths)
+    ):
+        click.echo(f"\nStarting agent {i + 1}/{len(pending)}: {branch_name}")
 
         if not worktree_path:
             click.echo(f"Failed to create worktree for branch '{branch_name}'")
             continue
 
         # Create tmux session
-        session_name = f"{config.tmux_prefix}{branch_name}"
-        if tmux.create_session(branch_name, str(worktree_path)):
-            # Send initial command
-            cmd = f"{agent_name} {config.claude_flags} '{prompt}'"
-            tmux.send_command(branch_name, cmd)
-
+        session_name = tmux.session_name(branch_name)
+        if launch_agent(
+            tmux, config, branch_name, str(worktree_path), agent_name, prompt
+        ):
             # Create agent record
             agent_obj = Agent(
                 branch=branch_name,
@@ -86,6 +101,7 @@ def multi(pairs: tuple, agent: str, quick: bool) -> None:
                 created_at=datetime.now().isoformat(),
                 pid=None,  # Will be updated later
                 prompt=prompt,
+                base=base,
             )
             state.add_agent(agent_obj)
             created_agents.append(branch_name)
@@ -94,7 +110,8 @@ def multi(pairs: tuple, agent: str, quick: bool) -> None:
                 f"{prompt[:50]}..."
             )
         else:
-            click.echo(f"Failed to create session for branch '{branch_name}'")
+            click.echo(f"Failed to start agent for branch '{branch_name}'")
+            tmux.kill_session(branch_name)
             worktree.remove_worktree(worktree_path)
 
     # Summary
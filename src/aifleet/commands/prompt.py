@@ -1,25 +1,185 @@
 """Prompt command to send messages to running agents."""
 
+import fnmatch
+import json
+import sys
+from typing import IO, Dict, Optional
+
 import click
 
 from ..state import StateManager
 from ..tmux import TmuxManager
-from .base import ensure_project_config
+from .base import ensure_project_config, get_session_manager
+
+
+def read_message(message: Optional[str], file: Optional[IO[str]]) -> str:
+    """Resolve the prompt text from the argument, a file or stdin.
+
+    Args:
+        message: Message argument; '-' reads stdin
+        file: Opened --file handle
+
+    Returns:
+        Prompt text
+    """
+    if file is not None:
+        if message is not None:
+            raise click.UsageError("Give either MESSAGE or --file, not both")
+        return file.read()
+
+    if message is None or message == "-":
+        if message is None and sys.stdin.isatty():
+            raise click.UsageError("Missing MESSAGE (or use --file / pipe stdin)")
+        return sys.stdin.read()
+
+    return message
+
+
+def read_prompt_map(file: IO[str]) -> Dict[str, str]:
+    """Parse a per-branch prompt map.
+
+    Accepts a JSON object of ``{"branch": "prompt"}`` or ``branch:prompt``
+    lines, the same form ``fleet multi`` takes. Blank lines and lines
+    starting with '#' are ignored.
+
+    Args:
+        file: Opened map file
+
+    Returns:
+        Mapping of branch name to prompt
+    """
+    content = file.read()
+    if content.lstrip().startswith("{"):
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise click.BadParameter(f"Invalid JSON: {e}", param_hint="--map") from None
+        return {str(branch): str(text) for branch, text in data.items()}
+
+    prompts: Dict[str, str] = {}
+    for number, line in enumerate(content.splitlines(), start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        branch, sep, text = line.partition(":")
+        if not sep or not branch.strip() or not text.strip():
+            raise click.BadParameter(
+                f"Line {number}: expected 'branch:prompt'", param_hint="--map"
+            )
+        prompts[branch.strip()] = text.strip()
+    return prompts
+
+
+def broadcast(state: StateManager, tmux: TmuxManager, prompts: Dict[str, str]) -> None:
+    """Deliver prompts to several agents and print a per-agent report.
+
+    Args:
+        state: State manager
+        tmux: Tmux manager
+        prompts: Mapping of branch name to prompt text
+    """
+    agents = {agent.branch: agent for agent in state.list_agents()}
+    live = {name for name, _ in tmux.list_sessions()}
+
+    deliverable: Dict[str, str] = {}
+    problems: Dict[str, str] = {}
+    for branch, text in prompts.items():
+        agent = agents.get(branch)
+        if agent is None:
+            problems[branch] = "no agent"
+        elif agent.session not in live:
+            problems[branch] = "no session"
+        else:
+            deliverable[branch] = text
+
+    results = tmux.send_prompts(deliverable)
+
+    for branch in prompts:
+        if results.get(branch):
+            click.echo(f"  ✓ {branch}")
+        else:
+            click.echo(f"  ✗ {branch} ({problems.get(branch, 'delivery failed')})")
+
+    sent = sum(1 for ok in results.values() if ok)
+    click.echo(f"Sent prompt to {sent}/{len(prompts)} agent(s)")
+    if sent < len(prompts):
+        raise SystemExit(1)
 
 
 @click.command()
-@click.argument("branch")
-@click.argument("message")
-def prompt(branch: str, message: str) -> None:
-    """Send an additional prompt to a running agent.
+@click.argument("branch", required=False)
+@click.argument("message", required=False)
+@click.option(
+    "--file",
+    type=click.File("r"),
+    help="Read the prompt from a file ('-' for stdin)",
+)
+@click.option("--batch", "-b", help="Send to every agent in a batch")
+@click.option(
+    "--map",
+    "prompt_map",
+    type=click.File("r"),
+    help="Per-branch prompts (JSON object or branch:prompt lines)",
+)
+def prompt(
+    branch: Optional[str],
+    message: Optional[str],
+    file: Optional[IO[str]],
+    batch: Optional[str],
+    prompt_map: Optional[IO[str]],
+) -> None:
+    """Send an additional prompt to running agents.
+
+    BRANCH can be a branch name or a glob pattern (e.g., 'feature-*').
+    With --batch the only argument is the message. The prompt is pasted
+    through a tmux buffer, so long or multi-line text arrives intact.
+    Prompts for several agents are delivered in one tmux call.
 
     Args:
-        branch: The branch name of the agent
+        branch: The branch name or pattern of the agents
         message: The prompt message to send
+        file: File to read the prompt from
+        batch: Batch ID to broadcast to
+        prompt_map: File mapping branches to prompts
     """
+    if prompt_map is not None:
+        if branch or message or file or batch:
+            raise click.UsageError("--map cannot be combined with other targets")
+        prompts = read_prompt_map(prompt_map)
+        if not prompts:
+            raise click.UsageError("Prompt map is empty")
+    else:
+        if batch:
+            if message is not None:
+                raise click.UsageError("--batch takes the message as its only argument")
+            # With --batch the only positional argument is the message
+            branch, message = None, branch
+        elif not branch:
+            raise click.UsageError("Specify a branch, a pattern or --batch")
+        text = read_message(message, file)
+        if not text.strip():
+            raise click.UsageError("Prompt is empty")
+        text = text.rstrip("\n")
+
     config = ensure_project_config()
     state = StateManager(config.repo_root)
-    tmux = TmuxManager(config.tmux_prefix)
+    tmux = get_session_manager(config)
+
+    if prompt_map is not None:
+        broadcast(state, tmux, prompts)
+        return
+
+    if batch or branch is None or any(c in branch for c in "*?["):
+        if batch:
+            targets = state.list_agents(batch_id=batch)
+        else:
+            targets = [
+                a for a in state.list_agents() if fnmatch.fnmatch(a.branch, str(branch))
+            ]
+        if not targets:
+            click.echo(f"No agents found matching '{batch or branch}'")
+            raise SystemExit(1)
+        broadcast(state, tmux, {agent.branch: text for agent in targets})
+        return
 
     # Get the agent
     agent = state.get_agent(branch)
@@ -35,7 +195,7 @@ def prompt(branch: str, message: str) -> None:
         raise SystemExit(1)
 
     # Send the prompt
-    success = tmux.send_command(branch, message)
+    success = tmux.send_prompt(branch, text)
     if success:
         click.echo(f"Sent prompt to agent on branch '{branch}'")
     else:
@@ -0,0 +1,87 @@
+"""Reconcile command to repair drift between state, tmux and worktrees."""
+
+import click
+
+from ..reconcile import Reconciler
+from ..state import StateManager
+from ..worktree import WorktreeManager
+from .base import ensure_project_config, get_session_manager
+
+
+@click.command()
+@click.option("--adopt", is_flag=True, help="Add orphaned session/worktree pairs")
+@click.option("--repair", is_flag=True, help="Restart agents whose session died")
+@click.option(
+    "--gc",
+    "collect",
+    is_flag=True,
+    help="Remove stale records, orphaned sessions and orphaned worktrees",
+)
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def reconcile(adopt: bool, repair: bool, collect: bool, force: bool) -> None:
+    """Compare fleet state with tmux sessions and git worktrees.
+
+    Without options, only reports mismatches. Each category can then be
+    fixed in bulk with --adopt, --repair or --gc.
+    """
+    config = ensure_project_config()
+    state = StateManager(config.repo_root)
+    tmux = get_session_manager(config)
+    worktree = WorktreeManager(config.repo_root, config.worktree_root)
+
+    reconciler = Reconciler(config, state, tmux, worktree)
+    report = reconciler.report()
+
+    click.echo(f"Healthy agents: {len(report.healthy)}")
+
+    if report.is_clean:
+        click.echo("✅ State, tmux sessions and worktrees are in sync")
+        return
+
+    sections = [
+        ("Dead agents (session gone)", [a.branch for a in report.dead]),
+        (
+            "Agents with missing worktree",
+            [a.branch for a in report.missing_worktree],
+        ),
+        (
+            "Adoptable session/worktree pairs",
+            [f"{branch} ({session})" for session, _, branch in report.adoptable],
+        ),
+        ("Orphaned sessions", report.orphan_sessions),
+        (
+            "Orphaned worktrees",
+            [f"{path} ({branch})" for path, branch in report.orphan_worktrees],
+        ),
+    ]
+    for title, items in sections:
+        if not items:
+            continue
+        click.echo(f"\n{title}: {len(items)}")
+        for item in items:
+            click.echo(f"  - {item}")
+
+    if not (adopt or repair or collect):
+        click.echo("\n💡 Use --adopt, --repair or --gc to fix these in bulk")
+        return
+
+    if not force and not click.confirm("\nApply the selected fixes?"):
+        click.echo("Aborted.")
+        raise SystemExit(0)
+
+    if adopt and report.adoptable:
+        adopted = reconciler.adopt(report)
+        click.echo(f"✓ Adopted {len(adopted)} agent(s)")
+
+    if repair and report.dead:
+        repaired = reconciler.repair(report)
+        click.echo(f"✓ Repaired {len(repaired)}/{len(report.dead)} agent(s)")
+        # Repaired agents must not be garbage-collected below
+        restarted = set(repaired)
+        report.dead = [a for a in report.dead if a.branch not in restarted]
+
+    if collect:
+        collected = reconciler.collect_garbage(report)
+        click.echo(f"✓ Removed {len(collected)} item(s)")
+        for item in collected:
+            click.echo(f"  - {item}")
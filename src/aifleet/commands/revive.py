@@ -0,0 +1,122 @@
+"""Revive command to bring back archived agents."""
+
+import sys
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional
+
+import click
+
+from ..archive import drop_entry, find_entry, list_archive, restore_point
+from ..launcher import launch_agent
+from ..state import Agent, StateManager
+from ..worktree import WorktreeManager, WorktreeSetup
+from .base import ensure_project_config, get_session_manager
+from .create import verify_agent_command
+
+
+@click.command()
+@click.argument("entry", required=False)
+@click.option("--list", "-l", "list_entries", is_flag=True, help="List archived agents")
+@click.option("--agent", "-a", help="Agent to use (default: from config)")
+@click.option("--prompt", "-p", help="Initial prompt to send to the agent")
+def revive(
+    entry: Optional[str],
+    list_entries: bool,
+    agent: Optional[str],
+    prompt: Optional[str],
+) -> None:
+    """Recreate an agent archived by 'fleet kill --archive'.
+
+    ENTRY is <batch>/<branch>, or just the branch if it is unique. The
+    branch is recreated, uncommitted changes are restored into a new
+    worktree, and the agent is started in a new session.
+    """
+    config = ensure_project_config()
+    state = StateManager(config.repo_root)
+    worktree_mgr = WorktreeManager(
+        config.repo_root,
+        config.worktree_root,
+        config.workspace_mode,
+        config.clone_filter,
+    )
+
+    entries = list_archive(worktree_mgr)
+    if list_entries or not entry:
+        if not entries:
+            click.echo("No archived agents")
+            return
+        click.echo("Archived agents:")
+        for archived in entries:
+            where = f"  ({archived.bundle.name})" if archived.bundle else ""
+            click.echo(f"  {archived.name}  {archived.commit[:12]}{where}")
+        return
+
+    matches = find_entry(entries, entry)
+    if not matches:
+        click.echo(f"No archived agent matching '{entry}'", err=True)
+        sys.exit(1)
+    if len(matches) > 1:
+        click.echo(f"'{entry}' is ambiguous, use one of:", err=True)
+        for archived in matches:
+            click.echo(f"  {archived.name}", err=True)
+        sys.exit(1)
+    found = matches[0]
+    branch = found.branch
+
+    if state.get_agent(branch):
+        click.echo(f"Agent already exists for branch: {branch}", err=True)
+        sys.exit(1)
+    exists, _, _ = worktree_mgr._run_git(
+        ["show-ref", "--verify", f"refs/heads/{branch}"]
+    )
+    if exists:
+        click.echo(f"Branch '{branch}' already exists", err=True)
+        sys.exit(1)
+
+    agent = agent or config.default_agent
+    if not verify_agent_command(agent):
+        click.echo(f"Error: Agent command '{agent}' not found in PATH", err=True)
+        sys.exit(1)
+
+    point = restore_point(worktree_mgr, found)
+    if not point:
+        click.echo(f"Failed to read archived agent '{found.name}'", err=True)
+        sys.exit(1)
+    commit, snapshot = point
+
+    click.echo(f"Reviving '{found.name}'...")
+    setup = replace(WorktreeSetup.from_config(config), restore=snapshot)
+    worktree_path = worktree_mgr.setup_worktree(branch, setup, base=commit)
+    if not worktree_path:
+        click.echo("Failed to create worktree", err=True)
+        sys.exit(1)
+
+    tmux_mgr = get_session_manager(config)
+    click.echo(f"Starting {agent} agent...")
+    if not launch_agent(tmux_mgr, config, branch, str(worktree_path), agent, prompt):
+        click.echo("Failed to start agent", err=True)
+        tmux_mgr.kill_session(branch)
+        worktree_mgr.remove_worktree(worktree_path, force=True)
+        worktree_mgr._run_git(["branch", "-D", branch])
+        sys.exit(1)
+
+    session_info = tmux_mgr.get_session_info(branch)
+    state.add_agent(
+        Agent(
+            branch=branch,
+            worktree=str(worktree_path),
+            session=tmux_mgr.session_name(branch),
+            batch_id=found.batch,
+            agent=agent,
+            created_at=datetime.now().isoformat(),
+            pid=session_info.get("pid") if session_info else None,
+            prompt=prompt,
+        )
+    )
+    # The live branch holds the work again
+    drop_entry(worktree_mgr, found)
+
+    click.echo(f"\n✅ Revived '{found.name}'")
+    click.echo(f"   Worktree: {worktree_path}")
+    click.echo(f"   Attach with: fleet attach {branch}")
@@ -0,0 +1,66 @@
+"""Sync-creds command to refresh credential files in live worktrees."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+import click
+
+from ..credentials import SyncResult, sync_credentials
+from ..state import Agent, StateManager
+from .base import ensure_project_config
+
+
+@click.command("sync-creds")
+def sync_creds() -> None:
+    """Push updated credential files to every agent's worktree.
+
+    Only files whose content changed are rewritten. All worktrees are
+    synced in one parallel pass.
+    """
+    config = ensure_project_config()
+    state = StateManager(config.repo_root)
+
+    patterns = config.credential_files
+    if not patterns:
+        click.echo("No credential files configured (setup.credential_files)")
+        return
+
+    agents = [
+        a for a in state.list_agents() if a.worktree and Path(a.worktree).exists()
+    ]
+    if not agents:
+        click.echo("No agent worktrees to sync")
+        return
+
+    # Each source file is hashed at most once for all worktrees
+    digests: Dict = {}
+
+    def sync(agent: Agent) -> SyncResult:
+        return sync_credentials(
+            config.repo_root,
+            Path(agent.worktree),
+            patterns,
+            config.credential_sync,
+            digests,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(16, len(agents))) as pool:
+        results = list(pool.map(sync, agents))
+
+    for pattern in results[0].missing:
+        click.echo(f"⚠️  No files match '{pattern}'")
+
+    failures = 0
+    for agent, result in zip(agents, results):
+        line = f"  {agent.branch}: {len(result.updated)} updated"
+        line += f", {len(result.unchanged)} unchanged"
+        if result.failed:
+            line += f", {len(result.failed)} failed ({', '.join(result.failed)})"
+            failures += 1
+        click.echo(line)
+
+    updated = sum(len(r.updated) for r in results)
+    click.echo(f"\nSynced {len(agents)} worktree(s), {updated} file(s) updated")
+    if failures:
+        raise SystemExit(1)
@@ -0,0 +1,262 @@
+"""Viewport-aware rendering for ``fleet list --watch``.
+
+Only the rows inside the visible window are turned into Rich objects, so
+render time and memory depend on the terminal height rather than on the
+size of the fleet. Aggregates in the footer are still computed from every
+record.
+"""
+
+import os
+import select
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from rich.console import Group, RenderableType
+from rich.table import Table
+from rich.text import Text
+
+from .list import STATUS_COLORS, TABLE_COLUMN_SPECS, summarize_records
+
+# Fields the sort key cycles through, when present in the records
+SORT_KEYS = ["created", "branch", "batch_id", "status", "cpu", "memory"]
+
+# Lines taken by everything except the body rows: title, borders,
+# header, header separator and the help line
+TABLE_CHROME_LINES = 6
+
+HELP_TEXT = (
+    "↑/↓ j/k move  PgUp/PgDn  g/G top/bottom  s sort  r reverse  "
+    "b group  enter fold batch  c/e fold/unfold all  q quit"
+)
+
+# A visible row is either a batch header or an agent record
+Row = Tuple[str, Any]
+
+
+class Viewport:
+    """Scroll, sort and grouping state for the watch view."""
+
+    def __init__(self, columns: List[str], grouped: bool = False):
+        """Initialize viewport.
+
+        Args:
+            columns: Columns to render
+            grouped: Start grouped by batch
+        """
+        self.columns = columns
+        self.grouped = grouped
+        self.sort_key = "created"
+        self.reverse = False
+        self.collapsed: Set[str] = set()
+        self.cursor = 0
+        self.offset = 0
+        self.page_size = 1
+        self._rows: List[Row] = []
+
+    def _sort_keys(self) -> List[str]:
+        """Sort keys available for the current columns."""
+        return [k for k in SORT_KEYS if k == "created" or k in self.columns]
+
+    def build_rows(self, records: List[Dict[str, Any]]) -> List[Row]:
+        """Order records into rows, folding collapsed batches.
+
+        Rows only reference the records, so this stays cheap even for
+        large fleets.
+        """
+        key = self.sort_key
+
+        def value(record: Dict[str, Any]) -> Any:
+            return record.get(key) if record.get(key) is not None else ""
+
+        ordered = sorted(records, key=value, reverse=self.reverse)
+
+        if not self.grouped:
+            return [("agent", record) for record in ordered]
+
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        for record in ordered:
+            batches.setdefault(str(record["batch_id"]), []).append(record)
+
+        rows: List[Row] = []
+        for batch_id in sorted(batches):
+            members = batches[batch_id]
+            folded = batch_id in self.collapsed
+            rows.append(("batch", (batch_id, len(members), folded)))
+            if not folded:
+                rows.extend(("agent", record) for record in members)
+        return rows
+
+    def _clamp(self) -> None:
+        """Keep the cursor inside the rows and the window around the cursor."""
+        last = max(len(self._rows) - 1, 0)
+        self.cursor = min(max(self.cursor, 0), last)
+        if self.cursor < self.offset:
+            self.offset = self.cursor
+        elif self.cursor >= self.offset + self.page_size:
+            self.offset = self.cursor - self.page_size + 1
+        self.offset = min(max(self.offset, 0), max(len(self._rows) - 1, 0))
+
+    def _batch_at_cursor(self) -> Optional[str]:
+        """Batch ID of the row under the cursor."""
+        if not self._rows:
+            return None
+        kind, item = self._rows[self.cursor]
+        return str(item[0] if kind == "batch" else item["batch_id"])
+
+    def handle_key(self, key: str) -> None:
+        """Apply a key press to the view state."""
+        if key in ("j", "down"):
+            self.cursor += 1
+        elif key in ("k", "up"):
+            self.cursor -= 1
+        elif key in ("pgdn", " "):
+            self.cursor += self.page_size
+            self.offset += self.page_size
+        elif key == "pgup":
+            self.cursor -= self.page_size
+            self.offset -= self.page_size
+        elif key == "g":
+            self.cursor = 0
+        elif key == "G":
+            self.cursor = len(self._rows) - 1
+        elif key == "s":
+            keys = self._sort_keys()
+            index = keys.index(self.sort_key) if self.sort_key in keys else -1
+            self.sort_key = keys[(index + 1) % len(keys)]
+        elif key == "r":
+            self.reverse = not self.reverse
+        elif key == "b":
+            self.grouped = not self.grouped
+        elif key == "enter" and self.grouped:
+            batch_id = self._batch_at_cursor()
+            if batch_id is not None:
+                self.collapsed ^= {batch_id}
+        elif key == "c" and self.grouped:
+            self.collapsed.update(
+                str(item[0]) for kind, item in self._rows if kind == "batch"
+            )
+        elif key == "e":
+            self.collapsed.clear()
+        self._clamp()
+
+    def render(
+        self,
+        records: List[Dict[str, Any]],
+        height: int,
+        notes: Optional[List[str]] = None,
+    ) -> RenderableType:
+        """Render the visible window of the fleet.
+
+        Args:
+            records: Records for every listed agent
+            height: Terminal height in lines
+            notes: Extra footer lines
+        """
+        summary = summarize_records(records, self.grouped) + (notes or [])
+        self._rows = self.build_rows(records)
+        self.page_size = max(1, height - TABLE_CHROME_LINES - len(summary) - 1)
+        self._clamp()
+
+        visible = self._rows[self.offset : self.offset + self.page_size]
+        end = self.offset + len(visible)
+        order = "desc" if self.reverse else "asc"
+        position = f"rows {self.offset + 1}-{end} of {len(self._rows)}"
+
+        table = Table(
+            title=f"AI Fleet Agents ({position}, sort: {self.sort_key} {order})",
+            caption="\n".join(summary),
+            caption_justify="left",
+        )
+        for column in self.columns:
+            spec = TABLE_COLUMN_SPECS[column]
+            table.add_column(
+                spec.header, style=spec.style or "", justify=spec.justify, no_wrap=True
+            )
+
+        for index, (kind, item) in enumerate(visible, start=self.offset):
+            highlight = "reverse" if index == self.cursor else None
+            if kind == "batch":
+                batch_id, count, folded = item
+                marker = "▸" if folded else "▾"
+                label = Text(f"{marker} {batch_id} ({count})", style="bold magenta")
+                table.add_row(label, *[""] * (len(self.columns) - 1), style=highlight)
+                continue
+
+            cells: List[Any] = []
+            for column in self.columns:
+                if column == "status":
+                    status = str(item["status"])
+                    cells.append(Text(status, style=STATUS_COLORS.get(status, "white")))
+                else:
+                    cells.append(TABLE_COLUMN_SPECS[column].format(item[column]))
+            table.add_row(*cells, style=highlight)
+
+        return Group(table, Text(HELP_TEXT, style="dim"))
+
+
+# Escape sequences for the navigation keys we understand
+_ESCAPES = {
+    "\x1b[A": "up",
+    "\x1b[B": "down",
+    "\x1b[5~": "pgup",
+    "\x1b[6~": "pgdn",
+    "\x1bOA": "up",
+    "\x1bOB": "down",
+}
+
+
+class KeyReader:
+    """Read single key presses from the terminal without blocking."""
+
+    def __init__(self) -> None:
+        """Initialize key reader."""
+        self._fd: Optional[int] = None
+        self._saved: Any = None
+        self._pending = ""
+
+    def __enter__(self) -> "KeyReader":
+        """Put the terminal in cbreak mode if stdin is a terminal."""
+        if sys.stdin.isatty():
+            import termios
+            import tty
+
+            self._fd = sys.stdin.fileno()
+            self._saved = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Restore the terminal."""
+        if self._fd is not None:
+            import termios
+
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+
+    def read(self, timeout: float) -> Optional[str]:
+        """Wait up to ``timeout`` seconds for a key press.
+
+        Returns:
+            Key name, or None if no key was pressed
+        """
+        if not self._pending:
+            if self._fd is None:
+                select.select([], [], [], max(timeout, 0))
+                return None
+
+            ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+            if not ready:
+                return None
+            self._pending = os.read(self._fd, 64).decode(errors="ignore")
+            if not self._pending:
+                return None
+
+        # Several keys may arrive in one read; hand them out one at a time
+        for sequence, name in _ESCAPES.items():
+            if self._pending.startswith(sequence):
+                self._pending = self._pending[len(sequence) :]
+                return name
+
+        key, self._pending = self._pending[0], self._pending[1:]
+        if key in ("\r", "\n"):
+            return "enter"
+        return key
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 
 import toml
 
+from .credentials import SYNC_STRATEGIES, expand_sources, outside_root
+
 
 class ConfigManager:
     """Manages AI Fleet configuration with project-based support."""
@@ -23,14 +25,58 @@ class ConfigManager:
         "agent": {
             "default": "claude",
             "claude_flags": "--dangerously-skip-permissions",
+            "launch": "shell",
+            "backend": "tmux",
+            "fallback_shell": True,
+            "env_passthrough": [],
         },
         "setup": {
             "credential_files": [],
+            "credential_sync": "copy",
             "commands": [],
             "quick": False,
+            "on_kill": "remove",
+            "keep_paths": [],
+            "pool_size": 4,
+            "fetch_ttl": 300,
+            "git_performance": False,
+            "git_fsmonitor": False,
+            "lfs_paths": [],
+            "submodules": True,
+            "seed_paths": [],
+            "seed_from": "",
+            "shared_caches": {
+                "tools": [],
+                "root": "",
+                "max_size": "10G",
+                "limits": {},
+            },
+        },
+        "worktree": {
+            "mode": "worktree",
+            "clone_filter": "",
         },
         "tmux": {
             "prefix": "ai_",
+            "socket_name": "",
+            "shards": 1,
+            "sessions_per_shard": 100,
+            "idle_after": 30,
+            "event_hooks": False,
+            "history_limit": 0,
+            "spill_logs": False,
+            "spill_segment_kb": 1024,
+            "spill_max_mb": 256,
+        },
+        "concurrency": {
+            "git": 4,
+            "tmux": 16,
+            "setup": 4,
+        },
+        "maintenance": {
+            "schedule": "auto",
+            "interval_hours": 24,
+            "after_kills": 50,
         },
     }
 
@@ -289,10 +335,72 @@ class ConfigManager:
             return errors
 
         # Check credential files exist
-        for cred_file in self.credential_files:
-            cred_path = self.repo_root / cred_file
-            if not cred_path.exists():
-                errors.append(f"Credential file not found: {cred_file}")
+        patterns = []
+        for pattern in self.credential_files:
+            if outside_root(pattern):
+                errors.append(
+                    f"Credential file outside the repository: {pattern} "
+                    "(use a path relative to the repository root)"
+                )
+            else:
+                patterns.append(pattern)
+        _, missing = expand_sources(self.repo_root, patterns)
+        for cred_file in missing:
+            errors.append(f"Credential file not found: {cred_file}")
+
+        if self.credential_sync not in SYNC_STRATEGIES:
+            errors.append(
+                f"Invalid setup.credential_sync '{self.credential_sync}' "
+                f"(use one of: {', '.join(SYNC_STRATEGIES)})"
+            )
+
+        if self.launch_mode not in ("shell", "direct"):
+            errors.append(
+                f"Invalid agent.launch '{self.launch_mode}' (use 'shell' or 'direct')"
+            )
+
+        if self.worktree_on_kill not in ("remove", "recycle"):
+            errors.append(
+                f"Invalid setup.on_kill '{self.worktree_on_kill}' "
+                "(use 'remove' or 'recycle')"
+            )
+
+        if self.session_backend not in ("tmux", "headless"):
+            errors.append(
+                f"Invalid agent.backend '{self.session_backend}' "
+                "(use 'tmux' or 'headless')"
+            )
+
+        if self.workspace_mode not in ("worktree", "clone"):
+            errors.append(
+                f"Invalid worktree.mode '{self.workspace_mode}' "
+                "(use 'worktree' or 'clone')"
+            )
+
+        if self.get("setup.seed_from", "") and not self.seed_source.is_dir():
+            errors.append(f"Seed checkout not found: {self.seed_source}")
+
+        from .caches import CACHE_TOOLS, parse_size
+
+        for tool in self.shared_caches:
+            if tool not in CACHE_TOOLS:
+                errors.append(
+                    f"Unknown shared cache '{tool}' "
+                    f"(use any of: {', '.join(CACHE_TOOLS)})"
+                )
+                continue
+            try:
+                parse_size(self.cache_limit(tool))
+            except ValueError:
+                errors.append(
+                    f"Invalid size limit '{self.cache_limit(tool)}' for cache '{tool}'"
+                )
+
+        if self.maintenance_schedule not in ("auto", "off"):
+            errors.append(
+                f"Invalid maintenance.schedule '{self.maintenance_schedule}' "
+                "(use 'auto' or 'off')"
+            )
 
         return errors
 
@@ -329,6 +437,167 @@ class ConfigManager:
         """Get tmux session prefix."""
         return str(self.get("tmux.prefix", "ai_"))
 
+    @property
+    def tmux_socket(self) -> Optional[str]:
+        """Get tmux socket name, or None for the default server."""
+        return str(self.get("tmux.socket_name", "")) or None
+
+    @property
+    def tmux_shards(self) -> int:
+        """Get number of tmux servers sessions are spread across."""
+        return max(1, int(self.get("tmux.shards", 1)))
+
+    @property
+    def idle_after(self) -> float:
+        """Get seconds of pane silence after which a running agent is idle."""
+        return float(self.get("tmux.idle_after", 30))
+
+    @property
+    def event_hooks(self) -> bool:
+        """Get whether tmux hooks record agent events."""
+        return bool(self.get("tmux.event_hooks", False))
+
+    @property
+    def session_backend(self) -> str:
+        """Get where agent sessions run: tmux or headless."""
+        return str(self.get("agent.backend", "tmux"))
+
+    @property
+    def worktree_on_kill(self) -> str:
+        """Get what kill does with worktrees: remove or recycle."""
+        return str(self.get("setup.on_kill", "remove"))
+
+    @property
+    def keep_paths(self) -> List[str]:
+        """Get paths that survive cleaning a recycled worktree."""
+        return list(self.get("setup.keep_paths", []))
+
+    @property
+    def pool_size(self) -> int:
+        """Get how many recycled worktrees are kept for reuse."""
+        return int(self.get("setup.pool_size", 4))
+
+    @property
+    def workspace_mode(self) -> str:
+        """Get how agent workspaces are created ('worktree' or 'clone')."""
+        return str(self.get("worktree.mode", "worktree"))
+
+    @property
+    def clone_filter(self) -> str:
+        """Get the partial clone filter for clone workspaces ('' = none)."""
+        return str(self.get("worktree.clone_filter", ""))
+
+    @property
+    def fetch_ttl(self) -> float:
+        """Get seconds a fetch for --base stays fresh."""
+        return float(self.get("setup.fetch_ttl", 300))
+
+    @property
+    def git_performance(self) -> bool:
+        """Get whether new worktrees get the git performance profile."""
+        return bool(self.get("setup.git_performance", False))
+
+    @property
+    def git_fsmonitor(self) -> bool:
+        """Get whether the git performance profile starts fsmonitor daemons."""
+        return bool(self.get("setup.git_fsmonitor", False))
+
+    @property
+    def lfs_paths(self) -> List[str]:
+        """Get the LFS paths hydrated in new worktrees."""
+        paths = self.get("setup.lfs_paths", [])
+        return paths if isinstance(paths, list) else []
+
+    @property
+    def init_submodules(self) -> bool:
+        """Get whether new worktrees get their submodules initialized."""
+        return bool(self.get("setup.submodules", True))
+
+    @property
+    def seed_paths(self) -> List[str]:
+        """Get the build output paths seeded into new worktrees."""
+        paths = self.get("setup.seed_paths", [])
+        return paths if isinstance(paths, list) else []
+
+    @property
+    def seed_source(self) -> Path:
+        """Get the checkout build outputs are seeded from."""
+        source = self.get("setup.seed_from", "")
+        if not source:
+            return self.repo_root
+        return self.repo_root / Path(source).expanduser()
+
+    @property
+    def shared_caches(self) -> List[str]:
+        """Get the tools whose caches all agents share."""
+        tools = self.get("setup.shared_caches.tools", [])
+        return tools if isinstance(tools, list) else []
+
+    @property
+    def cache_root(self) -> Path:
+        """Get the directory holding the shared caches."""
+        root = self.get("setup.shared_caches.root", "")
+        return Path(root).expanduser() if root else Path.home() / ".aifleet" / "cache"
+
+    def cache_limit(self, tool: str) -> str:
+        """Get the size limit of a tool's shared cache (e.g. '10G')."""
+        limits = self.get("setup.shared_caches.limits", {})
+        if isinstance(limits, dict) and tool in limits:
+            return str(limits[tool])
+        return str(self.get("setup.shared_caches.max_size", "10G"))
+
+    @property
+    def concurrency_limits(self) -> Dict[str, int]:
+        """Get how many git, tmux and setup processes may run at once."""
+        return {
+            "git": int(self.get("concurrency.git", 4)),
+            "tmux": int(self.get("concurrency.tmux", 16)),
+            "setup": int(self.get("concurrency.setup", 4)),
+        }
+
+    @property
+    def maintenance_schedule(self) -> str:
+        """Get whether repository maintenance runs when due ('auto' or 'off')."""
+        return str(self.get("maintenance.schedule", "auto"))
+
+    @property
+    def maintenance_interval(self) -> float:
+        """Get the seconds between scheduled maintenance runs (0 = never)."""
+        return float(self.get("maintenance.interval_hours", 24)) * 3600
+
+    @property
+    def maintenance_after_kills(self) -> int:
+        """Get how many killed agents trigger maintenance (0 = never)."""
+        return int(self.get("maintenance.after_kills", 50))
+
+    @property
+    def history_limit(self) -> int:
+        """Get scrollback lines per agent session (0 keeps tmux's setting)."""
+        return int(self.get("tmux.history_limit", 0))
+
+    @property
+    def spill_logs(self) -> bool:
+        """Get whether agent output is spilled to compressed log segments."""
+        return bool(self.get("tmux.spill_logs", False))
+
+    @property
+    def spill_segment_bytes(self) -> int:
+        """Get the uncompressed size of each spilled log segment."""
+        return max(1, int(self.get("tmux.spill_segment_kb", 1024))) * 1024
+
+    @property
+    def spill_max_segments(self) -> int:
+        """Get the spilled segments kept per session (0 keeps all)."""
+        limit = int(self.get("tmux.spill_max_mb", 256)) << 20
+        if limit <= 0:
+            return 0
+        return max(1, limit // self.spill_segment_bytes)
+
+    @property
+    def max_agents(self) -> int:
+        """Get the most agents a single fanout may start."""
+        return self.tmux_shards * int(self.get("tmux.sessions_per_shard", 100))
+
     @property
     def default_agent(self) -> str:
         """Get default agent."""
@@ -339,12 +608,33 @@ class ConfigManager:
         """Get claude flags."""
         return str(self.get("agent.claude_flags", ""))
 
+    @property
+    def launch_mode(self) -> str:
+        """Get agent launch mode ("shell" or "direct")."""
+        return str(self.get("agent.launch", "shell"))
+
+    @property
+    def fallback_shell(self) -> bool:
+        """Get whether a shell is left behind after a direct launch exits."""
+        return bool(self.get("agent.fallback_shell", True))
+
+    @property
+    def env_passthrough(self) -> List[str]:
+        """Get extra environment variables passed to directly launched agents."""
+        result = self.get("agent.env_passthrough", [])
+        return result if isinstance(result, list) else []
+
     @property
     def credential_files(self) -> List[str]:
         """Get credential files to copy."""
         result = self.get("setup.credential_files", [])
         return result if isinstance(result, list) else []
 
+    @property
+    def credential_sync(self) -> str:
+        """Get how credential files are placed (copy/hardlink/reflink/symlink)."""
+        return str(self.get("setup.credential_sync", "copy"))
+
     @property
     def setup_commands(self) -> List[str]:
         """Get setup commands to run."""
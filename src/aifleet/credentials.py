@@ -0,0 +1,224 @@
+"""Incremental sync of credential and config files into worktrees.
+
+``setup.credential_files`` lists files, directories and glob patterns
+relative to the project root. Syncing only rewrites a destination file
+whose content differs from its source. A matching size and mtime
+counts as unchanged, and otherwise the two files' hashes are compared.
+Files are copied atomically by default, or placed as hardlinks, reflinks
+(copy-on-write clones, where the filesystem supports them) or symlinks.
+"""
+
+import errno
+import fcntl
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+SYNC_STRATEGIES = ("copy", "hardlink", "reflink", "symlink")
+
+# Linux ioctl that clones a file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing credential files into one worktree."""
+
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+    @property
+    def synced(self) -> List[str]:
+        """Files now in place, whether or not they had to be written."""
+        return self.updated + self.unchanged
+
+
+def outside_root(pattern: str) -> bool:
+    """Check whether a pattern may reach outside the directory it is relative to.
+
+    Args:
+        pattern: File path, directory or glob pattern
+
+    Returns:
+        True for absolute patterns and patterns with a ``..`` component
+    """
+    path = PurePosixPath(pattern)
+    return path.is_absolute() or ".." in path.parts
+
+
+def expand_sources(root: Path, patterns: List[str]) -> Tuple[List[str], List[str]]:
+    """Expand credential file patterns into files.
+
+    Args:
+        root: Directory the patterns are relative to
+        patterns: File paths, directories or glob patterns
+
+    Returns:
+        (relative file paths, patterns that matched nothing); patterns
+        reaching outside ``root`` never match
+    """
+    files: Dict[str, None] = {}
+    missing = []
+
+    for pattern in patterns:
+        if outside_root(pattern):
+            missing.append(pattern)
+            continue
+        if any(char in pattern for char in "*?["):
+            matches = sorted(root.glob(pattern))
+        else:
+            matches = [root / pattern] if (root / pattern).exists() else []
+
+        found = False
+        for match in matches:
+            candidates = sorted(match.rglob("*")) if match.is_dir() else [match]
+            for path in candidates:
+                if path.is_file():
+                    files[path.relative_to(root).as_posix()] = None
+                    found = True
+        if not found:
+            missing.append(pattern)
+
+    return list(files), missing
+
+
+def file_digest(path: Path) -> str:
+    """Get a file's SHA-256 hex digest."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone a file's data without copying it, if the filesystem can."""
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError as e:
+            if e.errno in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY):
+                return False
+            raise
+    shutil.copystat(src, dst)
+    return True
+
+
+def clone_file(src: Path, dst: Path) -> None:
+    """Copy a file, as a reflink where the filesystem supports it.
+
+    Unlike a hardlink, the copy is independent of its source, so rewriting
+    one in place never changes the other. Timestamps are preserved.
+    """
+    if not _reflink(src, dst):
+        shutil.copy2(src, dst)
+
+
+def _in_sync(src: Path, dst: Path, strategy: str, digests: Dict[Path, str]) -> bool:
+    if strategy == "symlink":
+        return dst.is_symlink() and os.readlink(dst) == str(src)
+    if dst.is_symlink() or not dst.is_file():
+        return False
+
+    src_stat, dst_stat = src.stat(), dst.stat()
+    if strategy == "hardlink":
+        return src_stat.st_ino == dst_stat.st_ino and src_stat.st_dev == dst_stat.st_dev
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+
+    if src not in digests:
+        digests[src] = file_digest(src)
+    if digests[src] != file_digest(dst):
+        return False
+    # Same content: align the mtime so the next check is a stat
+    os.utime(dst, ns=(dst_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
+
+
+def sync_file(
+    src: Path, dst: Path, strategy: str = "copy", digests: Optional[Dict] = None
+) -> bool:
+    """Bring one destination file in line with its source.
+
+    The new file is put in place with a rename, so an agent reading it
+    never sees a partly written file. Hardlinks and reflinks fall back to
+    copying where the filesystem doesn't support them.
+
+    Args:
+        src: Source file
+        dst: Destination file
+        strategy: copy, hardlink, reflink or symlink
+        digests: Cache of source digests shared between destinations
+
+    Returns:
+        True if the destination was written, False if it was in sync
+    """
+    if _in_sync(src, dst, strategy, {} if digests is None else digests):
+        return False
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    temp = dst.with_name(f".{dst.name}.aifleet-tmp")
+    if temp.exists() or temp.is_symlink():
+        temp.unlink()
+
+    placed = False
+    if strategy == "symlink":
+        temp.symlink_to(src)
+        placed = True
+    elif strategy == "hardlink":
+        try:
+            os.link(src, temp)
+            placed = True
+        except OSError:
+            pass
+    elif strategy == "reflink":
+        clone_file(src, temp)
+        placed = True
+    if not placed:
+        shutil.copy2(src, temp)
+
+    os.replace(temp, dst)
+    return True
+
+
+def sync_credentials(
+    source_root: Path,
+    target_root: Path,
+    patterns: List[str],
+    strategy: str = "copy",
+    digests: Optional[Dict] = None,
+) -> SyncResult:
+    """Sync credential files from the project root into a worktree.
+
+    Args:
+        source_root: Project root the patterns are relative to
+        target_root: Worktree root
+        patterns: File paths, directories or glob patterns
+        strategy: copy, hardlink, reflink or symlink
+        digests: Cache of source digests shared between worktrees
+
+    Returns:
+        Which files were updated, unchanged, missing or failed
+    """
+    files, missing = expand_sources(source_root, patterns)
+    result = SyncResult(missing=missing)
+    digests = {} if digests is None else digests
+
+    for name in files:
+        try:
+            if sync_file(source_root / name, target_root / name, strategy, digests):
+                result.updated.append(name)
+            else:
+                result.unchanged.append(name)
+        except OSError as e:
+            print(f"Failed to sync {name}: {e}")
+            result.failed.append(name)
+
+    return result
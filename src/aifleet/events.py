@@ -0,0 +1,147 @@
+"""Agent lifecycle events pushed by tmux hooks.
+
+Hooks append to ``.aifleet/events.log``. Once it grows past
+``EVENT_LOG_BYTES`` it is moved to ``events.log.1`` when the next agent
+starts, so at most two logs' worth of events are kept.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+# tmux hook name -> event kind shown to users
+EVENT_KINDS = {
+    "alert-silence": "idle",
+    "alert-activity": "active",
+    "session-closed": "closed",
+}
+
+# Size after which the event log is rotated
+EVENT_LOG_BYTES = 1 << 20
+
+
+@dataclass
+class Event:
+    """One event record written by a tmux hook."""
+
+    time: int
+    kind: str
+    session: str
+
+
+def event_log_path(project_root: Path) -> Path:
+    """Get the event log path for a project.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Path of the event log (next to the state file)
+    """
+    return project_root / ".aifleet" / "events.log"
+
+
+def rotate_event_log(path: Path, max_bytes: int = EVENT_LOG_BYTES) -> bool:
+    """Move the event log aside once it is too large.
+
+    Hooks open the log by name for every event, so they continue in a new
+    file right away.
+
+    Args:
+        path: Event log path
+        max_bytes: Size above which the log is rotated
+
+    Returns:
+        True if the log was rotated
+    """
+    try:
+        if path.stat().st_size <= max_bytes:
+            return False
+        os.replace(path, path.with_name(path.name + ".1"))
+        return True
+    except OSError:
+        return False
+
+
+def parse_event(line: str) -> Optional[Event]:
+    """Parse an event record line.
+
+    Records are ``<unix time> <hook name> <session name>``.
+
+    Args:
+        line: Log line
+
+    Returns:
+        Event or None if the line is malformed
+    """
+    parts = line.split()
+    if len(parts) != 3 or not parts[0].isdigit():
+        return None
+    hook = parts[1].split("[")[0]
+    return Event(int(parts[0]), EVENT_KINDS.get(hook, hook), parts[2])
+
+
+def read_events(path: Path, limit: Optional[int] = None) -> List[Event]:
+    """Read recorded events.
+
+    Args:
+        path: Event log path
+        limit: Only return the last N events
+
+    Returns:
+        Events in the order they were written, rotated ones included
+    """
+    events: List[Event] = []
+    for log in (path.with_name(path.name + ".1"), path):
+        if log.exists():
+            with open(log, "r", errors="replace") as f:
+                events.extend(e for e in map(parse_event, f) if e is not None)
+    return events[-limit:] if limit else events
+
+
+def follow_events(path: Path, interval: float = 0.2) -> Iterator[Event]:
+    """Yield events as tmux appends them, starting at the end of the log.
+
+    Args:
+        path: Event log path
+        interval: Seconds to wait when no new data is available
+
+    Yields:
+        New events
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch(exist_ok=True)
+
+    f = open(path, "r", errors="replace")
+    f.seek(0, 2)
+    pending = ""
+    try:
+        while True:
+            chunk = f.readline()
+            if not chunk:
+                if _rotated(path, f.fileno()):
+                    # Everything left in the old log has been read
+                    f.close()
+                    f = open(path, "r", errors="replace")
+                    continue
+                time.sleep(interval)
+                continue
+            pending += chunk
+            if not pending.endswith("\n"):
+                continue
+            event = parse_event(pending)
+            pending = ""
+            if event is not None:
+                yield event
+    finally:
+        f.close()
+
+
+def _rotated(path: Path, fd: int) -> bool:
+    """Check whether the log at a path is no longer the open file."""
+    try:
+        return path.stat().st_ino != os.fstat(fd).st_ino
+    except OSError:
+        return False
@@ -0,0 +1,669 @@
+"""Headless agent sessions for AI Fleet.
+
+Instead of a tmux server, one supervisor process runs every agent under
+its own pseudo-terminal. Each session's output is streamed to a log file,
+rotated once it reaches ``SESSION_LOG_BYTES``, and prompts arrive over a
+Unix control socket, one JSON request per connection. Sessions can't be
+attached, which suits batch runs that nobody watches live.
+
+``HeadlessManager`` starts the supervisor on demand; the supervisor exits
+once its last session has ended.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import pty
+import resource
+import selectors
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from .scrollback import clean_output
+from .tmux import TmuxManager
+
+# Terminal size every agent sees
+PTY_ROWS = 50
+PTY_COLUMNS = 200
+
+# Seconds a freshly started supervisor waits for its first session
+STARTUP_GRACE = 30.0
+
+# Bytes a session log grows to before it is rotated to <session>.log.1
+SESSION_LOG_BYTES = 8 << 20
+
+# Programs opt in to bracketed paste with \x1b[?2004h, as under tmux
+BRACKETED_PASTE = b"\x1b[?2004"
+PASTE_START = b"\x1b[200~"
+PASTE_END = b"\x1b[201~"
+
+
+def run_dir(project_root: Path) -> Path:
+    """Get the directory holding the supervisor's socket and session logs.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Run directory path
+    """
+    return project_root / ".aifleet" / "headless"
+
+
+def control_socket_path(directory: Path) -> str:
+    """Get the supervisor's control socket path.
+
+    Args:
+        directory: Run directory
+
+    Returns:
+        Socket path (in the temp dir if the run directory's is too long)
+    """
+    path = str(directory / "control.sock")
+    # Unix socket paths are limited to about 100 bytes
+    if len(path) > 100:
+        digest = hashlib.sha1(str(directory).encode()).hexdigest()[:16]
+        path = os.path.join(tempfile.gettempdir(), f"aifleet-{digest}.sock")
+    return path
+
+
+def _tail_bytes(path: Path, lines: int) -> Optional[bytes]:
+    """Read at least the last ``lines`` lines of a file, as raw bytes."""
+    try:
+        with open(path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            start = end
+            data = b""
+            while start > 0 and data.count(b"\n") <= lines:
+                start = max(0, start - 65536)
+                f.seek(start)
+                data = f.read(end - start)
+    except OSError:
+        return None
+    return data
+
+
+def tail_log(path: Path, lines: int) -> Optional[List[str]]:
+    """Read the last lines of a session log without reading all of it.
+
+    Lines missing from a freshly rotated log are taken from the previous
+    segment.
+
+    Args:
+        path: Log file
+        lines: Number of lines wanted
+
+    Returns:
+        Up to ``lines`` lines with terminal escapes removed, or None if
+        the log doesn't exist
+    """
+    data = _tail_bytes(path, lines)
+    if data is None:
+        return None
+    if data.count(b"\n") < lines:
+        previous = _tail_bytes(path.with_name(path.name + ".1"), lines)
+        data = (previous or b"") + data
+
+    text = clean_output(data.decode(errors="replace"))
+    return text.splitlines()[-lines:] if lines > 0 else []
+
+
+@dataclass
+class _Session:
+    """A running agent inside the supervisor."""
+
+    name: str
+    pid: int
+    fd: int
+    log: BinaryIO
+    activity: int
+    pending: bytearray = field(default_factory=bytearray)
+    bracketed_paste: bool = False
+    event_log: Optional[str] = None
+    idle_after: int = 0
+    idle: bool = False
+    log_bytes: int = 0
+
+
+class Supervisor:
+    """Runs agent sessions under PTYs and serves control requests."""
+
+    def __init__(self, directory: Path):
+        """Initialize supervisor.
+
+        Args:
+            directory: Run directory for the socket and session logs
+        """
+        self.directory = directory
+        self.socket_path = control_socket_path(directory)
+        self.selector = selectors.DefaultSelector()
+        self.sessions: Dict[str, _Session] = {}
+        self.started = False
+
+    def serve(self) -> None:
+        """Serve requests until the last session has ended."""
+        listener = self._listen()
+        if listener is None:
+            return
+
+        # Hundreds of agents need two descriptors each
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard == resource.RLIM_INFINITY or hard > soft:
+            limit = 65536 if hard == resource.RLIM_INFINITY else hard
+            resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, limit), hard))
+
+        self.selector.register(listener, selectors.EVENT_READ, None)
+        deadline = time.monotonic() + STARTUP_GRACE
+        try:
+            while self.sessions or (not self.started and time.monotonic() < deadline):
+                for key, mask in self.selector.select(timeout=1.0):
+                    if key.data is None:
+                        self._handle_connection(listener)
+                    else:
+                        self._handle_session(key.data, mask)
+                self._reap()
+                self._check_idle()
+        finally:
+            for session in list(self.sessions.values()):
+                self._kill(session)
+            listener.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _listen(self) -> Optional[socket.socket]:
+        """Bind the control socket unless another supervisor owns it."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+            return None
+        except OSError:
+            pass
+        finally:
+            probe.close()
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(128)
+        return listener
+
+    def _handle_connection(self, listener: socket.socket) -> None:
+        """Answer one control request."""
+        conn, _ = listener.accept()
+        with conn:
+            conn.settimeout(5)
+            try:
+                with conn.makefile("rb") as stream:
+                    request = json.loads(stream.readline())
+                reply = self._dispatch(request)
+            except Exception as e:
+                reply = {"ok": False, "error": str(e)}
+            try:
+                conn.sendall(json.dumps(reply).encode() + b"\n")
+            except OSError:
+                pass
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a control request.
+
+        Args:
+            request: Decoded request with an ``op`` field
+
+        Returns:
+            Reply with ``ok`` and, on failure, ``error``
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "list":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "sessions": [
+                    [s.name, s.pid, s.activity] for s in self.sessions.values()
+                ],
+            }
+        if op == "create":
+            return self._create(request["name"], request["cwd"], request.get("command"))
+        if op == "kill":
+            missing = [n for n in request["names"] if n not in self.sessions]
+            for name in request["names"]:
+                if name in self.sessions:
+                    self._kill(self.sessions[name])
+            if missing:
+                return {
+                    "ok": False,
+                    "error": f"Sessions not found: {', '.join(missing)}",
+                }
+            return {"ok": True}
+
+        session = self.sessions.get(request.get("name", ""))
+        if session is None:
+            return {"ok": False, "error": f"Session {request.get('name')} not found"}
+        if op == "send":
+            self._send(session, request["text"], request.get("paste", False))
+            return {"ok": True}
+        if op == "events":
+            session.event_log = request["log"]
+            session.idle_after = int(request["idle_after"])
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown request '{op}'"}
+
+    def _create(self, name: str, cwd: str, command: Optional[str]) -> Dict[str, Any]:
+        """Start a session's process under a new PTY."""
+        if name in self.sessions:
+            return {"ok": False, "error": f"Session {name} already exists"}
+        if not os.path.isdir(cwd):
+            return {"ok": False, "error": f"No such directory: {cwd}"}
+
+        if command:
+            argv = ["/bin/sh", "-c", command]
+        else:
+            argv = [os.environ.get("SHELL", "/bin/sh")]
+
+        pid, fd = pty.fork()
+        if pid == 0:
+            try:
+                os.chdir(cwd)
+                os.environ.setdefault("TERM", "xterm-256color")
+                os.execvp(argv[0], argv)
+            finally:
+                os._exit(127)
+
+        size = struct.pack("HHHH", PTY_ROWS, PTY_COLUMNS, 0, 0)
+        fcntl.ioctl(fd, termios.TIOCSWINSZ, size)
+        os.set_blocking(fd, False)
+
+        log = open(self.directory / f"{name}.log", "wb", buffering=0)
+        session = _Session(name, pid, fd, log, int(time.time()))
+        self.sessions[name] = session
+        self.selector.register(fd, selectors.EVENT_READ, session)
+        self.started = True
+        return {"ok": True, "pid": pid}
+
+    def _send(self, session: _Session, text: str, paste: bool) -> None:
+        """Queue input for a session, followed by Enter."""
+        data = text.encode()
+        if paste:
+            # Like tmux paste-buffer: newlines become carriage returns
+            data = data.replace(b"\r\n", b"\r").replace(b"\n", b"\r")
+            if session.bracketed_paste:
+                data = PASTE_START + data + PASTE_END
+        session.pending += data + b"\r"
+        self.selector.modify(
+            session.fd, selectors.EVENT_READ | selectors.EVENT_WRITE, session
+        )
+
+    def _handle_session(self, session: _Session, mask: int) -> None:
+        """Move data between a session's PTY, its log and its input queue."""
+        if mask & selectors.EVENT_WRITE and session.pending:
+            try:
+                written = os.write(session.fd, session.pending)
+                del session.pending[:written]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._close(session)
+                return
+            if not session.pending:
+                self.selector.modify(session.fd, selectors.EVENT_READ, session)
+
+        if not mask & selectors.EVENT_READ:
+            return
+        try:
+            data = os.read(session.fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            # EIO: every process holding the terminal has exited
+            data = b""
+        if not data:
+            self._close(session)
+            return
+
+        session.log.write(data)
+        session.log_bytes += len(data)
+        if session.log_bytes > SESSION_LOG_BYTES:
+            self._rotate_log(session)
+        session.activity = int(time.time())
+        toggle = data.rfind(BRACKETED_PASTE)
+        if toggle != -1:
+            mode = data[
+                toggle + len(BRACKETED_PASTE) : toggle + len(BRACKETED_PASTE) + 1
+            ]
+            session.bracketed_paste = mode == b"h"
+        if session.idle:
+            session.idle = False
+            self._record_event(session, "alert-activity")
+
+    def _rotate_log(self, session: _Session) -> None:
+        """Start a new log, keeping one previous segment."""
+        path = self.directory / f"{session.name}.log"
+        session.log.close()
+        os.replace(path, path.with_name(path.name + ".1"))
+        session.log = open(path, "wb", buffering=0)
+        session.log_bytes = 0
+
+    def _check_idle(self) -> None:
+        """Record sessions that have just gone quiet."""
+        now = time.time()
+        for session in self.sessions.values():
+            if (
+                session.event_log
+                and not session.idle
+                and now - session.activity >= session.idle_after
+            ):
+                session.idle = True
+                self._record_event(session, "alert-silence")
+
+    def _record_event(self, session: _Session, hook: str) -> None:
+        """Append an event in the format the tmux hooks write."""
+        if not session.event_log:
+            return
+        try:
+            with open(session.event_log, "a") as f:
+                f.write(f"{int(time.time())} {hook} {session.name}\n")
+        except OSError:
+            pass
+
+    def _kill(self, session: _Session) -> None:
+        """Hang up a session's process group, as tmux kill-session does."""
+        try:
+            os.killpg(session.pid, signal.SIGHUP)
+        except OSError:
+            pass
+        self._close(session)
+
+    def _close(self, session: _Session) -> None:
+        """Forget a session whose terminal is gone."""
+        self.selector.unregister(session.fd)
+        os.close(session.fd)
+        session.log.close()
+        del self.sessions[session.name]
+        self._record_event(session, "session-closed")
+
+    def _reap(self) -> None:
+        """Collect exited children."""
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+
+class HeadlessManager(TmuxManager):
+    """Manages agent sessions in a headless PTY supervisor.
+
+    Offers the same operations as ``TmuxManager``, except attaching.
+    """
+
+    def __init__(self, project_root: Path, prefix: str = "ai_"):
+        """Initialize headless manager.
+
+        Args:
+            project_root: Project root; the supervisor runs in its
+                ``.aifleet/headless`` directory
+            prefix: Prefix for session names
+        """
+        self.directory = run_dir(project_root)
+        super().__init__(prefix)
+
+    def _connect(self, shard_count: int) -> None:
+        """Nothing to connect to: the supervisor is started on demand."""
+
+    def _request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a control request to the supervisor.
+
+        Args:
+            request: Request with an ``op`` field
+
+        Returns:
+            Reply, or None if no supervisor is running
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.settimeout(10)
+                conn.connect(control_socket_path(self.directory))
+                conn.sendall(json.dumps(request).encode() + b"\n")
+                with conn.makefile("rb") as stream:
+                    line = stream.readline()
+            reply: Dict[str, Any] = json.loads(line)
+            return reply
+        except (OSError, ValueError):
+            return None
+
+    def _ensure_supervisor(self) -> bool:
+        """Start the supervisor unless it is already running."""
+        if self._request({"op": "ping"}):
+            return True
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "supervisor.log", "ab") as errors:
+            subprocess.Popen(
+                [sys.executable, "-m", "aifleet.headless", str(self.directory)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=errors,
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if self._request({"op": "ping"}):
+                return True
+            time.sleep(0.05)
+        print("Failed to start the headless supervisor")
+        return False
+
+    def _sessions(self) -> Tuple[List[Tuple[str, int, int]], Optional[int]]:
+        """Get (name, pid, activity) for every session, plus the supervisor PID."""
+        reply = self._request({"op": "list"})
+        if not reply:
+            return [], None
+        return [tuple(s) for s in reply["sessions"]], reply["pid"]  # type: ignore[misc]
+
+    def create_session(  # type: ignore[override]
+        self,
+        branch: str,
+        working_dir: str,
+        command: Optional[str] = None,
+        history_limit: int = 0,
+    ) -> bool:
+        """Create a new headless session.
+
+        Args:
+            branch: Branch name
+            working_dir: Working directory for the session
+            command: Initial command to run instead of the default shell
+            history_limit: Ignored; output is kept on disk, not in memory
+
+        Returns:
+            True if the session exists afterwards
+        """
+        session_name = self.session_name(branch)
+
+        if self.session_exists(branch):
+            print(f"Session {session_name} already exists")
+            return True
+        if not self._ensure_supervisor():
+            return False
+
+        reply = self._request(
+            {
+                "op": "create",
+                "name": session_name,
+                "cwd": working_dir,
+                "command": command,
+            }
+        )
+        if not reply or not reply["ok"]:
+            error = reply["error"] if reply else "supervisor not responding"
+            print(f"Failed to create session: {error}")
+            return False
+        return True
+
+    def _send(self, branch: str, text: str, paste: bool, what: str) -> bool:
+        """Send input to a session, followed by Enter."""
+        reply = self._request(
+            {
+                "op": "send",
+                "name": self.session_name(branch),
+                "text": text,
+                "paste": paste,
+            }
+        )
+        if not reply or not reply["ok"]:
+            error = reply["error"] if reply else "supervisor not running"
+            print(f"Failed to send {what}: {error}")
+            return False
+        return True
+
+    def send_command(self, branch: str, command: str) -> bool:
+        """Send a command to a session."""
+        return self._send(branch, command, paste=False, what="command")
+
+    def send_prompt(self, branch: str, text: str) -> bool:
+        """Deliver a prompt as a (bracketed, if requested) paste."""
+        return self._send(branch, text, paste=True, what="prompt")
+
+    def send_prompts(self, prompts: Dict[str, str]) -> Dict[str, bool]:
+        """Deliver prompts to several sessions."""
+        return {
+            branch: self.send_prompt(branch, text) for branch, text in prompts.items()
+        }
+
+    def get_session_output(self, branch: str, lines: int = 100) -> Optional[str]:
+        """Get recent output from a session's log.
+
+        Args:
+            branch: Branch name
+            lines: Number of lines to retrieve
+
+        Returns:
+            Output text or None if the session has no log
+        """
+        output = tail_log(self.directory / f"{self.session_name(branch)}.log", lines)
+        if output is None:
+            return None
+        return "\n".join(output) + "\n"
+
+    def pane_size(self, branch: str) -> Optional[Tuple[int, int]]:
+        """Get the terminal size every headless session has."""
+        return (PTY_COLUMNS, PTY_ROWS) if self.session_exists(branch) else None
+
+    def attach_session(self, branch: str) -> None:
+        """Explain that headless sessions can't be attached."""
+        print(
+            f"Session {self.session_name(branch)} is headless and can't be attached; "
+            "use 'fleet logs' and 'fleet prompt' instead"
+        )
+
+    def kill_session(self, branch: str) -> bool:
+        """Kill a headless session."""
+        return self.kill_sessions([self.session_name(branch)])
+
+    def kill_sessions(self, session_names: List[str]) -> bool:
+        """Kill several headless sessions in one request."""
+        if not session_names:
+            return True
+        reply = self._request({"op": "kill", "names": session_names})
+        if not reply or not reply["ok"]:
+            error = reply["error"] if reply else "supervisor not running"
+            print(f"Failed to kill sessions: {error}")
+            return False
+        return True
+
+    def list_sessions(self) -> List[Tuple[str, Optional[int]]]:
+        """List all AI Fleet headless sessions.
+
+        Also records activity times and the supervisor PID, like the tmux
+        snapshot does.
+
+        Returns:
+            List of (session_name, pid) tuples
+        """
+        sessions, supervisor = self._sessions()
+        sessions = [s for s in sessions if s[0].startswith(self.prefix)]
+        self._activity = {name: activity for name, _, activity in sessions}
+        self._server_pids = [supervisor] if supervisor else []
+        self._evict_status_cache(set(self._activity))
+        return [(name, pid) for name, pid, _ in sessions]
+
+    def pipe_output(self, branch: str, shell_command: str) -> bool:
+        """Not needed: headless output always goes to a log file."""
+        return False
+
+    def install_event_hooks(self, branch: str, log_path: str, idle_after: int) -> bool:
+        """Have the supervisor record the session's idle/active/closed events."""
+        reply = self._request(
+            {
+                "op": "events",
+                "name": self.session_name(branch),
+                "log": log_path,
+                "idle_after": idle_after,
+            }
+        )
+        return bool(reply and reply["ok"])
+
+    def remove_event_hooks(self, log_path: str) -> bool:
+        """Not needed: the supervisor's hooks end with their sessions."""
+        return True
+
+    def session_exists(self, branch: str) -> bool:
+        """Check if a session exists."""
+        session_name = self.session_name(branch)
+        return any(name == session_name for name, _, _ in self._sessions()[0])
+
+    def get_pane_content(self, branch: str) -> Optional[str]:
+        """Get the last screenful of output for status detection."""
+        return self.get_session_output(branch, PTY_ROWS)
+
+    def prefetch_panes(self, branches: List[str]) -> None:
+        """Not needed: reading a session log doesn't start a process."""
+
+    def get_session_info(self, branch: str) -> Optional[dict]:
+        """Get detailed session information.
+
+        Args:
+            branch: Branch name
+
+        Returns:
+            Session info dict or None
+        """
+        session_name = self.session_name(branch)
+        for name, pid, _ in self._sessions()[0]:
+            if name == session_name:
+                return {
+                    "name": name,
+                    "created": "",
+                    "attached": False,
+                    "windows": 1,
+                    "pid": pid,
+                }
+        return None
+
+
+def main() -> None:
+    """Run the supervisor for the run directory given as the only argument."""
+    directory = Path(sys.argv[1])
+    directory.mkdir(parents=True, exist_ok=True)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    Supervisor(directory).serve()
+
+
+if __name__ == "__main__":
+    main()
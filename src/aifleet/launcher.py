@@ -0,0 +1,170 @@
+"""Agent process launching for AI Fleet."""
+
+import os
+import shlex
+from typing import Dict, List, Optional
+
+from .caches import cache_environment
+from .config import ConfigManager
+from .events import event_log_path, rotate_event_log
+from .scrollback import spill_command, spill_dir
+from .tmux import TmuxManager
+
+# Variables an agent always receives in direct launch mode
+BASE_ENVIRONMENT = [
+    "HOME",
+    "USER",
+    "LOGNAME",
+    "PATH",
+    "SHELL",
+    "TERM",
+    "LANG",
+    "LC_ALL",
+    "TMPDIR",
+]
+
+# Runs the agent, then replaces itself with the user's shell once it exits
+FALLBACK_SCRIPT = '"$@"; exec "${SHELL:-/bin/sh}"'
+
+
+def build_agent_argv(agent: str, flags: str, prompt: Optional[str] = None) -> List[str]:
+    """Build the argument vector for an agent.
+
+    Args:
+        agent: Agent command (e.g. 'claude')
+        flags: Extra flags, only applied to claude
+        prompt: Optional initial prompt, passed as a single argument
+
+    Returns:
+        Argument list
+    """
+    argv = [agent]
+    if flags and agent == "claude":
+        argv.extend(shlex.split(flags))
+    if prompt:
+        argv.append(prompt)
+    return argv
+
+
+def agent_environment(
+    passthrough: List[str], extra: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """Build the minimal environment for a directly launched agent.
+
+    Args:
+        passthrough: Additional variable names to copy from this process
+        extra: Variables to set explicitly
+
+    Returns:
+        Environment mapping
+    """
+    env = {
+        name: os.environ[name]
+        for name in BASE_ENVIRONMENT + passthrough
+        if name in os.environ
+    }
+    env.update(extra or {})
+    return env
+
+
+def direct_command(
+    argv: List[str], env: Dict[str, str], fallback_shell: bool = True
+) -> str:
+    """Build a session command that execs the agent with a controlled env.
+
+    Every argument is quoted individually, so prompt text never passes
+    through an interactive shell.
+
+    Args:
+        argv: Agent argument vector
+        env: Complete environment for the agent
+        fallback_shell: Leave a shell behind after the agent exits
+
+    Returns:
+        Shell-safe command string for tmux
+    """
+    command = ["env", "-i"] + [f"{k}={v}" for k, v in sorted(env.items())]
+    if fallback_shell:
+        command += ["/bin/sh", "-c", FALLBACK_SCRIPT, "aifleet"]
+    return shlex.join(command + argv)
+
+
+def spill_output(tmux: TmuxManager, config: ConfigManager, branch: str) -> bool:
+    """Stream a session's output into compressed on-disk segments.
+
+    Args:
+        tmux: Tmux manager
+        config: Project configuration
+        branch: Branch name
+
+    Returns:
+        True if output is being spilled
+    """
+    directory = spill_dir(config.repo_root, tmux.session_name(branch))
+    return tmux.pipe_output(
+        branch,
+        spill_command(directory, config.spill_segment_bytes, config.spill_max_segments),
+    )
+
+
+def launch_agent(
+    tmux: TmuxManager,
+    config: ConfigManager,
+    branch: str,
+    worktree: str,
+    agent: str,
+    prompt: Optional[str] = None,
+) -> bool:
+    """Create the agent's tmux session and start the agent in it.
+
+    In ``direct`` launch mode the agent is the session's initial process,
+    so no interactive shell rc has to load first. In ``shell`` mode the
+    command is typed into a regular shell, as before. Shared cache
+    variables are set for the agent in either mode. With event hooks
+    enabled, tmux then records the session's idle/active/closed events.
+
+    Args:
+        tmux: Tmux manager
+        config: Project configuration
+        branch: Branch name
+        worktree: Worktree path
+        agent: Agent command
+        prompt: Optional initial prompt
+
+    Returns:
+        True if the session was created and the agent started
+    """
+    argv = build_agent_argv(agent, config.claude_flags, prompt)
+    caches = cache_environment(config)
+
+    history_limit = config.history_limit
+
+    if config.launch_mode == "direct":
+        env = agent_environment(config.env_passthrough, caches)
+        command = direct_command(argv, env, config.fallback_shell)
+        if not tmux.create_session(
+            branch, worktree, command=command, history_limit=history_limit
+        ):
+            return False
+        if config.spill_logs:
+            spill_output(tmux, config, branch)
+    else:
+        if not tmux.create_session(branch, worktree, history_limit=history_limit):
+            return False
+        # Start spilling before the agent produces any output
+        if config.spill_logs:
+            spill_output(tmux, config, branch)
+        command = shlex.join(argv)
+        if caches:
+            # Exported, so the shell left after the agent uses them too
+            exports = [f"{k}={v}" for k, v in sorted(caches.items())]
+            command = f"{shlex.join(['export', *exports])}; {command}"
+        if not tmux.send_command(branch, command):
+            return False
+
+    if config.event_hooks:
+        # Events are a convenience; the agent is running either way
+        log_path = event_log_path(config.repo_root)
+        rotate_event_log(log_path)
+        tmux.install_event_hooks(branch, str(log_path), int(config.idle_after))
+    return True
@@ -0,0 +1,341 @@
+"""Repository maintenance for fleet-heavy repositories.
+
+Every agent leaves a branch, a ``.git/worktrees`` admin directory and
+loose objects from its commits behind. Once thousands have come and
+gone, ref lookups and ``for-each-ref`` slow down for everyone. A
+maintenance run prunes stale worktree admin directories, expires the
+reflogs of killed agents' branches, packs refs, repacks incrementally and
+writes a commit-graph, recording timings and before/after counts.
+
+Runs are started by ``fleet maintenance`` or, with ``schedule = "auto"``,
+in the background by ``fleet kill`` once enough agents were killed or the
+interval has passed since the last run.
+"""
+
+import fcntl
+import json
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import ConfigManager
+from .worktree import WorktreeManager
+
+# Steps run after the reflogs are expired, in order
+MAINTENANCE_STEPS = [
+    ("pack-refs", ["pack-refs", "--all", "--prune"]),
+    ("repack", ["repack", "--geometric=2", "-d", "-l", "-q"]),
+    (
+        "commit-graph",
+        ["commit-graph", "write", "--reachable", "--split", "--changed-paths"],
+    ),
+]
+
+
+@dataclass
+class MaintenanceStep:
+    """Outcome of one maintenance step."""
+
+    name: str
+    seconds: float
+    ok: bool
+    error: str = ""
+
+
+@dataclass
+class MaintenanceRun:
+    """Record of one maintenance run."""
+
+    started: float
+    trigger: str
+    steps: List[MaintenanceStep] = field(default_factory=list)
+    before: Dict[str, int] = field(default_factory=dict)
+    after: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every step succeeded."""
+        return all(step.ok for step in self.steps)
+
+    @property
+    def seconds(self) -> float:
+        """Total time spent in the steps."""
+        return sum(step.seconds for step in self.steps)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MaintenanceRun":
+        """Create a run record from its logged form."""
+        steps = [MaintenanceStep(**step) for step in data.get("steps", [])]
+        return cls(
+            started=data["started"],
+            trigger=data["trigger"],
+            steps=steps,
+            before=data.get("before", {}),
+            after=data.get("after", {}),
+        )
+
+
+def schedule_path(project_root: Path) -> Path:
+    """Get the file tracking kills and the last run for a project."""
+    return project_root / ".aifleet" / "maintenance.json"
+
+
+def history_path(project_root: Path) -> Path:
+    """Get the log of past maintenance runs for a project."""
+    return project_root / ".aifleet" / "maintenance.log"
+
+
+def load_schedule(project_root: Path) -> Dict[str, Any]:
+    """Load the maintenance schedule state.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Dict with ``last_run`` (unix time, 0 if never), ``kills`` since
+        then and the killed agents' ``branches``
+    """
+    schedule: Dict[str, Any] = {"last_run": 0, "kills": 0, "branches": []}
+    try:
+        with open(schedule_path(project_root)) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            schedule.update(data)
+    except (OSError, ValueError):
+        pass
+    return schedule
+
+
+def save_schedule(project_root: Path, schedule: Dict[str, Any]) -> None:
+    """Save the maintenance schedule state atomically."""
+    path = schedule_path(project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_suffix(".tmp")
+    with open(temp_file, "w") as f:
+        json.dump(schedule, f, indent=2)
+    temp_file.rename(path)
+
+
+def record_kills(project_root: Path, count: int, branches: List[str]) -> Dict[str, Any]:
+    """Count killed agents towards the next maintenance run.
+
+    Args:
+        project_root: Project root directory
+        count: Number of agents killed
+        branches: Killed agents' branches that were kept
+
+    Returns:
+        Updated schedule state
+    """
+    schedule = load_schedule(project_root)
+    schedule["kills"] += count
+    known = set(schedule["branches"])
+    schedule["branches"] += [b for b in branches if b not in known]
+    save_schedule(project_root, schedule)
+    return schedule
+
+
+def due_reason(
+    schedule: Dict[str, Any],
+    interval: float,
+    after_kills: int,
+    now: Optional[float] = None,
+) -> Optional[str]:
+    """Check whether a maintenance run is due.
+
+    Args:
+        schedule: Schedule state from ``load_schedule``
+        interval: Seconds between scheduled runs (0 = never)
+        after_kills: Killed agents that trigger a run (0 = never)
+        now: Current unix time
+
+    Returns:
+        Why a run is due, or None
+    """
+    now = time.time() if now is None else now
+    if after_kills and schedule["kills"] >= after_kills:
+        return f"{schedule['kills']} kills"
+    if interval and schedule["kills"] and now - schedule["last_run"] >= interval:
+        return "schedule"
+    return None
+
+
+def repo_stats(worktree: WorktreeManager) -> Dict[str, int]:
+    """Count what maintenance cleans up.
+
+    Args:
+        worktree: Worktree manager for the repository
+
+    Returns:
+        Counts of refs, loose refs, loose objects, packs and worktree
+        admin directories, plus the packs' size in KiB
+    """
+    stats: Dict[str, int] = {}
+
+    success, stdout, _ = worktree._run_git(["for-each-ref", "--format=%(refname)"])
+    if success:
+        stats["refs"] = len(stdout.splitlines())
+
+    success, stdout, _ = worktree._run_git(["count-objects", "-v"])
+    if success:
+        counts = dict(
+            line.split(": ", 1) for line in stdout.splitlines() if ": " in line
+        )
+        stats["loose_objects"] = int(counts.get("count", 0))
+        stats["packs"] = int(counts.get("packs", 0))
+        stats["pack_kib"] = int(counts.get("size-pack", 0))
+
+    success, stdout, _ = worktree._run_git(["rev-parse", "--git-common-dir"])
+    if success:
+        common = worktree.repo_root / stdout.strip()
+        refs = common / "refs"
+        stats["loose_refs"] = sum(1 for p in refs.rglob("*") if p.is_file())
+        admin = common / "worktrees"
+        stats["worktree_admin"] = (
+            sum(1 for p in admin.iterdir() if p.is_dir()) if admin.is_dir() else 0
+        )
+
+    return stats
+
+
+def _step(worktree: WorktreeManager, name: str, args: List[str]) -> MaintenanceStep:
+    start = time.perf_counter()
+    success, _, stderr = worktree._run_git(args)
+    seconds = round(time.perf_counter() - start, 3)
+    return MaintenanceStep(name, seconds, success, "" if success else stderr.strip())
+
+
+def run_maintenance(
+    worktree: WorktreeManager, branches: List[str], trigger: str = "manual"
+) -> MaintenanceRun:
+    """Run every maintenance step on the repository.
+
+    Args:
+        worktree: Worktree manager for the repository
+        branches: Fleet-owned branches whose reflogs are expired
+        trigger: Why the run was started, for the record
+
+    Returns:
+        Record of the run
+    """
+    run = MaintenanceRun(started=time.time(), trigger=trigger)
+    run.before = repo_stats(worktree)
+
+    run.steps.append(_step(worktree, "worktree prune", ["worktree", "prune"]))
+
+    # Only branches that still exist have a reflog left to expire
+    _, stdout, _ = worktree._run_git(
+        ["for-each-ref", "--format=%(refname)", "refs/heads/"]
+    )
+    existing = set(stdout.splitlines())
+    refs = [f"refs/heads/{b}" for b in branches if f"refs/heads/{b}" in existing]
+    if refs:
+        expire = ["reflog", "expire", "--expire=now", "--expire-unreachable=now"]
+        run.steps.append(_step(worktree, "reflog expire", expire + refs))
+
+    for name, args in MAINTENANCE_STEPS:
+        run.steps.append(_step(worktree, name, args))
+
+    run.after = repo_stats(worktree)
+    return run
+
+
+def read_history(
+    project_root: Path, limit: Optional[int] = None
+) -> List[MaintenanceRun]:
+    """Read recorded maintenance runs.
+
+    Args:
+        project_root: Project root directory
+        limit: Only return the last N runs
+
+    Returns:
+        Runs, oldest first
+    """
+    path = history_path(project_root)
+    if not path.exists():
+        return []
+
+    runs = []
+    with open(path, errors="replace") as f:
+        for line in f:
+            try:
+                runs.append(MaintenanceRun.from_dict(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                continue
+    return runs[-limit:] if limit else runs
+
+
+def maintain(
+    project_root: Path, worktree: WorktreeManager, trigger: str = "manual"
+) -> Optional[MaintenanceRun]:
+    """Run maintenance unless another run holds the lock, and record it.
+
+    Args:
+        project_root: Project root directory
+        worktree: Worktree manager for the repository
+        trigger: Why the run was started
+
+    Returns:
+        Record of the run, or None if a run is already in progress
+    """
+    lock_path = project_root / ".aifleet" / "maintenance.lock"
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "w") as lock:
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+
+        schedule = load_schedule(project_root)
+        run = run_maintenance(worktree, schedule["branches"], trigger)
+
+        with open(history_path(project_root), "a") as f:
+            f.write(json.dumps(asdict(run)) + "\n")
+
+        # Kills recorded while the run was in progress count towards the next
+        latest = load_schedule(project_root)
+        save_schedule(
+            project_root,
+            {
+                "last_run": run.started,
+                "kills": max(0, latest["kills"] - schedule["kills"]),
+                "branches": [
+                    b for b in latest["branches"] if b not in schedule["branches"]
+                ],
+            },
+        )
+    return run
+
+
+def start_background(project_root: Path) -> None:
+    """Start a detached process that runs maintenance if it is still due."""
+    log = project_root / ".aifleet" / "maintenance.err"
+    with open(log, "ab") as errors:
+        subprocess.Popen(
+            [sys.executable, "-m", "aifleet.maintenance", str(project_root)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=errors,
+            start_new_session=True,
+        )
+
+
+def main() -> None:
+    """Run a due maintenance for the project root given as the only argument."""
+    config = ConfigManager(Path(sys.argv[1]))
+    reason = due_reason(
+        load_schedule(config.repo_root),
+        config.maintenance_interval,
+        config.maintenance_after_kills,
+    )
+    if reason:
+        worktree = WorktreeManager(config.repo_root, config.worktree_root)
+        maintain(config.repo_root, worktree, trigger=reason)
+
+
+if __name__ == "__main__":
+    main()
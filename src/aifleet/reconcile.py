@@ -0,0 +1,262 @@
+"""Reconciliation of fleet state with tmux sessions and git worktrees."""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .config import ConfigManager
+from .launcher import launch_agent
+from .scrollback import remove_spill
+from .state import Agent, StateManager
+from .tmux import TmuxManager
+from .worktree import WorktreeManager
+
+
+@dataclass
+class FleetSnapshot:
+    """One consistent read of state, tmux and (optionally) git worktrees."""
+
+    agents: List[Agent]
+    sessions: Dict[str, Optional[int]]  # session name -> pane pid
+    worktrees: Optional[Dict[str, str]] = None  # resolved path -> branch
+    # session name -> working directory; sessions without one are taken to
+    # belong to the project (the headless backend runs one server per project)
+    session_paths: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ReconcileReport:
+    """Mismatches between state, tmux sessions and git worktrees."""
+
+    healthy: List[Agent] = field(default_factory=list)
+    # In state with a worktree, but the session is gone
+    dead: List[Agent] = field(default_factory=list)
+    # In state, but the worktree is gone
+    missing_worktree: List[Agent] = field(default_factory=list)
+    # Fleet session plus matching fleet worktree, neither in state
+    adoptable: List[Tuple[str, str, str]] = field(default_factory=list)
+    # Fleet sessions without a state record or worktree
+    orphan_sessions: List[str] = field(default_factory=list)
+    # (path, branch) worktrees under worktree_root without a state record
+    orphan_worktrees: List[Tuple[str, str]] = field(default_factory=list)
+    # Session names that were alive when the snapshot was taken
+    live_sessions: Set[str] = field(default_factory=set)
+
+    @property
+    def is_clean(self) -> bool:
+        """True if state, tmux and git all agree."""
+        return not (
+            self.dead
+            or self.missing_worktree
+            or self.adoptable
+            or self.orphan_sessions
+            or self.orphan_worktrees
+        )
+
+
+def _resolve(path: str) -> str:
+    """Normalize a path for comparison with git's worktree list."""
+    return os.path.realpath(path)
+
+
+def compute_report(
+    snapshot: FleetSnapshot,
+    tmux: TmuxManager,
+    worktree_root: Optional[Path] = None,
+) -> ReconcileReport:
+    """Compute all mismatches in a snapshot.
+
+    Every lookup is a set or dict operation, so this is linear in the
+    number of agents, sessions and worktrees.
+
+    A session no agent record knows about only counts as an orphan when
+    it runs below ``worktree_root``: the tmux server may be shared with
+    other projects that use the same session prefix.
+
+    Args:
+        snapshot: Snapshot to analyse
+        tmux: Manager used to map branches to session names
+        worktree_root: Only worktrees and sessions below this directory
+            count as fleet-owned
+
+    Returns:
+        Reconciliation report
+    """
+    report = ReconcileReport(live_sessions=set(snapshot.sessions))
+    known_sessions = set()
+    known_worktrees = set()
+
+    for agent in snapshot.agents:
+        known_sessions.add(agent.session)
+        worktree = _resolve(agent.worktree) if agent.worktree else ""
+        known_worktrees.add(worktree)
+
+        if snapshot.worktrees is not None and worktree not in snapshot.worktrees:
+            report.missing_worktree.append(agent)
+        elif agent.session not in snapshot.sessions:
+            report.dead.append(agent)
+        else:
+            report.healthy.append(agent)
+
+    root = _resolve(str(worktree_root)) + os.sep if worktree_root else None
+
+    def owned(session: str) -> bool:
+        path = snapshot.session_paths.get(session)
+        if path is None:
+            return True
+        return root is not None and (_resolve(path) + os.sep).startswith(root)
+
+    orphan_sessions = {
+        s for s in snapshot.sessions if s not in known_sessions and owned(s)
+    }
+
+    if snapshot.worktrees is not None:
+        for path, branch in snapshot.worktrees.items():
+            if path in known_worktrees:
+                continue
+            if root is None or not path.startswith(root):
+                continue
+
+            session = tmux.session_name(branch)
+            if session in orphan_sessions:
+                orphan_sessions.discard(session)
+                report.adoptable.append((session, path, branch))
+            else:
+                report.orphan_worktrees.append((path, branch))
+
+    report.orphan_sessions = sorted(orphan_sessions)
+    return report
+
+
+class Reconciler:
+    """Detects and fixes drift between state, tmux and git worktrees."""
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        state: StateManager,
+        tmux: TmuxManager,
+        worktree: Optional[WorktreeManager] = None,
+    ):
+        """Initialize reconciler.
+
+        Args:
+            config: Project configuration
+            state: State manager
+            tmux: Tmux manager
+            worktree: Worktree manager (required for worktree checks)
+        """
+        self.config = config
+        self.state = state
+        self.tmux = tmux
+        self.worktree = worktree
+
+    def snapshot(self, include_worktrees: bool = True) -> FleetSnapshot:
+        """Take one tmux snapshot, one worktree listing and one state read.
+
+        Args:
+            include_worktrees: Also run ``git worktree list``
+
+        Returns:
+            Fleet snapshot
+        """
+        sessions = dict(self.tmux.list_sessions())
+        agents = self.state.list_agents()
+
+        worktrees = None
+        if include_worktrees and self.worktree is not None:
+            worktrees = {
+                _resolve(path): branch.replace("refs/heads/", "", 1)
+                for path, branch in self.worktree.list_worktrees()
+            }
+
+        return FleetSnapshot(
+            agents=agents,
+            sessions=sessions,
+            worktrees=worktrees,
+            session_paths=self.tmux.session_paths(),
+        )
+
+    def report(self, snapshot: Optional[FleetSnapshot] = None) -> ReconcileReport:
+        """Compute the reconciliation report for a snapshot.
+
+        Args:
+            snapshot: Snapshot to use (a fresh one is taken if None)
+
+        Returns:
+            Reconciliation report
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        return compute_report(snapshot, self.tmux, self.config.worktree_root)
+
+    def adopt(self, report: ReconcileReport) -> List[str]:
+        """Add orphaned session/worktree pairs to state.
+
+        Returns:
+            Adopted branches
+        """
+        now = datetime.now()
+        agents = [
+            Agent(
+                branch=branch,
+                worktree=path,
+                session=session,
+                batch_id=f"adopted-{now.strftime('%Y%m%d')}",
+                agent=self.config.default_agent,
+                created_at=now.isoformat(),
+            )
+            for session, path, branch in report.adoptable
+        ]
+        self.state.add_agents(agents)
+        return [a.branch for a in agents]
+
+    def repair(self, report: ReconcileReport) -> List[str]:
+        """Restart the agent in a fresh session for every dead agent.
+
+        Returns:
+            Repaired branches
+        """
+        repaired = []
+
+        for agent in report.dead:
+            if launch_agent(
+                self.tmux, self.config, agent.branch, agent.worktree, agent.agent
+            ):
+                repaired.append(agent.branch)
+
+        return repaired
+
+    def collect_garbage(self, report: ReconcileReport) -> List[str]:
+        """Remove stale records, orphaned sessions and orphaned worktrees.
+
+        Returns:
+            Human-readable descriptions of what was removed
+        """
+        collected: List[str] = []
+
+        stale = report.dead + report.missing_worktree
+        for branch in self.state.remove_agents(a.branch for a in stale):
+            collected.append(f"state record {branch}")
+        for agent in stale:
+            remove_spill(self.config.repo_root, agent.session)
+
+        sessions = list(report.orphan_sessions)
+        sessions.extend(
+            a.session
+            for a in report.missing_worktree
+            if a.session in report.live_sessions
+        )
+        if sessions and self.tmux.kill_sessions(sessions):
+            collected.extend(f"session {s}" for s in sessions)
+            for session in sessions:
+                remove_spill(self.config.repo_root, session)
+
+        if report.orphan_worktrees and self.worktree is not None:
+            paths = [Path(path) for path, _ in report.orphan_worktrees]
+            for path in self.worktree.remove_worktrees(paths):
+                collected.append(f"worktree {path}")
+
+        return collected
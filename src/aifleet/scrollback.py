@@ -0,0 +1,299 @@
+"""On-disk spill of agent output for AI Fleet.
+
+tmux keeps each pane's scrollback in server memory. With spilling
+enabled, ``pipe-pane`` also streams the pane's output into a per-session
+directory: the newest data goes to ``current.log`` and every full segment
+is gzip-compressed into ``seg-<time>-<n>.gz``. tmux's own history can
+then stay small while the full output remains readable on disk. Only
+the newest segments are kept, and a session's directory is removed when
+the agent is killed.
+
+The spill is the raw terminal stream. Output that moves the cursor, as
+full-screen agents do, is replayed in a throwaway tmux server to read it
+back as it appeared on screen.
+"""
+
+import gzip
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+# Reads stdin in fixed-size chunks; each full chunk is compressed into a
+# segment, the chunk being filled stays readable as current.log. Beyond
+# $3 segments (0 = no limit) the oldest are deleted.
+SPILL_SCRIPT = """
+cd "$1" || exit 1
+size=$2
+keep=$3
+i=0
+while :; do
+  head -c "$size" > current.log
+  [ -s current.log ] || break
+  seg="seg-$(date +%Y%m%d%H%M%S)-$(printf %06d "$i").gz"
+  gzip -c current.log > "$seg.tmp" && mv "$seg.tmp" "$seg" && : > current.log
+  i=$((i + 1))
+  if [ "$keep" -gt 0 ]; then
+    set -- seg-*.gz
+    while [ "$#" -gt "$keep" ]; do
+      rm -f "$1"
+      shift
+    done
+  fi
+done
+"""
+
+# Cursor movement, erasing and scroll regions: output that only makes
+# sense rendered on a screen
+_CURSOR = re.compile(r"\x1b\[[0-9;?]*[ABCDEFGHJKSTdfr]")
+
+# Alternate screen switches; replayed output stays on the main screen so
+# that it reaches the scrollback
+_ALT_SCREEN = re.compile(r"\x1b\[\?(?:47|1047|1049)[hl]")
+
+# Terminal size assumed when the session's pane is gone
+DEFAULT_PANE_SIZE = (200, 50)
+
+# Scrollback lines of the tmux server used for rendering
+RENDER_HISTORY = 100000
+
+# Seconds to wait for a replay to finish
+RENDER_TIMEOUT = 30
+
+# Terminal control sequences (CSI, OSC and two-byte escapes)
+_ANSI = re.compile(
+    r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(\x07|\x1b\\)|\x1b[@-Z\\-_]"
+)
+
+
+def spill_dir(project_root: Path, session: str) -> Path:
+    """Get the spill directory for a session.
+
+    Args:
+        project_root: Project root directory
+        session: Full tmux session name
+
+    Returns:
+        Directory holding the session's segments
+    """
+    return project_root / ".aifleet" / "logs" / session
+
+
+def remove_spill(project_root: Path, session: str) -> None:
+    """Delete a session's spilled output.
+
+    Args:
+        project_root: Project root directory
+        session: Full tmux session name
+    """
+    shutil.rmtree(spill_dir(project_root, session), ignore_errors=True)
+
+
+def spill_command(directory: Path, segment_bytes: int, max_segments: int = 0) -> str:
+    """Build the ``pipe-pane`` shell command that spills into a directory.
+
+    Args:
+        directory: Spill directory (created if missing)
+        segment_bytes: Uncompressed size of each segment
+        max_segments: Segments kept before the oldest are deleted (0 = all)
+
+    Returns:
+        Shell command, escaped for tmux
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    command = shlex.join(
+        [
+            "sh",
+            "-c",
+            SPILL_SCRIPT,
+            "aifleet-spill",
+            str(directory),
+            str(segment_bytes),
+            str(max_segments),
+        ]
+    )
+    # tmux runs the command through strftime before starting it
+    return command.replace("%", "%%")
+
+
+def clean_output(text: str) -> str:
+    """Strip terminal control sequences from raw pane output."""
+    text = _ANSI.sub("", text)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_spilled(directory: Path, lines: int) -> str:
+    """Read the newest spilled output, raw, covering at least some lines.
+
+    Segments are read newest first and only until enough lines are found.
+
+    Args:
+        directory: Spill directory
+        lines: Number of lines wanted
+
+    Returns:
+        Raw terminal output, oldest first ("" if nothing was spilled)
+    """
+    if not directory.is_dir():
+        return ""
+
+    chunks: List[str] = []
+    current = directory / "current.log"
+    if current.exists():
+        # newline="" keeps carriage returns, which position the cursor
+        with open(current, errors="replace", newline="") as f:
+            chunks.append(f.read())
+
+    segments = sorted(directory.glob("seg-*.gz"), reverse=True)
+    for segment in [None, *segments]:
+        if segment is not None:
+            try:
+                with gzip.open(segment, "rt", errors="replace", newline="") as f:
+                    chunks.insert(0, f.read())
+            except (OSError, EOFError):
+                # Deleted by the size cap since it was listed
+                break
+        if len(clean_output("".join(chunks)).splitlines()) > lines:
+            break
+
+    return "".join(chunks)
+
+
+def tail_spilled(directory: Path, lines: int) -> List[str]:
+    """Read the last lines of a session's spilled output.
+
+    Args:
+        directory: Spill directory
+        lines: Number of lines wanted
+
+    Returns:
+        Up to ``lines`` lines, oldest first
+    """
+    collected = clean_output(read_spilled(directory, lines)).splitlines()
+    return collected[-lines:] if lines > 0 else []
+
+
+def needs_rendering(raw: str) -> bool:
+    """Check whether output moves the cursor, so stripping escapes garbles it."""
+    return _CURSOR.search(raw) is not None
+
+
+def render_output(raw: str, width: int, height: int) -> Optional[List[str]]:
+    """Replay raw terminal output in a throwaway tmux server.
+
+    Args:
+        raw: Raw terminal output
+        width: Columns of the terminal the output was written for
+        height: Rows of that terminal
+
+    Returns:
+        Lines as they appeared, scrollback included, or None if the
+        output couldn't be rendered
+    """
+    if not shutil.which("tmux"):
+        return None
+
+    fd, path = tempfile.mkstemp(prefix="aifleet-render-", suffix=".log")
+    with os.fdopen(fd, "w", errors="replace") as f:
+        f.write(_ALT_SCREEN.sub("", raw))
+
+    channel = f"aifleet-render-{os.getpid()}"
+    tmux = ["tmux", "-L", channel, "-f", os.devnull]
+    replay = f"cat {shlex.quote(path)}; tmux wait-for -S {channel}; exec sleep 60"
+    try:
+        subprocess.run(
+            [
+                *tmux,
+                "start-server",
+                ";",
+                "set-option",
+                "-g",
+                "history-limit",
+                str(RENDER_HISTORY),
+                ";",
+                "new-session",
+                "-d",
+                "-x",
+                str(width),
+                "-y",
+                str(height),
+                replay,
+            ],
+            capture_output=True,
+            check=True,
+            timeout=RENDER_TIMEOUT,
+        )
+        subprocess.run(
+            [*tmux, "wait-for", channel],
+            capture_output=True,
+            check=True,
+            timeout=RENDER_TIMEOUT,
+        )
+        result = subprocess.run(
+            [*tmux, "capture-pane", "-p", "-J", "-S", "-", "-E", "-"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=RENDER_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    finally:
+        subprocess.run([*tmux, "kill-server"], capture_output=True)
+        os.unlink(path)
+
+    rendered = [line.rstrip() for line in result.stdout.splitlines()]
+    while rendered and not rendered[-1]:
+        rendered.pop()
+    return rendered
+
+
+def spilled_lines(
+    directory: Path,
+    lines: int,
+    pane_size: Callable[[], Optional[Tuple[int, int]]] = lambda: None,
+) -> List[str]:
+    """Read the last lines of a session's spilled output, as displayed.
+
+    Args:
+        directory: Spill directory
+        lines: Number of lines wanted
+        pane_size: Gets the session pane's (columns, rows), only called when
+            the output has to be rendered
+
+    Returns:
+        Up to ``lines`` lines, oldest first
+    """
+    raw = read_spilled(directory, lines)
+    rendered = None
+    if needs_rendering(raw):
+        width, height = pane_size() or DEFAULT_PANE_SIZE
+        rendered = render_output(raw, width, height)
+    if rendered is None:
+        rendered = clean_output(raw).splitlines()
+    return rendered[-lines:] if lines > 0 else []
+
+
+def stitch_output(older: List[str], newer: List[str]) -> List[str]:
+    """Join two views of the same output, dropping the lines they share.
+
+    The longest run of lines ending ``older`` that also starts ``newer`` is
+    kept once. Trailing whitespace is ignored, since tmux trims it.
+
+    Args:
+        older: Earlier output, e.g. from the spill
+        newer: Later output, e.g. tmux's live scrollback
+
+    Returns:
+        Combined lines
+    """
+    old = [line.rstrip() for line in older]
+    new = [line.rstrip() for line in newer]
+    for overlap in range(min(len(old), len(new)), 0, -1):
+        if old[-overlap:] == new[:overlap]:
+            return older + newer[overlap:]
+    return older + newer
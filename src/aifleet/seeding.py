@@ -0,0 +1,77 @@
+"""Seeding new worktrees with build outputs from an existing checkout.
+
+A fresh worktree has no build artifacts, so an agent's first build is a
+cold one. ``setup.seed_paths`` lists build output paths (``target/``,
+``build/``, ``.next/cache``, ...) that are cloned from the main checkout,
+or from ``setup.seed_from``, into each new worktree before setup commands
+run. The first build then only redoes what differs.
+
+Files are reflinked where the filesystem supports it and copied
+otherwise. They are never hardlinked: build tools rewrite outputs in
+place, which would corrupt the seed for every other worktree. Modification
+times are preserved, and files the worktree already has are left alone.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Tuple
+
+from .credentials import clone_file
+
+
+def seed_path(src: Path, dst: Path) -> int:
+    """Clone a file or directory tree, skipping files that already exist.
+
+    Args:
+        src: Source file or directory
+        dst: Destination path
+
+    Returns:
+        Number of files and symlinks placed
+    """
+    if src.is_symlink() or not src.is_dir():
+        if os.path.lexists(dst):
+            return 0
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if src.is_symlink():
+            os.symlink(os.readlink(src), dst)
+        else:
+            clone_file(src, dst)
+        return 1
+
+    placed = 0
+    for root, dirs, files in os.walk(src):
+        target = dst / Path(root).relative_to(src)
+        target.mkdir(parents=True, exist_ok=True)
+        # Symlinked directories are listed but not walked into
+        links = [name for name in dirs if os.path.islink(os.path.join(root, name))]
+        for name in files + links:
+            placed += seed_path(Path(root) / name, target / name)
+    return placed
+
+
+def seed_outputs(
+    source_root: Path, target_root: Path, paths: List[str]
+) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """Seed build output paths from one checkout into another.
+
+    Args:
+        source_root: Checkout the outputs are taken from
+        target_root: New worktree
+        paths: Paths relative to the checkout root
+
+    Returns:
+        ((path, files placed) for each seeded path, paths not in the source)
+    """
+    seeded = []
+    missing = []
+    for path in paths:
+        src = source_root / path.rstrip("/")
+        if not os.path.lexists(src):
+            missing.append(path)
+            continue
+        try:
+            seeded.append((path, seed_path(src, target_root / path.rstrip("/"))))
+        except OSError as e:
+            print(f"Failed to seed {path}: {e}")
+    return seeded, missing
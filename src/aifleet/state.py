@@ -5,7 +5,7 @@ import json
 import os
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -20,6 +20,8 @@ class Agent:
     created_at: str
     pid: Optional[int] = None
     prompt: Optional[str] = None
+    # Commit the batch was branched from (set with --base)
+    base: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -126,6 +128,46 @@ class StateManager:
             return True
         return False
 
+    def add_agents(self, new_agents: Iterable[Agent]) -> None:
+        """Add several agents to state with a single write."""
+        records = {a.branch: a.to_dict() for a in new_agents}
+        if not records:
+            return
+
+        agents = [a for a in self._load_state() if a.get("branch") not in records]
+        agents.extend(records.values())
+
+        self._save_state(agents)
+
+    def remove_agents(self, branches: Iterable[str]) -> List[str]:
+        """Remove several agents from state with a single write.
+
+        Args:
+            branches: Branch names
+
+        Returns:
+            List of branches that were actually removed
+        """
+        targets = set(branches)
+        if not targets:
+            return []
+
+        agents = self._load_state()
+        kept: List[Dict[str, Any]] = []
+        removed: List[str] = []
+
+        for agent in agents:
+            branch = agent.get("branch")
+            if branch in targets:
+                removed.append(branch)
+            else:
+                kept.append(agent)
+
+        if removed:
+            self._save_state(kept)
+
+        return removed
+
     def get_agent(self, branch: str) -> Optional[Agent]:
         """Get agent by branch name."""
         agents = self._load_state()
@@ -201,22 +243,23 @@ class StateManager:
 
         return removed_count
 
-    def reconcile_with_tmux(self, active_sessions: List[str]) -> List[str]:
+    def reconcile_with_tmux(self, active_sessions: Iterable[str]) -> List[str]:
         """Reconcile state with actual tmux sessions.
 
         Args:
-            active_sessions: List of active tmux session names
+            active_sessions: Active tmux session names
 
         Returns:
             List of branches that were removed from state
         """
+        active = set(active_sessions)
         agents = self._load_state()
         removed_branches: List[str] = []
 
         # Filter out agents whose sessions no longer exist
         active_agents = []
         for agent in agents:
-            if agent.get("session") in active_sessions:
+            if agent.get("session") in active:
                 active_agents.append(agent)
             else:
                 branch = agent.get("branch")
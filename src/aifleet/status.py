@@ -0,0 +1,171 @@
+"""Incremental agent status detection for AI Fleet."""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import psutil
+
+from .tmux import TmuxManager
+
+
+@dataclass
+class PaneState:
+    """What was last learned about one session's pane."""
+
+    activity: int
+    status: str
+    checked_at: float
+    # Child processes of the pane when it was checked (None if unknown)
+    processes: Optional[FrozenSet[int]] = None
+
+
+def process_alive(pid: int) -> bool:
+    """Check whether a process exists and has not exited."""
+    try:
+        return bool(psutil.Process(pid).status() != psutil.STATUS_ZOMBIE)
+    except psutil.NoSuchProcess:
+        return False
+    except psutil.Error:
+        # Exists, but can't be inspected
+        return True
+
+
+def pane_processes(pid: int) -> Optional[FrozenSet[int]]:
+    """Get the processes running directly under a pane's process.
+
+    In shell launch mode the agent is the shell's child; in direct mode it
+    is the pane's process itself and these are the tools it runs.
+
+    Args:
+        pid: PID of the pane's process
+
+    Returns:
+        Child PIDs, or None if they can't be read
+    """
+    try:
+        return frozenset(child.pid for child in psutil.Process(pid).children())
+    except psutil.Error:
+        return None
+
+
+class StatusTracker:
+    """Classify agents cheaply from tmux activity timestamps.
+
+    ``TmuxManager.list_sessions`` records each session's last activity
+    time as part of its single ``list-panes`` snapshot. A pane is only
+    captured and scanned when that time moved since the previous check;
+    otherwise the previous status is reused, and a running agent that has
+    been silent for ``idle_after`` seconds is reported as idle.
+
+    Given the pane's PID, a session whose process has exited is dead, and
+    a change in the processes under the pane (such as the agent exiting
+    back to its shell) forces a capture even without new output.
+
+    Keep one tracker alive across refreshes (as ``fleet list --watch``
+    does) to benefit; a fresh tracker captures every pane once.
+    """
+
+    def __init__(self, tmux: TmuxManager, idle_after: float = 30.0):
+        """Initialize status tracker.
+
+        Args:
+            tmux: Tmux manager whose last snapshot provides activity times
+            idle_after: Seconds of silence after which running becomes idle
+        """
+        self.tmux = tmux
+        self.idle_after = idle_after
+        self.captures = 0
+        self.reused = 0
+        self._panes: Dict[str, PaneState] = {}
+
+    def status(
+        self,
+        branch: str,
+        session: str,
+        alive: bool,
+        now: Optional[float] = None,
+        pid: Optional[int] = None,
+    ) -> str:
+        """Get an agent's status, capturing its pane only when needed.
+
+        Args:
+            branch: Branch name
+            session: Full tmux session name
+            alive: Whether the session is in the current snapshot
+            now: Current Unix time (for tests)
+            pid: PID of the session's pane process, if known
+
+        Returns:
+            Status string: ready, running, idle, dead, or unknown
+        """
+        if not alive or (pid is not None and not process_alive(pid)):
+            self._panes.pop(session, None)
+            return "dead"
+
+        now = time.time() if now is None else now
+        activity = self.tmux.session_activity().get(session)
+        processes = pane_processes(pid) if pid is not None else None
+        previous = self._panes.get(session)
+
+        if (
+            activity is not None
+            and previous is not None
+            and self._unchanged(previous, activity)
+            and previous.processes == processes
+        ):
+            self.reused += 1
+            previous.status = self._aged(previous.status, activity, now)
+            return previous.status
+
+        self.captures += 1
+        status = self.tmux.get_agent_status(branch, alive=True)
+        if activity is not None:
+            status = self._aged(status, activity, now)
+            self._panes[session] = PaneState(activity, status, now, processes)
+        return status
+
+    def _aged(self, status: str, activity: int, now: float) -> str:
+        """Report a running agent that has been silent too long as idle."""
+        if status == "running" and now - activity >= self.idle_after:
+            return "idle"
+        return status
+
+    def _unchanged(self, previous: PaneState, activity: Optional[int]) -> bool:
+        """Whether a pane has certainly not changed since it was checked."""
+        # Activity has one-second resolution, so output in the same second
+        # as the last check may not be reflected yet; check again then
+        return previous.activity == activity and (
+            activity is not None and activity < int(previous.checked_at)
+        )
+
+    def prefetch(self, targets: List[Tuple[str, str]]) -> None:
+        """Capture, concurrently, the panes the next checks will need.
+
+        Args:
+            targets: (branch, session name) of live agents about to be checked
+        """
+        activity = self.tmux.session_activity()
+        branches = []
+        for branch, session in targets:
+            previous = self._panes.get(session)
+            if previous is None or not self._unchanged(previous, activity.get(session)):
+                branches.append(branch)
+        self.tmux.prefetch_panes(branches)
+
+    def summary(self) -> List[str]:
+        """Describe how much probing the caches saved.
+
+        Returns:
+            Footer lines (empty before the first check)
+        """
+        checks = self.reused + self.captures
+        if not checks:
+            return []
+        hits = self.tmux.status_cache_hits
+        scans = hits + self.tmux.status_cache_misses
+        hit_rate = 100 * hits / scans if scans else 0.0
+        return [
+            f"Probes: {self.reused}/{checks} skipped (no activity), "
+            f"{hits}/{scans} captures unchanged ({hit_rate:.0f}% hash hits)"
+        ]
@@ -1,42 +1,220 @@
 """Tmux session management for AI Fleet."""
 
+import asyncio
+import functools
+import hashlib
+import os
 import subprocess
-from typing import List, Optional, Tuple
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 import libtmux
 
+from . import aio
+
+# Socket base name used when sharding without an explicit socket_name
+DEFAULT_SHARD_SOCKET = "aifleet"
+
+# Fields read from every pane in one list-panes snapshot
+PANE_SNAPSHOT_FORMAT = (
+    "#{session_name}\t#{pane_pid}\t#{window_activity}\t#{pid}\t#{pane_current_path}"
+)
+
+# tmux errors meaning the session to kill is already gone
+_GONE_ERRORS = ("can't find session", "no server running", "error connecting")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def classify_pane(content: str) -> str:
+    """Classify an agent's state from its captured pane text.
+
+    Args:
+        content: Pane content
+
+    Returns:
+        Status string: ready, running or idle
+    """
+    running_patterns = [
+        "esc to interrupt",
+        "Thinking",
+        "I'll help",
+        "Let me",
+        "I'll ",
+        "I'm going to",
+        "I need to",
+        "I can see",
+        "Looking at",
+        "Searching for",
+        "Processing",
+        "Analyzing",
+    ]
+
+    if any(pattern.lower() in content.lower() for pattern in running_patterns):
+        return "running"
+
+    # Check if waiting for input
+    content_lines = content.strip().split("\n")
+    if content_lines:
+        last_line = content_lines[-1].strip()
+        # Check for common prompts
+        if last_line.endswith(("$", ">", ":", "?")) or "Human:" in content:
+            return "ready"
+
+    # Check for recent activity (if there's meaningful content)
+    if len(content.strip()) > 50:  # Some meaningful content
+        return "idle"
+
+    return "idle"
+
+
+def _closed_hook(log_path: str) -> str:
+    """Get the global session-closed hook slot used for an event log."""
+    return f"session-closed[{zlib.crc32(log_path.encode()) % 10000 + 100}]"
+
+
+def _per_branch(method: F) -> F:
+    """Route a per-branch method to the shard that owns the branch."""
+
+    @functools.wraps(method)
+    def wrapper(self: "TmuxManager", branch: str, *args: Any, **kwargs: Any) -> Any:
+        if self.shards:
+            shard = self.shard_for(self.session_name(branch))
+            return getattr(shard, method.__name__)(branch, *args, **kwargs)
+        return method(self, branch, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class TmuxManager:
     """Manages tmux sessions for AI agents."""
 
-    def __init__(self, prefix: str = "ai_"):
+    def __init__(
+        self,
+        prefix: str = "ai_",
+        socket_name: Optional[str] = None,
+        shard_count: int = 1,
+    ):
         """Initialize tmux manager.
 
         Args:
             prefix: Prefix for session names
+            socket_name: tmux socket name (``-L``); None uses the default server
+            shard_count: Number of tmux servers to spread sessions across
         """
         self.prefix = prefix
-        self.server = libtmux.Server()
+        self.socket_name = socket_name or None
+        self.shards: List["TmuxManager"] = []
+        self.server: libtmux.Server
+        self._activity: Dict[str, int] = {}
+        self._paths: Dict[str, str] = {}
+        self._server_pids: List[int] = []
+        self._status_cache: Dict[str, Tuple[bytes, str]] = {}
+        self._prefetched: Dict[str, Optional[str]] = {}
+        self.status_cache_hits = 0
+        self.status_cache_misses = 0
+        self._connect(shard_count)
+
+    def _connect(self, shard_count: int) -> None:
+        """Set up the tmux server, or one per shard.
+
+        Args:
+            shard_count: Number of tmux servers to spread sessions across
+        """
+        if shard_count > 1:
+            base = self.socket_name or DEFAULT_SHARD_SOCKET
+            self.shards = [
+                TmuxManager(self.prefix, f"{base}-{index}")
+                for index in range(shard_count)
+            ]
+            self.server = self.shards[0].server
+        else:
+            self.server = libtmux.Server(socket_name=self.socket_name)
+
+    def shard_for(self, session_name: str) -> "TmuxManager":
+        """Get the shard that owns a session.
+
+        Sessions are placed by a stable hash of their name, so every
+        process agrees on the placement without shared state.
+
+        Args:
+            session_name: Full tmux session name
+
+        Returns:
+            Manager for the owning shard (self when not sharded)
+        """
+        if not self.shards:
+            return self
+        index = zlib.crc32(session_name.encode()) % len(self.shards)
+        return self.shards[index]
+
+    def _fan_out(self, call: Callable[["TmuxManager"], Any]) -> List[Any]:
+        """Run a call against every shard in parallel.
+
+        Args:
+            call: Function taking a shard manager
+
+        Returns:
+            Results in shard order
+        """
+        with ThreadPoolExecutor(max_workers=len(self.shards)) as pool:
+            return list(pool.map(call, self.shards))
+
+    def _tmux(self, *commands: List[str]) -> List[str]:
+        """Build a tmux invocation running one or more chained commands.
 
-    def _session_name(self, branch: str) -> str:
-        """Generate session name from branch."""
-        # Replace problematic characters for tmux
-        safe_branch = branch.replace("/", "-").replace(":", "-")
+        Args:
+            commands: tmux commands, each as an argument list
+
+        Returns:
+            Argument list for subprocess
+        """
+        args = ["tmux"]
+        if self.socket_name:
+            args += ["-L", self.socket_name]
+        for index, command in enumerate(commands):
+            if index:
+                args.append(";")
+            args.extend(command)
+        return args
+
+    def session_name(self, branch: str) -> str:
+        """Get the session name for a branch.
+
+        Args:
+            branch: Branch name
+
+        Returns:
+            Prefixed session name with characters tmux rejects replaced
+        """
+        # Replace problematic characters for tmux, which would turn dots
+        # into underscores itself
+        safe_branch = branch.replace("/", "-").replace(":", "-").replace(".", "-")
         return f"{self.prefix}{safe_branch}"
 
+    @_per_branch
     def create_session(
-        self, branch: str, working_dir: str
+        self,
+        branch: str,
+        working_dir: str,
+        command: Optional[str] = None,
+        history_limit: int = 0,
     ) -> Optional[libtmux.Session]:
         """Create a new tmux session.
 
         Args:
             branch: Branch name
             working_dir: Working directory for the session
+            command: Initial command to run instead of the default shell
+            history_limit: Scrollback lines kept for the session's pane;
+                0 keeps the server's setting
 
         Returns:
             Created session or None if failed
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         # Check if session already exists
         try:
@@ -47,16 +225,55 @@ class TmuxManager:
         except Exception:
             pass
 
+        if history_limit > 0:
+            return self._create_limited_session(
+                session_name, working_dir, command, history_limit
+            )
+
         # Create new session
         try:
             session = self.server.new_session(
-                session_name=session_name, start_directory=working_dir, detach=True
+                session_name=session_name,
+                start_directory=working_dir,
+                window_command=command,
+                detach=True,
             )
             return session
         except Exception as e:
             print(f"Failed to create session: {e}")
             return None
 
+    def _create_limited_session(
+        self,
+        session_name: str,
+        working_dir: str,
+        command: Optional[str],
+        history_limit: int,
+    ) -> Optional[libtmux.Session]:
+        """Create a session whose pane has its own scrollback limit.
+
+        A pane takes its history limit when it is created, so the session's
+        first window is immediately replaced by one created after the
+        session option is set. Global options are left untouched.
+        """
+        window = ["new-window", "-k", "-t", f"={session_name}:^", "-c", working_dir]
+        args = self._tmux(
+            ["new-session", "-d", "-s", session_name, "-c", working_dir],
+            ["set-option", "-t", session_name, "history-limit", str(history_limit)],
+            window + ([command] if command else []),
+        )
+
+        try:
+            result = subprocess.run(args, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"Failed to create session: {result.stderr.strip()}")
+                return None
+            return self.server.sessions.get(session_name=session_name, default=None)
+        except Exception as e:
+            print(f"Failed to create session: {e}")
+            return None
+
+    @_per_branch
     def send_command(self, branch: str, command: str) -> bool:
         """Send a command to a session.
 
@@ -67,7 +284,7 @@ class TmuxManager:
         Returns:
             True if successful
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         try:
             session = self.server.find_where({"session_name": session_name})
@@ -86,6 +303,157 @@ class TmuxManager:
             print(f"Failed to send command: {e}")
             return False
 
+    def _paste_commands(
+        self, target: str, buffer_name: str, delete: bool = False
+    ) -> List[List[str]]:
+        """Build tmux commands that paste a loaded buffer and submit it."""
+        paste = ["paste-buffer", "-p", "-b", buffer_name, "-t", target]
+        if delete:
+            paste.insert(2, "-d")
+        return [paste, ["send-keys", "-t", target, "Enter"]]
+
+    def _pane_ids(self) -> Dict[str, str]:
+        """Get the ID (``%N``) of each session's first pane.
+
+        Pane IDs are unambiguous targets, unlike session names, which
+        tmux may read as a window or pane (e.g. one containing a dot).
+
+        Returns:
+            Mapping of session name to pane ID
+        """
+        result = subprocess.run(
+            self._tmux(["list-panes", "-a", "-F", "#{session_name}\t#{pane_id}"]),
+            capture_output=True,
+            text=True,
+        )
+        panes: Dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            name, _, pane = line.rpartition("\t")
+            panes.setdefault(name, pane)
+        return panes
+
+    def _delete_buffers(self, buffer_names: List[str]) -> None:
+        """Delete paste buffers left behind by a failed delivery."""
+        commands = [["delete-buffer", "-b", name] for name in buffer_names]
+        subprocess.run(self._tmux(*commands), capture_output=True, text=True)
+
+    @_per_branch
+    def send_prompt(self, branch: str, text: str) -> bool:
+        """Deliver a prompt through a tmux paste buffer.
+
+        The text is loaded from stdin into a named buffer, pasted with
+        bracketed paste and submitted with Enter in a single tmux call, so
+        large prompts skip key parsing and arrive unmodified.
+
+        Args:
+            branch: Branch name
+            text: Prompt text
+
+        Returns:
+            True if successful
+        """
+        buffer_name = f"aifleet-{os.getpid()}-{self.session_name(branch)}"
+        args = self._tmux(
+            ["load-buffer", "-b", buffer_name, "-"],
+            *self._paste_commands(self.session_name(branch), buffer_name, True),
+        )
+
+        try:
+            result = subprocess.run(args, input=text, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"Failed to send prompt: {result.stderr.strip()}")
+                self._delete_buffers([buffer_name])
+                return False
+            return True
+        except Exception as e:
+            print(f"Failed to send prompt: {e}")
+            return False
+
+    def send_prompts(self, prompts: Dict[str, str]) -> Dict[str, bool]:
+        """Deliver prompts to several sessions in a single tmux invocation.
+
+        Each distinct text is loaded into one buffer from a temp file and
+        pasted into every session's pane, targeted by pane ID. After each
+        delivery tmux prints its sequence number, so if the sequence stops
+        at an error only the prompts that were not delivered are retried
+        one by one.
+
+        Args:
+            prompts: Mapping of branch name to prompt text
+
+        Returns:
+            Mapping of branch name to delivery success
+        """
+        if not prompts:
+            return {}
+
+        if self.shards:
+            by_shard: Dict[int, Dict[str, str]] = {}
+            for branch, text in prompts.items():
+                shard = self.shard_for(self.session_name(branch))
+                by_shard.setdefault(id(shard), {})[branch] = text
+            results: Dict[str, bool] = {}
+            for part in self._fan_out(
+                lambda shard: shard.send_prompts(by_shard.get(id(shard), {}))
+            ):
+                results.update(part)
+            return results
+
+        groups: Dict[str, List[str]] = {}
+        for branch, text in prompts.items():
+            groups.setdefault(text, []).append(branch)
+
+        files: List[str] = []
+        buffer_names: List[str] = []
+        commands: List[List[str]] = []
+        sequence: List[str] = []
+        delivered: Set[str] = set()
+        try:
+            panes = self._pane_ids()
+            for index, (text, branches) in enumerate(groups.items()):
+                with tempfile.NamedTemporaryFile(
+                    "w", prefix="aifleet-prompt-", delete=False
+                ) as handle:
+                    handle.write(text)
+                files.append(handle.name)
+
+                buffer_name = f"aifleet-{os.getpid()}-{index}"
+                buffer_names.append(buffer_name)
+                commands.append(["load-buffer", "-b", buffer_name, handle.name])
+                for branch in branches:
+                    pane = panes.get(self.session_name(branch))
+                    if pane is None:
+                        continue
+                    commands += self._paste_commands(pane, buffer_name)
+                    # A plain number, so tmux has no format to expand
+                    commands.append(["display-message", "-p", str(len(sequence))])
+                    sequence.append(branch)
+                commands.append(["delete-buffer", "-b", buffer_name])
+
+            result = subprocess.run(
+                self._tmux(*commands), capture_output=True, text=True
+            )
+            if result.returncode == 0 and len(sequence) == len(prompts):
+                return dict.fromkeys(prompts, True)
+            delivered = {
+                sequence[int(line)]
+                for line in result.stdout.splitlines()
+                if line.isdigit() and int(line) < len(sequence)
+            }
+            if result.returncode != 0:
+                self._delete_buffers(buffer_names)
+        except Exception as e:
+            print(f"Failed to send prompts: {e}")
+        finally:
+            for path in files:
+                os.unlink(path)
+
+        return {
+            branch: branch in delivered or self.send_prompt(branch, text)
+            for branch, text in prompts.items()
+        }
+
+    @_per_branch
     def get_session_output(self, branch: str, lines: int = 100) -> Optional[str]:
         """Get recent output from a session.
 
@@ -96,12 +464,14 @@ class TmuxManager:
         Returns:
             Output text or None if failed
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         try:
             # Use tmux capture-pane command
             result = subprocess.run(
-                ["tmux", "capture-pane", "-t", session_name, "-p", "-S", f"-{lines}"],
+                self._tmux(
+                    ["capture-pane", "-t", session_name, "-p", "-S", f"-{lines}"]
+                ),
                 capture_output=True,
                 text=True,
             )
@@ -115,13 +485,43 @@ class TmuxManager:
             print(f"Failed to get output: {e}")
             return None
 
+    @_per_branch
+    def pane_size(self, branch: str) -> Optional[Tuple[int, int]]:
+        """Get the size of a session's pane.
+
+        Args:
+            branch: Branch name
+
+        Returns:
+            (columns, rows) or None if the session doesn't exist
+        """
+        result = subprocess.run(
+            self._tmux(
+                [
+                    "display-message",
+                    "-p",
+                    "-t",
+                    self.session_name(branch),
+                    "#{pane_width} #{pane_height}",
+                ]
+            ),
+            capture_output=True,
+            text=True,
+        )
+        try:
+            width, height = result.stdout.split()
+            return int(width), int(height)
+        except ValueError:
+            return None
+
+    @_per_branch
     def attach_session(self, branch: str) -> None:
         """Attach to a tmux session interactively.
 
         Args:
             branch: Branch name
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         try:
             # Check if we're inside tmux
@@ -130,15 +530,18 @@ class TmuxManager:
                 == 0
             )
 
-            if in_tmux:
+            if in_tmux and not self.socket_name:
                 # Switch to the session
-                subprocess.run(["tmux", "switch-client", "-t", session_name])
+                subprocess.run(self._tmux(["switch-client", "-t", session_name]))
             else:
-                # Attach to the session
-                subprocess.run(["tmux", "attach", "-t", session_name])
+                # Attach to the session; a client can't switch to another
+                # server, so a dedicated socket is attached as a nested client
+                env = {k: v for k, v in os.environ.items() if k != "TMUX"}
+                subprocess.run(self._tmux(["attach", "-t", session_name]), env=env)
         except Exception as e:
             print(f"Failed to attach: {e}")
 
+    @_per_branch
     def kill_session(self, branch: str) -> bool:
         """Kill a tmux session.
 
@@ -148,7 +551,7 @@ class TmuxManager:
         Returns:
             True if successful
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         try:
             session = self.server.find_where({"session_name": session_name})
@@ -165,33 +568,275 @@ class TmuxManager:
     def list_sessions(self) -> List[Tuple[str, Optional[int]]]:
         """List all AI Fleet tmux sessions.
 
+        Takes a single ``list-panes -a`` snapshot instead of querying each
+        session separately. The same snapshot records each session's last
+        activity time and working directory, see ``session_activity`` and
+        ``session_paths``.
+
         Returns:
             List of (session_name, pid) tuples
         """
-        sessions = []
+        if self.shards:
+            merged: List[Tuple[str, Optional[int]]] = []
+            for part in self._fan_out(lambda shard: shard.list_sessions()):
+                merged.extend(part)
+            self._activity = {}
+            self._paths = {}
+            self._server_pids = []
+            for shard in self.shards:
+                self._activity.update(shard.session_activity())
+                self._paths.update(shard.session_paths())
+                self._server_pids.extend(shard.server_pids())
+            self._evict_status_cache({name for name, _ in merged})
+            return merged
+
+        sessions: List[Tuple[str, Optional[int]]] = []
+        seen = set()
+        self._activity = {}
+        self._paths = {}
+        self._server_pids = []
 
         try:
-            for session in self.server.list_sessions():
-                name = session.get("session_name", "")
-                if name.startswith(self.prefix):
-                    # Try to get PID of the main process
-                    pid = None
-                    try:
-                        # Get the first pane's PID
-                        window = session.list_windows()[0]
-                        pane = window.list_panes()[0]
-                        pid_result = pane.cmd("display-message", "-p", "#{pane_pid}")
-                        if pid_result and pid_result.stdout:
-                            pid = int(pid_result.stdout[0].strip())
-                    except Exception:
-                        pass
-
-                    sessions.append((name, pid))
+            result = subprocess.run(
+                self._tmux(["list-panes", "-a", "-F", PANE_SNAPSHOT_FORMAT]),
+                capture_output=True,
+                text=True,
+            )
         except Exception as e:
             print(f"Failed to list sessions: {e}")
-
+            return sessions
+
+        # A non-zero exit usually just means no tmux server is running
+        if result.returncode != 0:
+            self._evict_status_cache(set())
+            return sessions
+
+        for line in result.stdout.splitlines():
+            fields = line.split("\t", 4) + ["", "", "", ""]
+            name, pid_text, activity_text, server_text, path = fields[:5]
+            if server_text.isdigit() and not self._server_pids:
+                self._server_pids.append(int(server_text))
+            if not name.startswith(self.prefix):
+                continue
+            if activity_text.isdigit():
+                activity = int(activity_text)
+                self._activity[name] = max(activity, self._activity.get(name, 0))
+            if name in seen:
+                continue
+            # Panes are listed in window/pane order, so the first one wins
+            seen.add(name)
+            if path:
+                self._paths[name] = path
+            pid = int(pid_text) if pid_text.strip().isdigit() else None
+            sessions.append((name, pid))
+
+        self._evict_status_cache(seen)
         return sessions
 
+    def _evict_status_cache(self, live: Set[str]) -> None:
+        """Forget cached statuses of sessions missing from a snapshot.
+
+        Args:
+            live: Names of the sessions that exist
+        """
+        for branch in [
+            b for b in self._status_cache if self.session_name(b) not in live
+        ]:
+            del self._status_cache[branch]
+
+    def server_pids(self) -> List[int]:
+        """Get tmux server PIDs seen by the most recent ``list_sessions``.
+
+        Returns:
+            One PID per running server (per shard when sharded)
+        """
+        return list(self._server_pids)
+
+    def session_activity(self) -> Dict[str, int]:
+        """Get last activity times from the most recent ``list_sessions``.
+
+        Returns:
+            Mapping of session name to the Unix time of its latest output
+        """
+        return dict(self._activity)
+
+    def session_paths(self) -> Dict[str, str]:
+        """Get working directories from the most recent ``list_sessions``.
+
+        Returns:
+            Mapping of session name to its first pane's current directory
+        """
+        return dict(self._paths)
+
+    @_per_branch
+    def pipe_output(self, branch: str, shell_command: str) -> bool:
+        """Stream a session's output into a shell command via ``pipe-pane``.
+
+        Args:
+            branch: Branch name
+            shell_command: Command receiving the output on stdin
+
+        Returns:
+            True if successful
+        """
+        session_name = self.session_name(branch)
+        args = self._tmux(["pipe-pane", "-o", "-t", session_name, shell_command])
+
+        try:
+            result = subprocess.run(args, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"Failed to pipe output: {result.stderr.strip()}")
+                return False
+            return True
+        except Exception as e:
+            print(f"Failed to pipe output: {e}")
+            return False
+
+    @_per_branch
+    def install_event_hooks(self, branch: str, log_path: str, idle_after: int) -> bool:
+        """Make tmux append lifecycle events for a session to a log file.
+
+        The session alternates between watching for silence and for
+        activity, so only idle/active transitions are logged rather than
+        every burst of output. tmux only runs session-closed hooks set
+        globally, so closure is caught by one global hook per log file,
+        installed only on a dedicated fleet server (``socket_name``) and
+        removed by ``remove_event_hooks``. The default server, which is
+        the user's own, only gets hooks on the session itself.
+
+        Args:
+            branch: Branch name
+            log_path: Event log path
+            idle_after: Seconds of silence that count as idle
+
+        Returns:
+            True if the hooks were installed
+        """
+        if any(c in log_path for c in "'\"$`\\"):
+            print(f"Not installing event hooks: unsupported characters in {log_path}")
+            return False
+
+        session_name = self.session_name(branch)
+        target = "#{q:hook_session_name}"
+        record = f'echo `date +%s` #{{q:hook}} {target} >> "{log_path}"'
+
+        def hook(script: str) -> str:
+            return f"run-shell -b '{script}'"
+
+        # Silence arms the activity monitor; activity disarms it and clears
+        # the alert flags so the next silence fires again
+        on_silence = hook(
+            f"{record}; tmux set-option -w -t {target} monitor-activity on"
+        )
+        on_activity = hook(
+            f"{record}; tmux set-option -w -t {target} monitor-activity off"
+            f" \\; kill-session -C -t {target}"
+        )
+        on_closed = hook(f"case {target} in {self.prefix}*) {record};; esac")
+
+        commands = [
+            ["set-option", "-t", session_name, "silence-action", "any"],
+            ["set-option", "-t", session_name, "activity-action", "any"],
+            ["set-option", "-w", "-t", session_name, "monitor-silence",
+             str(max(1, idle_after))],
+            ["set-hook", "-t", session_name, "alert-silence", on_silence],
+            ["set-hook", "-t", session_name, "alert-activity", on_activity],
+        ]  # fmt: skip
+        if self.socket_name:
+            commands.append(["set-hook", "-g", _closed_hook(log_path), on_closed])
+        args = self._tmux(*commands)
+
+        try:
+            result = subprocess.run(args, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"Failed to install event hooks: {result.stderr.strip()}")
+                return False
+            return True
+        except Exception as e:
+            print(f"Failed to install event hooks: {e}")
+            return False
+
+    def remove_event_hooks(self, log_path: str) -> bool:
+        """Remove the global hook ``install_event_hooks`` set for a log file.
+
+        Args:
+            log_path: Event log path the hooks were installed for
+
+        Returns:
+            True if no hook is left behind
+        """
+        if self.shards:
+            return all(self._fan_out(lambda shard: shard.remove_event_hooks(log_path)))
+        if not self.socket_name:
+            return True
+
+        args = self._tmux(["set-hook", "-gu", _closed_hook(log_path)])
+        try:
+            result = subprocess.run(args, capture_output=True, text=True)
+        except Exception as e:
+            print(f"Failed to remove event hooks: {e}")
+            return False
+        # Without a running server there is nothing to remove
+        error = result.stderr.strip()
+        if result.returncode != 0 and not error.lower().startswith(_GONE_ERRORS):
+            print(f"Failed to remove event hooks: {error}")
+            return False
+        return True
+
+    def kill_sessions(self, session_names: List[str]) -> bool:
+        """Kill several tmux sessions in a single tmux invocation.
+
+        tmux stops a command chain at the first error, so if a session is
+        already gone the sessions are killed one by one instead, and those
+        that no longer exist count as killed.
+
+        Args:
+            session_names: Full tmux session names
+
+        Returns:
+            True if successful
+        """
+        if not session_names:
+            return True
+
+        if self.shards:
+            by_shard: Dict[int, List[str]] = {}
+            for name in session_names:
+                by_shard.setdefault(id(self.shard_for(name)), []).append(name)
+            return all(
+                self._fan_out(
+                    lambda shard: shard.kill_sessions(by_shard.get(id(shard), []))
+                )
+            )
+
+        args = self._tmux(
+            *[["kill-session", "-t", f"={name}"] for name in session_names]
+        )
+
+        try:
+            result = subprocess.run(args, capture_output=True, text=True)
+            if result.returncode == 0:
+                return True
+
+            killed = True
+            for name in session_names:
+                result = subprocess.run(
+                    self._tmux(["kill-session", "-t", f"={name}"]),
+                    capture_output=True,
+                    text=True,
+                )
+                error = result.stderr.strip()
+                if result.returncode != 0 and not error.lower().startswith(
+                    _GONE_ERRORS
+                ):
+                    print(f"Failed to kill session {name}: {error}")
+                    killed = False
+            return killed
+        except Exception as e:
+            print(f"Failed to kill sessions: {e}")
+            return False
+
+    @_per_branch
     def session_exists(self, branch: str) -> bool:
         """Check if a session exists.
 
@@ -201,7 +846,7 @@ class TmuxManager:
         Returns:
             True if session exists
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         try:
             session = self.server.find_where({"session_name": session_name})
@@ -209,19 +854,25 @@ class TmuxManager:
         except Exception:
             return False
 
+    @_per_branch
     def get_pane_content(self, branch: str) -> Optional[str]:
         """Capture current pane content for status detection.
 
+        Uses the capture taken by ``prefetch_panes`` if there is one.
+
         Args:
             branch: Branch name
 
         Returns:
             Pane content or None if failed
         """
-        session_name = self._session_name(branch)
+        if branch in self._prefetched:
+            return self._prefetched.pop(branch)
+
+        session_name = self.session_name(branch)
         try:
             result = subprocess.run(
-                ["tmux", "capture-pane", "-t", session_name, "-p"],
+                self._tmux(["capture-pane", "-t", session_name, "-p"]),
                 capture_output=True,
                 text=True,
             )
@@ -231,55 +882,80 @@ class TmuxManager:
         except Exception:
             return None
 
-    def get_agent_status(self, branch: str) -> str:
+    @_per_branch
+    async def get_pane_content_async(self, branch: str) -> Optional[str]:
+        """Async variant of ``get_pane_content``."""
+        session_name = self.session_name(branch)
+        try:
+            code, stdout, _ = await aio.run(
+                self._tmux(["capture-pane", "-t", session_name, "-p"]), "tmux"
+            )
+            return stdout if code == 0 else None
+        except Exception:
+            return None
+
+    def prefetch_panes(self, branches: List[str]) -> None:
+        """Capture several panes concurrently ahead of status checks.
+
+        The next ``get_pane_content`` (and so ``get_agent_status``) call
+        for each branch uses this capture instead of running tmux again.
+
+        Args:
+            branches: Branch names
+        """
+        for manager in [self, *self.shards]:
+            manager._prefetched = {}
+        if len(branches) < 2:
+            return
+
+        async def capture_all() -> List[Optional[str]]:
+            return list(
+                await asyncio.gather(
+                    *(self.get_pane_content_async(branch) for branch in branches)
+                )
+            )
+
+        contents = aio.run_sync(capture_all())
+        for branch, content in zip(branches, contents):
+            # Shards answer get_pane_content themselves
+            self.shard_for(self.session_name(branch))._prefetched[branch] = content
+
+    def get_agent_status(self, branch: str, alive: Optional[bool] = None) -> str:
         """Detect current agent status from pane content.
 
         Args:
             branch: Branch name
+            alive: Whether the session is known to exist (e.g. from a
+                ``list_sessions`` snapshot); checked against tmux if None
 
         Returns:
             Status string: ready, running, idle, dead, or unknown
         """
-        if not self.session_exists(branch):
+        if alive is None:
+            alive = self.session_exists(branch)
+        if not alive:
+            self._status_cache.pop(branch, None)
             return "dead"
 
         content = self.get_pane_content(branch)
         if content is None:
+            self._status_cache.pop(branch, None)
             return "unknown"
 
-        # Check for Claude-specific patterns
-        running_patterns = [
-            "esc to interrupt",
-            "Thinking",
-            "I'll help",
-            "Let me",
-            "I'll ",
-            "I'm going to",
-            "I need to",
-            "I can see",
-            "Looking at",
-            "Searching for",
-            "Processing",
-            "Analyzing",
-        ]
-
-        if any(pattern.lower() in content.lower() for pattern in running_patterns):
-            return "running"
-
-        # Check if waiting for input
-        content_lines = content.strip().split("\n")
-        if content_lines:
-            last_line = content_lines[-1].strip()
-            # Check for common prompts
-            if last_line.endswith(("$", ">", ":", "?")) or "Human:" in content:
-                return "ready"
-
-        # Check for recent activity (if there's meaningful content)
-        if len(content.strip()) > 50:  # Some meaningful content
-            return "idle"
+        # Most panes don't change between refreshes; skip the pattern scan
+        # when the capture is byte-identical to the last one
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        cached = self._status_cache.get(branch)
+        if cached is not None and cached[0] == digest:
+            self.status_cache_hits += 1
+            return cached[1]
 
-        return "idle"
+        self.status_cache_misses += 1
+        status = classify_pane(content)
+        self._status_cache[branch] = (digest, status)
+        return status
 
+    @_per_branch
     def get_session_info(self, branch: str) -> Optional[dict]:
         """Get detailed session information.
 
@@ -289,7 +965,7 @@ class TmuxManager:
         Returns:
             Session info dict or None
         """
-        session_name = self._session_name(branch)
+        session_name = self.session_name(branch)
 
         try:
             session = self.server.find_where({"session_name": session_name})
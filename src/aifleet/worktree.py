@@ -1,33 +1,136 @@
 """Git worktree operations for AI Fleet."""
 
+import asyncio
+import os
 import shutil
 import subprocess
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from . import aio
+from .caches import cache_environment
+from .config import ConfigManager
+from .credentials import sync_credentials
+from .seeding import seed_outputs
+
+# git refuses to run while another process holds one of its lock files
+GIT_LOCK_ERROR = ".lock': File exists"
+
+# Checkouts leave LFS pointer files instead of downloading every object;
+# ``hydrate_lfs`` fills in the paths agents need from the local LFS store
+LFS_SKIP_SMUDGE = {"GIT_LFS_SKIP_SMUDGE": "1"}
+
+# Directory below worktree_root holding parked worktrees for reuse
+POOL_DIR = ".pool"
+
+# Refs in the main repository keeping each clone's starting commit, and so
+# every object the clone reads through alternates, reachable
+CLONE_NAMESPACE = "refs/aifleet/clones"
+
+# Worktree-scoped settings that speed up agents' constant status/diff/add
+GIT_PERFORMANCE_CONFIG = {
+    "feature.manyFiles": "true",
+    "core.untrackedCache": "true",
+    "index.version": "4",
+    "core.splitIndex": "true",
+    "core.preloadIndex": "true",
+}
+
+
+@dataclass
+class WorktreeSetup:
+    """What is done to a new worktree after it is created, in order."""
+
+    # Commit whose tree is restored as uncommitted changes (e.g. an
+    # archived agent's work in progress)
+    restore: Optional[str] = None
+    submodules: bool = False
+    lfs_paths: List[str] = field(default_factory=list)
+    git_performance: bool = False
+    # Also run a git fsmonitor daemon per worktree
+    fsmonitor: bool = False
+    credential_files: List[str] = field(default_factory=list)
+    credential_sync: str = "copy"
+    seed_paths: List[str] = field(default_factory=list)
+    # Checkout seeded from (None = the main repository)
+    seed_source: Optional[Path] = None
+    commands: List[str] = field(default_factory=list)
+    # Skip the setup commands
+    quick: bool = False
+    # Variables set for the setup commands (e.g. shared caches)
+    env: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(
+        cls, config: ConfigManager, quick: Optional[bool] = None
+    ) -> "WorktreeSetup":
+        """Build the setup a project's configuration asks for.
+
+        Args:
+            config: Project configuration
+            quick: Skip setup commands (defaults to setup.quick)
+
+        Returns:
+            Worktree setup
+        """
+        return cls(
+            submodules=config.init_submodules,
+            lfs_paths=config.lfs_paths,
+            git_performance=config.git_performance,
+            fsmonitor=config.git_fsmonitor,
+            credential_files=config.credential_files,
+            credential_sync=config.credential_sync,
+            seed_paths=config.seed_paths,
+            seed_source=config.seed_source,
+            commands=config.setup_commands,
+            quick=config.quick_setup if quick is None else quick,
+            env=cache_environment(config),
+        )
 
 
 class WorktreeManager:
     """Manages git worktrees for AI agents."""
 
-    def __init__(self, repo_root: Path, worktree_root: Path):
+    def __init__(
+        self,
+        repo_root: Path,
+        worktree_root: Path,
+        mode: str = "worktree",
+        clone_filter: str = "",
+    ):
         """Initialize worktree manager.
 
         Args:
             repo_root: Main repository root
             worktree_root: Directory for worktrees
+            mode: Create linked worktrees ("worktree") or local clones ("clone")
+            clone_filter: Partial clone filter for clones (e.g. "blob:none")
         """
         self.repo_root = repo_root
+        self.mode = mode
+        self.clone_filter = clone_filter
         self.worktree_root = worktree_root
         self.worktree_root.mkdir(parents=True, exist_ok=True)
+        self.pool_root = worktree_root / POOL_DIR
+        # Parked worktrees already being taken over by this process
+        self._claimed: Set[Path] = set()
+        self._fsmonitor: Optional[bool] = None
+        self._lfs: Optional[bool] = None
 
     def _run_git(
-        self, args: List[str], cwd: Optional[Path] = None
+        self,
+        args: List[str],
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
     ) -> Tuple[bool, str, str]:
         """Run a git command.
 
         Args:
             args: Git command arguments
             cwd: Working directory (defaults to repo_root)
+            env: Variables set on top of this process's environment
 
         Returns:
             (success, stdout, stderr)
@@ -36,24 +139,68 @@ class WorktreeManager:
 
         try:
             result = subprocess.run(
-                ["git"] + args, cwd=cwd, capture_output=True, text=True
+                ["git"] + args,
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                env={**os.environ, **env} if env else None,
             )
             return result.returncode == 0, result.stdout, result.stderr
         except Exception as e:
             return False, "", str(e)
 
+    async def _run_git_async(
+        self,
+        args: List[str],
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bool, str, str]:
+        """Run a git command without blocking the event loop.
+
+        Commands that collide with another git process's lock file are
+        retried a few times, since concurrent agents share one repository.
+
+        Args:
+            args: Git command arguments
+            cwd: Working directory (defaults to repo_root)
+            env: Variables set on top of this process's environment
+
+        Returns:
+            (success, stdout, stderr)
+        """
+        cwd = cwd or self.repo_root
+
+        for attempt in range(5):
+            try:
+                code, stdout, stderr = await aio.run(
+                    ["git"] + args, "git", str(cwd), env=env
+                )
+            except Exception as e:
+                return False, "", str(e)
+            if code == 0 or GIT_LOCK_ERROR not in stderr:
+                break
+            await asyncio.sleep(0.1 * (attempt + 1))
+        return code == 0, stdout, stderr
+
     def create_worktree(
-        self, branch: str, path: Optional[Path] = None
+        self, branch: str, path: Optional[Path] = None, base: Optional[str] = None
     ) -> Optional[Path]:
         """Create a new worktree.
 
         Args:
             branch: Branch name
             path: Worktree path (auto-generated if not provided)
+            base: Commit a new branch starts from (defaults to HEAD)
 
         Returns:
             Path to created worktree or None if failed
         """
+        return aio.run_sync(self.create_worktree_async(branch, path, base))
+
+    async def create_worktree_async(
+        self, branch: str, path: Optional[Path] = None, base: Optional[str] = None
+    ) -> Optional[Path]:
+        """Async variant of ``create_worktree``."""
         if path is None:
             # Auto-generate path based on branch name
             safe_branch = branch.replace("/", "-")
@@ -65,21 +212,31 @@ class WorktreeManager:
             return path
 
         # Check if branch exists
-        success, stdout, _ = self._run_git(
+        success, stdout, _ = await self._run_git_async(
             ["show-ref", "--verify", f"refs/heads/{branch}"]
         )
         branch_exists = success
+        if branch_exists and base:
+            print(f"Branch {branch} already exists; not moving it to the base")
+
+        if self.mode == "clone":
+            return await self._create_clone_async(branch, path, branch_exists, base)
+
+        # Take over a parked worktree, keeping its installed dependencies
+        if await self._reuse_parked_async(branch, path, branch_exists, base):
+            return path
 
         # Create worktree
         if branch_exists:
             # Use existing branch
-            success, stdout, stderr = self._run_git(
-                ["worktree", "add", str(path), branch]
+            success, stdout, stderr = await self._run_git_async(
+                ["worktree", "add", str(path), branch], env=LFS_SKIP_SMUDGE
             )
         else:
             # Create new branch
-            success, stdout, stderr = self._run_git(
-                ["worktree", "add", str(path), "-b", branch]
+            success, stdout, stderr = await self._run_git_async(
+                ["worktree", "add", str(path), "-b", branch] + ([base] if base else []),
+                env=LFS_SKIP_SMUDGE,
             )
 
         if not success:
@@ -88,6 +245,318 @@ class WorktreeManager:
 
         return path
 
+    async def _create_clone_async(
+        self, branch: str, path: Path, branch_exists: bool, base: Optional[str]
+    ) -> Optional[Path]:
+        """Create a workspace as a local clone of the main repository.
+
+        A clone has its own refs, index and lock files, so agents never
+        contend on the main repository's. Objects stay shared: a plain
+        clone reads them through alternates (``--shared``), a partial clone
+        fetches only what it needs from the main repository.
+
+        Either way the clone depends on objects in the main repository,
+        which ``git gc`` deletes once nothing there references them, e.g.
+        after the clone's branch was deleted. The commit the clone starts
+        from is therefore kept under ``refs/aifleet/clones/<name>`` until
+        the clone is removed; newer commits live in the clone itself.
+
+        Returns:
+            Path to the clone or None if failed
+        """
+        source = f"refs/heads/{branch}" if branch_exists else (base or "HEAD")
+        pin = f"{CLONE_NAMESPACE}/{path.name}"
+        success, _, stderr = await self._run_git_async(["update-ref", pin, source])
+        if not success:
+            print(f"Failed to create clone: {stderr.strip()}")
+            return None
+
+        clone = ["clone", "--quiet", "--no-checkout", "--single-branch"]
+        if self.clone_filter:
+            # Local partial clones need the main repository to serve filters
+            await self._run_git_async(["config", "uploadpack.allowFilter", "true"])
+            clone += ["--no-local", f"--filter={self.clone_filter}"]
+            clone.append(self.repo_root.resolve().as_uri())
+        else:
+            clone += ["--shared", str(self.repo_root)]
+
+        success, _, stderr = await self._run_git_async(clone + [str(path)])
+        if not success:
+            print(f"Failed to create clone: {stderr.strip()}")
+            await self._run_git_async(["update-ref", "-d", pin])
+            return None
+
+        # LFS objects are kept in the main repository's store; ``git push``
+        # sends the branch back to the main repository's branch
+        lfs_storage = await self._common_dir_async() / "lfs"
+        for args in (
+            ["config", "lfs.storage", str(lfs_storage)],
+            ["fetch", "--quiet", "--no-tags", "origin", pin],
+            ["checkout", "--quiet", "-b", branch, "FETCH_HEAD"],
+            ["config", "push.default", "current"],
+        ):
+            success, _, stderr = await self._run_git_async(
+                args, cwd=path, env=LFS_SKIP_SMUDGE
+            )
+            if not success:
+                print(f"Failed to create clone: {stderr.strip()}")
+                shutil.rmtree(path, ignore_errors=True)
+                await self._run_git_async(["update-ref", "-d", pin])
+                return None
+
+        return path
+
+    async def _common_dir_async(self) -> Path:
+        """Get the main repository's git directory shared by its worktrees."""
+        _, stdout, _ = await self._run_git_async(["rev-parse", "--git-common-dir"])
+        return (self.repo_root / (stdout.strip() or ".git")).resolve()
+
+    async def hydrate_lfs_async(self, path: Path, patterns: List[str]) -> bool:
+        """Async variant of ``hydrate_lfs``."""
+        if not patterns:
+            return True
+        if self._lfs is None:
+            self._lfs, _, _ = await self._run_git_async(["lfs", "version"])
+        if not self._lfs:
+            print("git-lfs is not installed; LFS files stay pointers")
+            return False
+
+        success, _, stderr = await self._run_git_async(
+            ["lfs", "checkout", *patterns], cwd=path
+        )
+        if not success:
+            print(f"Failed to hydrate LFS files: {stderr.strip()}")
+        return success
+
+    async def init_submodules_async(self, path: Path) -> bool:
+        """Async variant of ``init_submodules``."""
+        if not (path / ".gitmodules").exists():
+            return True
+
+        _, stdout, _ = await self._run_git_async(
+            ["config", "-f", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"],
+            cwd=path,
+        )
+        modules = await self._common_dir_async() / "modules"
+        ok = True
+        for line in stdout.splitlines():
+            key, _, sub_path = line.partition(" ")
+            name = key[len("submodule.") : -len(".path")]
+            store = modules / name
+            if not store.is_dir():
+                print(f"Submodule {sub_path} is not initialized in the main checkout")
+                continue
+
+            success, _, stderr = await self._run_git_async(
+                ["submodule", "update", "--init", "--reference", str(store)]
+                + ["--", sub_path],
+                cwd=path,
+                env=LFS_SKIP_SMUDGE,
+            )
+            if not success:
+                print(f"Failed to initialize submodule {sub_path}: {stderr.strip()}")
+                ok = False
+        return ok
+
+    def hydrate_lfs(self, path: Path, patterns: List[str]) -> bool:
+        """Replace LFS pointer files matching patterns with their content.
+
+        Content comes from the main repository's LFS store, which linked
+        worktrees share and clones point ``lfs.storage`` at, so nothing is
+        downloaded; objects missing from the store stay pointer files.
+
+        Args:
+            path: Worktree path
+            patterns: Glob patterns of paths agents need (e.g. "assets/ui/**")
+
+        Returns:
+            True if the paths were hydrated
+        """
+        return aio.run_sync(self.hydrate_lfs_async(path, patterns))
+
+    def init_submodules(self, path: Path) -> bool:
+        """Initialize a worktree's submodules from the main checkout's modules.
+
+        Each submodule is cloned with the main checkout's copy of it
+        (``.git/modules/<name>``) as a ``--reference``, so its objects are
+        read through alternates rather than downloaded or copied again.
+        Submodules the main checkout hasn't initialized are left alone.
+
+        Args:
+            path: Worktree path
+
+        Returns:
+            True if every initialized submodule was set up
+        """
+        return aio.run_sync(self.init_submodules_async(path))
+
+    @staticmethod
+    def is_clone(path: Path) -> bool:
+        """Check whether a workspace is a clone rather than a linked worktree."""
+        return (path / ".git").is_dir()
+
+    def _collect_clone_branch(self, path: Path) -> bool:
+        """Fetch a clone's branch into the main repository before removal.
+
+        Returns:
+            True if the branch was brought back (or there is none)
+        """
+        success, branch, _ = self._run_git(["branch", "--show-current"], cwd=path)
+        branch = branch.strip()
+        if not success or not branch:
+            return True
+        success, _, stderr = self._run_git(
+            ["fetch", "--quiet", "--no-tags", str(path), f"{branch}:{branch}"]
+        )
+        if not success:
+            print(f"Failed to bring back branch {branch}: {stderr.strip()}")
+        return success
+
+    def resolve_base(self, ref: str, fetch_ttl: float = 300) -> Optional[str]:
+        """Pin a batch's base ref to a commit.
+
+        A remote-tracking ref (e.g. ``origin/main``) is fetched first,
+        unless the repository was fetched less than ``fetch_ttl`` seconds
+        ago, so one batch (or several in a row) costs at most one fetch.
+
+        Args:
+            ref: Branch, tag, remote-tracking ref or commit
+            fetch_ttl: Seconds a previous fetch stays fresh
+
+        Returns:
+            Full commit SHA or None if the ref can't be resolved
+        """
+        success, stdout, _ = self._run_git(["remote"])
+        remotes = stdout.split() if success else []
+        remote = next((r for r in remotes if ref.startswith(f"{r}/")), None)
+
+        if remote:
+            success, fetch_head, _ = self._run_git(
+                ["rev-parse", "--git-path", "FETCH_HEAD"]
+            )
+            fetch_file = self.repo_root / fetch_head.strip()
+            fresh = (
+                success
+                and fetch_file.exists()
+                and time.time() - fetch_file.stat().st_mtime < fetch_ttl
+            )
+            if not fresh:
+                print(f"Fetching {remote}...")
+                success, _, stderr = self._run_git(["fetch", "--quiet", remote])
+                if not success:
+                    print(f"Failed to fetch {remote}: {stderr.strip()}")
+
+        success, stdout, _ = self._run_git(
+            ["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"]
+        )
+        if not success:
+            print(f"Unknown base ref: {ref}")
+            return None
+        return stdout.strip()
+
+    def parked_worktrees(self) -> List[Path]:
+        """List parked worktrees, oldest first.
+
+        Returns:
+            Paths of worktrees waiting in the pool
+        """
+        if not self.pool_root.is_dir():
+            return []
+        return sorted(p for p in self.pool_root.iterdir() if p.is_dir())
+
+    async def _reuse_parked_async(
+        self, branch: str, path: Path, branch_exists: bool, base: Optional[str]
+    ) -> bool:
+        """Move a parked worktree to ``path`` and check out ``branch`` in it.
+
+        Returns:
+            True if a parked worktree was reused
+        """
+        parked = [p for p in self.parked_worktrees() if p not in self._claimed]
+        if not parked:
+            return False
+        source = parked[0]
+        self._claimed.add(source)
+
+        # New branches start from the base or the main repository's HEAD,
+        # as with ``git worktree add -b``
+        success, head, stderr = await self._run_git_async(
+            ["rev-parse", "--verify", base or "HEAD"]
+        )
+        if success:
+            success, _, stderr = await self._run_git_async(
+                ["worktree", "move", str(source), str(path)]
+            )
+        if success:
+            checkout = ["checkout", branch] if branch_exists else []
+            checkout = checkout or ["checkout", "-b", branch, head.strip()]
+            success, _, stderr = await self._run_git_async(
+                checkout, cwd=path, env=LFS_SKIP_SMUDGE
+            )
+            if not success:
+                # Leave it for the next agent rather than losing it
+                await self._run_git_async(["worktree", "move", str(path), str(source)])
+
+        if not success:
+            print(f"Failed to reuse parked worktree {source.name}: {stderr.strip()}")
+            return False
+        print(f"Reused parked worktree {source.name}")
+        return True
+
+    def park_worktree(
+        self,
+        path: Path,
+        keep_paths: List[str],
+        pool_size: int,
+        force: bool = False,
+    ) -> bool:
+        """Reset a worktree and park it for reuse instead of removing it.
+
+        The worktree is reset to its last commit and cleaned, except for
+        ``keep_paths`` (e.g. dependency or build cache directories), then
+        detached from its branch and moved into the pool. When the pool is
+        full the worktree is removed as usual.
+
+        Args:
+            path: Worktree path
+            keep_paths: Ignore patterns (as for ``git clean -e``) for paths that
+                survive the clean
+            pool_size: Maximum number of parked worktrees
+            force: Park even if there are uncommitted changes
+
+        Returns:
+            True if the worktree was parked or removed
+        """
+        if len(self.parked_worktrees()) >= pool_size or self.is_clone(path):
+            return self.remove_worktree(path, force=force)
+
+        if not force:
+            success, stdout, stderr = self._run_git(["status", "--porcelain"], cwd=path)
+            if not success or stdout.strip():
+                print(f"Failed to park worktree: uncommitted changes in {path}")
+                return False
+
+        # A daemon would keep watching the worktree's old path
+        self.stop_fsmonitor(path)
+        clean = ["clean", "-ffdx"]
+        for keep in keep_paths:
+            clean += ["-e", keep]
+        target = self.pool_root / f"{time.time_ns()}-{path.name}"
+        self.pool_root.mkdir(parents=True, exist_ok=True)
+
+        for args, cwd in [
+            (["reset", "--hard", "--quiet"], path),
+            (clean, path),
+            (["checkout", "--detach", "--quiet"], path),
+            (["worktree", "move", str(path), str(target)], None),
+        ]:
+            success, _, stderr = self._run_git(args, cwd=cwd)
+            if not success:
+                print(f"Failed to park worktree: {stderr.strip()}")
+                return self.remove_worktree(path, force=True)
+
+        return True
+
     def remove_worktree(self, path: Path, force: bool = False) -> bool:
         """Remove a worktree.
 
@@ -98,6 +567,10 @@ class WorktreeManager:
         Returns:
             True if successful
         """
+        self.stop_fsmonitor(path)
+        if self.is_clone(path):
+            return self._remove_clone(path, force)
+
         # Remove worktree from git
         args = ["worktree", "remove", str(path)]
         if force:
@@ -118,6 +591,65 @@ class WorktreeManager:
 
         return True
 
+    def _remove_clone(self, path: Path, force: bool) -> bool:
+        """Remove a clone, keeping its branch in the main repository.
+
+        Args:
+            path: Clone path
+            force: Remove even with uncommitted changes or a diverged branch
+
+        Returns:
+            True if successful
+        """
+        if not force:
+            success, stdout, _ = self._run_git(["status", "--porcelain"], cwd=path)
+            if not success or stdout.strip():
+                print(f"Failed to remove clone: uncommitted changes in {path}")
+                return False
+        if not self._collect_clone_branch(path) and not force:
+            return False
+
+        try:
+            shutil.rmtree(path)
+        except Exception as e:
+            print(f"Failed to remove directory: {e}")
+            return False
+        self._run_git(["update-ref", "-d", f"{CLONE_NAMESPACE}/{path.name}"])
+        return True
+
+    def remove_worktrees(self, paths: List[Path]) -> List[Path]:
+        """Remove several worktrees, pruning git's metadata once at the end.
+
+        Unlike ``remove_worktree`` this always discards uncommitted changes.
+
+        Args:
+            paths: Worktree paths
+
+        Returns:
+            List of paths that were removed
+        """
+        removed = []
+
+        for path in paths:
+            clone = self.is_clone(path)
+            self.stop_fsmonitor(path)
+            try:
+                if path.exists():
+                    shutil.rmtree(path)
+                removed.append(path)
+            except Exception as e:
+                print(f"Failed to remove directory {path}: {e}")
+                continue
+            if clone:
+                self._run_git(["update-ref", "-d", f"{CLONE_NAMESPACE}/{path.name}"])
+
+        if removed:
+            success, _, stderr = self._run_git(["worktree", "prune"])
+            if not success:
+                print(f"Failed to prune worktrees: {stderr}")
+
+        return removed
+
     def list_worktrees(self) -> List[Tuple[str, str]]:
         """List all worktrees.
 
@@ -141,69 +673,113 @@ class WorktreeManager:
                 worktrees.append((current_path, branch))
                 current_path = None
 
+        # Clones don't register with the main repository
+        for path in self.worktree_root.iterdir():
+            head = path / ".git" / "HEAD"
+            if head.is_file():
+                ref = head.read_text().strip()
+                if ref.startswith("ref: "):
+                    worktrees.append((str(path), ref[5:]))
+
         return worktrees
 
-    def copy_credential_files(self, worktree_path: Path, files: List[str]) -> List[str]:
-        """Copy credential files from main repo to worktree.
+    def copy_credential_files(
+        self, worktree_path: Path, files: List[str], strategy: str = "copy"
+    ) -> List[str]:
+        """Sync credential files from main repo to worktree.
+
+        Only files whose content differs are written; see ``credentials``.
 
         Args:
             worktree_path: Destination worktree path
-            files: List of files to copy (relative to repo root)
+            files: Files, directories or glob patterns (relative to repo root)
+            strategy: copy, hardlink, reflink or symlink
 
         Returns:
-            List of successfully copied files
+            List of files now in place in the worktree
         """
-        copied = []
+        result = sync_credentials(self.repo_root, worktree_path, files, strategy)
 
-        for file in files:
-            src = self.repo_root / file
-            dst = worktree_path / file
+        for pattern in result.missing:
+            print(f"Source file not found: {pattern}")
+        for file in result.updated:
+            print(f"Copied {file}")
 
-            if not src.exists():
-                print(f"Source file not found: {file}")
-                continue
+        return result.synced
 
-            try:
-                # Create parent directory if needed
-                dst.parent.mkdir(parents=True, exist_ok=True)
+    def seed_build_outputs(
+        self, worktree_path: Path, paths: List[str], source: Optional[Path] = None
+    ) -> List[str]:
+        """Clone build outputs from a built checkout into a worktree.
 
-                # Copy file
-                shutil.copy2(src, dst)
-                copied.append(file)
-                print(f"Copied {file}")
-            except Exception as e:
-                print(f"Failed to copy {file}: {e}")
+        See ``seeding``; files are reflinked or copied, never hardlinked.
+
+        Args:
+            worktree_path: Destination worktree path
+            paths: Build output paths (relative to the checkout root)
+            source: Checkout to seed from (defaults to the main repository)
+
+        Returns:
+            List of paths seeded
+        """
+        return aio.run_sync(self.seed_build_outputs_async(worktree_path, paths, source))
+
+    async def seed_build_outputs_async(
+        self, worktree_path: Path, paths: List[str], source: Optional[Path] = None
+    ) -> List[str]:
+        """Async variant of ``seed_build_outputs``."""
+        # Copying falls back to reading every byte; share the setup slots
+        async with aio.limiter("setup"):
+            seeded, missing = await asyncio.to_thread(
+                seed_outputs, source or self.repo_root, worktree_path, paths
+            )
+
+        for path in missing:
+            print(f"Seed path not found: {path}")
+        for path, count in seeded:
+            print(f"Seeded {path} ({count} files)")
 
-        return copied
+        return [path for path, _ in seeded]
 
-    def run_setup_commands(self, worktree_path: Path, commands: List[str]) -> bool:
+    def run_setup_commands(
+        self,
+        worktree_path: Path,
+        commands: List[str],
+        env: Optional[Dict[str, str]] = None,
+    ) -> bool:
         """Run setup commands in worktree.
 
         Args:
             worktree_path: Worktree path
             commands: List of commands to run
+            env: Variables set for the commands (e.g. shared caches)
 
         Returns:
             True if all commands succeeded
         """
+        return aio.run_sync(self.run_setup_commands_async(worktree_path, commands, env))
+
+    async def run_setup_commands_async(
+        self,
+        worktree_path: Path,
+        commands: List[str],
+        env: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Async variant of ``run_setup_commands``."""
         for command in commands:
             print(f"Running: {command}")
 
             try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
+                returncode, stdout, stderr = await aio.run(
+                    [command], "setup", str(worktree_path), shell=True, env=env
                 )
 
-                if result.returncode != 0:
-                    print(f"Command failed: {result.stderr}")
+                if returncode != 0:
+                    print(f"Command failed: {stderr}")
                     return False
 
-                if result.stdout:
-                    print(result.stdout)
+                if stdout:
+                    print(stdout)
 
             except Exception as e:
                 print(f"Failed to run command: {e}")
@@ -214,40 +790,230 @@ class WorktreeManager:
     def setup_worktree(
         self,
         branch: str,
-        credential_files: List[str],
-        setup_commands: List[str],
-        quick_setup: bool = False,
+        setup: Optional[WorktreeSetup] = None,
+        base: Optional[str] = None,
     ) -> Optional[Path]:
         """Create and setup a worktree.
 
         Args:
             branch: Branch name
-            credential_files: Files to copy
-            setup_commands: Commands to run
-            quick_setup: Skip setup commands if True
+            setup: What to do to the new worktree (defaults to nothing)
+            base: Commit a new branch starts from (defaults to HEAD)
 
         Returns:
             Path to setup worktree or None if failed
         """
+        return aio.run_sync(self.setup_worktree_async(branch, setup, base))
+
+    async def setup_worktree_async(
+        self,
+        branch: str,
+        setup: Optional[WorktreeSetup] = None,
+        base: Optional[str] = None,
+    ) -> Optional[Path]:
+        """Async variant of ``setup_worktree``."""
+        setup = setup or WorktreeSetup()
+
         # Create worktree
-        worktree_path = self.create_worktree(branch)
+        worktree_path = await self.create_worktree_async(branch, base=base)
         if not worktree_path:
             return None
 
+        # Restored changes are in place before anything is built from them
+        if setup.restore:
+            success, _, stderr = await self._run_git_async(
+                ["restore", f"--source={setup.restore}", "--worktree", "--", "."],
+                cwd=worktree_path,
+            )
+            if success:
+                print("Restored uncommitted changes")
+            else:
+                print(f"Failed to restore uncommitted changes: {stderr.strip()}")
+
+        if setup.submodules:
+            await self.init_submodules_async(worktree_path)
+        if setup.lfs_paths:
+            await self.hydrate_lfs_async(worktree_path, setup.lfs_paths)
+
+        if setup.git_performance:
+            await self.apply_git_performance_async(worktree_path, setup.fsmonitor)
+
         # Copy credential files
-        if credential_files:
-            copied = self.copy_credential_files(worktree_path, credential_files)
+        if setup.credential_files:
+            copied = self.copy_credential_files(
+                worktree_path, setup.credential_files, setup.credential_sync
+            )
             print(f"Copied {len(copied)} credential files")
 
+        if setup.seed_paths:
+            await self.seed_build_outputs_async(
+                worktree_path, setup.seed_paths, setup.seed_source
+            )
+
         # Run setup commands
-        if setup_commands and not quick_setup:
-            success = self.run_setup_commands(worktree_path, setup_commands)
+        if setup.commands and not setup.quick:
+            success = await self.run_setup_commands_async(
+                worktree_path, setup.commands, setup.env
+            )
             if not success:
                 print("Setup commands failed")
                 # Don't remove worktree - user might want to debug
 
         return worktree_path
 
+    def setup_worktrees(
+        self,
+        branches: List[str],
+        setup: Optional[WorktreeSetup] = None,
+        base: Optional[str] = None,
+    ) -> List[Optional[Path]]:
+        """Create and setup several worktrees concurrently.
+
+        git and setup commands of different worktrees overlap, within the
+        configured concurrency limits.
+
+        Args:
+            branches: Branch names
+            setup: What to do to each new worktree (defaults to nothing)
+            base: Commit new branches start from (defaults to HEAD)
+
+        Returns:
+            Worktree path (or None if failed) for each branch, in order
+        """
+
+        async def setup_all() -> List[Optional[Path]]:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.setup_worktree_async(branch, setup, base)
+                        for branch in branches
+                    )
+                )
+            )
+
+        return aio.run_sync(setup_all())
+
+    async def _fsmonitor_supported_async(self) -> bool:
+        """Check whether git's builtin fsmonitor daemon runs on this platform."""
+        if self._fsmonitor is None:
+            _, _, stderr = await self._run_git_async(["fsmonitor--daemon", "status"])
+            unsupported = ("not supported", "not a git command")
+            self._fsmonitor = not any(text in stderr for text in unsupported)
+        return self._fsmonitor
+
+    async def apply_git_performance_async(
+        self, path: Path, fsmonitor: bool = False
+    ) -> bool:
+        """Async variant of ``apply_git_performance``."""
+        # Worktree-scoped config needs this extension, set once per repository;
+        # in a clone --worktree writes the clone's own config
+        if not self.is_clone(path):
+            success, _, stderr = await self._run_git_async(
+                ["config", "extensions.worktreeConfig", "true"]
+            )
+            if not success:
+                print(f"Failed to enable worktree config: {stderr.strip()}")
+                return False
+
+        settings = dict(GIT_PERFORMANCE_CONFIG)
+        if fsmonitor and await self._fsmonitor_supported_async():
+            settings["core.fsmonitor"] = "true"
+
+        for key, value in settings.items():
+            success, _, stderr = await self._run_git_async(
+                ["config", "--worktree", key, value], cwd=path
+            )
+            if not success:
+                print(f"Failed to set {key}: {stderr.strip()}")
+                return False
+
+        # Rewrite the index checked out by worktree add in the new format
+        success, _, stderr = await self._run_git_async(
+            [
+                "update-index",
+                "--index-version",
+                "4",
+                "--split-index",
+                "--untracked-cache",
+            ],
+            cwd=path,
+        )
+        if not success:
+            print(f"Failed to convert index: {stderr.strip()}")
+        return success
+
+    def apply_git_performance(self, path: Path, fsmonitor: bool = False) -> bool:
+        """Tune git for frequent status/diff/add calls in one worktree.
+
+        Sets untracked cache, ``feature.manyFiles``, index v4, split index,
+        preloadIndex and optionally the builtin fsmonitor daemon in the
+        worktree's own config, leaving the main checkout's settings alone.
+        Worktree config needs ``extensions.worktreeConfig``, which is
+        enabled in the main repository's config.
+
+        Args:
+            path: Worktree path
+            fsmonitor: Also use an fsmonitor daemon, where git supports it;
+                one daemon runs per worktree until ``stop_fsmonitor``
+
+        Returns:
+            True if every setting was applied
+        """
+        return aio.run_sync(self.apply_git_performance_async(path, fsmonitor))
+
+    def stop_fsmonitor(self, path: Path) -> None:
+        """Stop a worktree's fsmonitor daemon, if one is running.
+
+        The daemon listens on a socket in the worktree's git directory, so
+        worktrees without one cost no git call.
+
+        Args:
+            path: Worktree path
+        """
+        dot_git = path / ".git"
+        if dot_git.is_file():
+            text = dot_git.read_text(errors="replace").strip()
+            git_dir = path / text.removeprefix("gitdir:").strip()
+        else:
+            git_dir = dot_git
+        if (git_dir / "fsmonitor--daemon.ipc").exists():
+            self._run_git(["fsmonitor--daemon", "stop"], cwd=path)
+
+    def git_performance_status(
+        self, path: Path, fsmonitor: bool = False
+    ) -> Dict[str, bool]:
+        """Report which git performance settings are active in a worktree.
+
+        Args:
+            path: Worktree path
+            fsmonitor: Also report whether the fsmonitor daemon is enabled
+
+        Returns:
+            Mapping of setting to whether it is in effect
+        """
+        status = {}
+        for key, value in GIT_PERFORMANCE_CONFIG.items():
+            success, stdout, _ = self._run_git(["config", "--get", key], cwd=path)
+            status[key] = success and stdout.strip().lower() == value
+
+        # The index only switches format when it is rewritten
+        success, stdout, _ = self._run_git(
+            ["rev-parse", "--git-path", "index"], cwd=path
+        )
+        try:
+            with open(path / stdout.strip(), "rb") as f:
+                header = f.read(8)
+            status["index.version"] = int.from_bytes(header[4:8], "big") == 4
+        except OSError:
+            status["index.version"] = False
+
+        if fsmonitor and aio.run_sync(self._fsmonitor_supported_async()):
+            success, stdout, _ = self._run_git(
+                ["config", "--get", "core.fsmonitor"], cwd=path
+            )
+            status["core.fsmonitor"] = success and stdout.strip().lower() == "true"
+        return status
+
     def get_worktree_info(self, path: Path) -> Optional[dict]:
         """Get information about a worktree.
 
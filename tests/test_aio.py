@@ -0,0 +1,39 @@
+"""Tests for the asyncio subprocess helpers."""
+
+import asyncio
+import sys
+
+from aifleet import aio
+
+
+class TestAio:
+    """Tests for limited async subprocesses."""
+
+    def test_run_returns_output(self):
+        """Test exit code and both streams are returned."""
+        script = "import sys; print(sys.stdin.read()); sys.exit(3)"
+        code, stdout, stderr = aio.run_sync(
+            aio.run([sys.executable, "-c", script], "git", input="hi")
+        )
+        assert (code, stdout.strip(), stderr) == (3, "hi", "")
+
+    def test_limits_bound_concurrency(self, monkeypatch):
+        """Test no more processes of a kind run than its limit allows."""
+        monkeypatch.setattr(aio, "_limits", dict(aio.DEFAULT_LIMITS))
+        aio.configure_limits({"setup": 2})
+        running = 0
+        peak = 0
+
+        async def job() -> None:
+            nonlocal running, peak
+            async with aio.limiter("setup"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        async def main() -> None:
+            await asyncio.gather(*(job() for _ in range(6)))
+
+        aio.run_sync(main())
+        assert peak == 2
@@ -0,0 +1,89 @@
+"""Tests for archiving killed agents' work."""
+
+import subprocess
+
+from aifleet.archive import (
+    archive_worktree,
+    bundle_batch,
+    find_entry,
+    list_archive,
+    restore_point,
+)
+from aifleet.worktree import WorktreeManager, WorktreeSetup
+
+
+def git(repo, *args):
+    """Run git in a repository and return its output."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True
+    ).stdout
+
+
+def make_agent_worktree(worktree_mgr, branch):
+    """Create a worktree with a commit and uncommitted changes."""
+    path = worktree_mgr.create_worktree(branch)
+    (path / "done.txt").write_text("committed")
+    git(path, "add", ".")
+    git(path, "commit", "-m", "work")
+    (path / "README.md").write_text("edited")
+    (path / "new.txt").write_text("untracked")
+    return path
+
+
+class TestArchive:
+    """Test archiving and restoring agents."""
+
+    def test_snapshot_round_trip(self, git_repo, temp_dir):
+        """Test uncommitted changes survive archive and restore unchanged."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        path = make_agent_worktree(worktree_mgr, "agent-1")
+        head = git(path, "rev-parse", "HEAD").strip()
+        status = git(path, "status", "--porcelain")
+
+        commit = archive_worktree(worktree_mgr, path, "batch1", "agent-1")
+
+        # The agent's own worktree and index are untouched
+        assert git(path, "status", "--porcelain") == status
+        [entry] = find_entry(list_archive(worktree_mgr), "agent-1")
+        assert (entry.name, entry.commit) == ("batch1/agent-1", commit)
+
+        base, snapshot = restore_point(worktree_mgr, entry)
+        assert snapshot == commit
+        assert git(git_repo, "rev-parse", base).strip() == head
+
+        worktree_mgr.remove_worktree(path, force=True)
+        git(git_repo, "branch", "-D", "agent-1")
+        # Changes are restored before setup commands run
+        revived = worktree_mgr.setup_worktree(
+            "agent-1",
+            WorktreeSetup(restore=snapshot, commands=["cp new.txt seen.txt"]),
+            base=base,
+        )
+        assert (revived / "seen.txt").read_text() == "untracked"
+        (revived / "seen.txt").unlink()
+        assert git(revived, "status", "--porcelain") == status
+        assert (revived / "new.txt").read_text() == "untracked"
+
+    def test_bundle_replaces_refs(self, git_repo, temp_dir):
+        """Test a batch's refs move into its bundle and can be read back."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        for branch in ("agent-1", "agent-2"):
+            path = make_agent_worktree(worktree_mgr, branch)
+            archive_worktree(worktree_mgr, path, "batch1", branch)
+        # Nothing beyond HEAD to bundle: stays a ref
+        current = git(git_repo, "branch", "--show-current").strip()
+        assert archive_worktree(worktree_mgr, temp_dir / "gone", "batch1", current)
+
+        bundle = bundle_batch(worktree_mgr, "batch1")
+
+        assert bundle is not None and bundle.exists()
+        refs = git(git_repo, "for-each-ref", "--format=%(refname)", "refs/aifleet")
+        assert "agent-" not in refs
+        assert f"refs/aifleet/archive/batch1/{current}" in refs
+        entries = {e.branch: e for e in list_archive(worktree_mgr)}
+        assert entries["agent-1"].bundle == bundle
+        assert entries["agent-2"].bundle == bundle
+
+        base, snapshot = restore_point(worktree_mgr, entries["agent-2"])
+        assert snapshot is not None
+        assert git(git_repo, "cat-file", "-t", snapshot).strip() == "commit"
@@ -0,0 +1,96 @@
+"""Tests for the agents' shared caches."""
+
+import os
+import shlex
+from unittest.mock import MagicMock, patch
+
+from aifleet.caches import cache_environment, parse_size, trim_cache
+from aifleet.launcher import launch_agent
+
+
+def make_config(temp_dir, tools, limits=None):
+    """Create a config sharing the given tools' caches."""
+    config = MagicMock()
+    config.shared_caches = tools
+    config.cache_root = temp_dir / "cache"
+    config.worktree_root = temp_dir / "worktrees"
+    config.cache_limit = lambda tool: (limits or {}).get(tool, "10G")
+    return config
+
+
+class TestSharedCaches:
+    """Test shared cache provisioning, trimming and injection."""
+
+    def test_environment_provisions_directories(self, temp_dir):
+        """Test each tool's variables point at created shared directories."""
+        config = make_config(temp_dir, ["ccache", "go", "pip", "unknown"])
+
+        env = cache_environment(config)
+
+        root = temp_dir / "cache"
+        assert env["CCACHE_DIR"] == str(root / "ccache")
+        assert env["CCACHE_MAXSIZE"] == "10G"
+        assert env["CCACHE_BASEDIR"] == str(temp_dir / "worktrees")
+        assert env["GOCACHE"] == str(root / "go" / "build")
+        assert env["GOMODCACHE"] == str(root / "go" / "mod")
+        assert env["PIP_CACHE_DIR"] == str(root / "pip")
+        assert all(os.path.isdir(env[k]) for k in ("CCACHE_DIR", "GOCACHE"))
+        assert cache_environment(make_config(temp_dir, [])) == {}
+
+    def test_cargo_compiles_through_sccache(self, temp_dir):
+        """Test Rust builds share sccache, not a target directory."""
+        config = make_config(temp_dir, ["cargo"], {"sccache": "5G"})
+
+        with patch("shutil.which", return_value="/usr/bin/sccache"):
+            env = cache_environment(config)
+        assert env == {
+            "RUSTC_WRAPPER": "sccache",
+            "SCCACHE_DIR": str(temp_dir / "cache" / "sccache"),
+            "SCCACHE_CACHE_SIZE": "5G",
+        }
+        assert trim_cache(config, "cargo") == 0
+
+        # Without sccache, cargo keeps its own per-worktree build
+        with patch("shutil.which", return_value=None):
+            assert cache_environment(config) == {}
+
+    def test_trim_removes_least_recently_used(self, temp_dir):
+        """Test trimming deletes the oldest files and keeps module caches."""
+        config = make_config(temp_dir, ["go"], {"go": "3K"})
+        cache_environment(config)
+        build, mod = (
+            temp_dir / "cache" / "go" / "build",
+            temp_dir / "cache" / "go" / "mod",
+        )
+        (mod / "module.zip").write_bytes(b"m" * 1024)
+        for age in range(4):
+            path = build / f"entry-{age}"
+            path.write_bytes(b"b" * 1024)
+            os.utime(path, (1000 - age, 1000 - age))
+
+        freed = trim_cache(config, "go")
+
+        assert freed == 2048
+        assert sorted(p.name for p in build.iterdir()) == ["entry-0", "entry-1"]
+        assert (mod / "module.zip").exists()
+        assert parse_size("1.5G") == 3 << 29
+
+    def test_agents_get_cache_environment(self, temp_dir):
+        """Test both launch modes hand the cache variables to the agent."""
+        tmux = MagicMock()
+        config = make_config(temp_dir, ["npm"])
+        config.claude_flags = ""
+        config.env_passthrough = []
+        config.spill_logs = False
+        config.event_hooks = False
+        npm_cache = f"npm_config_cache={temp_dir / 'cache' / 'npm'}"
+
+        config.launch_mode = "direct"
+        assert launch_agent(tmux, config, "b", "/wt", "claude")
+        assert npm_cache in shlex.split(tmux.create_session.call_args.kwargs["command"])
+
+        tmux.reset_mock()
+        config.launch_mode = "shell"
+        assert launch_agent(tmux, config, "b", "/wt", "claude")
+        command = tmux.send_command.call_args.args[1]
+        assert command == f"export {shlex.quote(npm_cache)}; claude"
@@ -107,7 +107,7 @@ class TestCreateCommand:
     """Test create command."""
 
     @patch("aifleet.commands.create.verify_agent_command")
-    @patch("aifleet.commands.create.TmuxManager")
+    @patch("aifleet.commands.create.get_session_manager")
     @patch("aifleet.commands.create.WorktreeManager")
     @patch("aifleet.commands.create.StateManager")
     @patch("aifleet.commands.create.ensure_project_config")
@@ -157,7 +157,7 @@ class TestCreateCommand:
         mock_tmux = MagicMock()
         mock_session = MagicMock()
         mock_tmux.create_session.return_value = mock_session
-        mock_tmux._session_name.return_value = "ai_test-branch"
+        mock_tmux.session_name.return_value = "ai_test-branch"
         mock_tmux.send_command.return_value = True
         mock_tmux.get_session_info.return_value = {"pid": 12345}
         mock_tmux_class.return_value = mock_tmux
@@ -194,6 +194,7 @@ class TestCreateCommand:
         mock_config.project_root = temp_dir
         mock_config.repo_root = temp_dir
         mock_config.default_agent = "claude"
+        mock_config.tmux_shards = 1
         mock_ensure_config_base.return_value = mock_config
         mock_ensure_config_create.return_value = mock_config
 
@@ -215,7 +216,7 @@ class TestCreateCommand:
 class TestListCommand:
     """Test list command."""
 
-    @patch("aifleet.commands.list.TmuxManager")
+    @patch("aifleet.commands.list.get_session_manager")
     @patch("aifleet.commands.list.StateManager")
     @patch("aifleet.commands.list.ensure_project_config")
     @patch("aifleet.commands.base.ensure_project_config")
@@ -253,7 +254,7 @@ class TestListCommand:
         assert result.exit_code == 0  # Success is what matters
 
     @patch("aifleet.commands.list.psutil")
-    @patch("aifleet.commands.list.TmuxManager")
+    @patch("aifleet.commands.list.get_session_manager")
     @patch("aifleet.commands.list.StateManager")
     @patch("aifleet.commands.list.ensure_project_config")
     @patch("aifleet.commands.base.ensure_project_config")
@@ -329,7 +330,7 @@ class TestListCommand:
         assert "100" in result.output  # Memory
 
     @patch("aifleet.commands.list.psutil")
-    @patch("aifleet.commands.list.TmuxManager")
+    @patch("aifleet.commands.list.get_session_manager")
     @patch("aifleet.commands.list.StateManager")
     @patch("aifleet.commands.list.ensure_project_config")
     @patch("aifleet.commands.base.ensure_project_config")
@@ -21,7 +21,9 @@ class TestAttachCommand:
                 "aifleet.commands.attach.ensure_project_config"
             ) as mock_ensure_config_attach:
                 with patch("aifleet.commands.attach.StateManager") as mock_state:
-                    with patch("aifleet.commands.attach.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.attach.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and attach module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_attach.return_value = mock_config
@@ -72,7 +74,7 @@ class TestAttachCommand:
                 "aifleet.commands.attach.ensure_project_config"
             ) as mock_ensure_config_attach:
                 with patch("aifleet.commands.attach.StateManager") as mock_state:
-                    with patch("aifleet.commands.attach.TmuxManager") as _:
+                    with patch("aifleet.commands.attach.get_session_manager") as _:
                         # Setup mocks - patch both base and attach module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_attach.return_value = mock_config
@@ -97,7 +99,9 @@ class TestAttachCommand:
                 "aifleet.commands.attach.ensure_project_config"
             ) as mock_ensure_config_attach:
                 with patch("aifleet.commands.attach.StateManager") as mock_state:
-                    with patch("aifleet.commands.attach.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.attach.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and attach module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_attach.return_value = mock_config
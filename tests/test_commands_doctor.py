@@ -0,0 +1,56 @@
+"""Tests for the doctor command."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from aifleet.commands.doctor import doctor
+from aifleet.state import Agent
+
+
+def make_agent(branch, worktree):
+    """Build an agent record for a worktree."""
+    return Agent(
+        branch=branch,
+        worktree=str(worktree),
+        session=f"ai_{branch}",
+        batch_id="batch1",
+        agent="claude",
+        created_at=datetime.now().isoformat(),
+    )
+
+
+class TestDoctorCommand:
+    """Test the doctor command."""
+
+    def test_reports_git_performance_per_worktree(self, temp_dir):
+        """Test active, inactive and partial profiles are told apart."""
+        for name in ("fast", "slow", "half"):
+            (temp_dir / name).mkdir()
+        statuses = {
+            "fast": {"core.untrackedCache": True, "index.version": True},
+            "slow": {"core.untrackedCache": False, "index.version": False},
+            "half": {"core.untrackedCache": True, "index.version": False},
+        }
+
+        with (
+            patch("aifleet.commands.doctor.ensure_project_config") as mock_config,
+            patch("aifleet.commands.doctor.StateManager") as mock_state,
+            patch("aifleet.commands.doctor.WorktreeManager") as mock_worktree,
+            patch("aifleet.commands.doctor.check_tools", return_value=[]),
+        ):
+            mock_config.return_value.validate.return_value = []
+            mock_state.return_value.list_agents.return_value = [
+                make_agent(name, temp_dir / name) for name in statuses
+            ]
+            mock_worktree.return_value.git_performance_status.side_effect = (
+                lambda path, fsmonitor: statuses[path.name]
+            )
+
+            result = CliRunner().invoke(doctor)
+
+        assert result.exit_code == 1
+        assert "✓ fast: active" in result.output
+        assert "- slow: inactive" in result.output
+        assert "✗ half: partial (missing index.version)" in result.output
@@ -0,0 +1,45 @@
+"""Tests for the fanout command."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from aifleet.commands.fanout import fanout
+from aifleet.tmux import TmuxManager
+
+
+class TestFanoutCommand:
+    """Test the fanout command."""
+
+    def test_fanout_records_real_session_name(self, temp_dir):
+        """Agents on dotted branches are stored under tmux's session name."""
+        with patch("aifleet.commands.fanout.ensure_project_config") as mock_config:
+            with patch("aifleet.commands.fanout.StateManager") as mock_state:
+                with patch(
+                    "aifleet.commands.fanout.get_session_manager",
+                    return_value=TmuxManager("ai_"),
+                ):
+                    with patch(
+                        "aifleet.commands.fanout.WorktreeManager"
+                    ) as mock_worktree:
+                        with patch(
+                            "aifleet.commands.fanout.launch_agent", return_value=True
+                        ):
+                            config = mock_config.return_value
+                            config.repo_root = temp_dir
+                            config.max_agents = 10
+                            config.default_agent = "claude"
+                            mock_worktree.return_value.setup_worktrees.return_value = [
+                                Path(temp_dir / "fix-v1.2-A")
+                            ]
+
+                            runner = CliRunner()
+                            result = runner.invoke(
+                                fanout, ["1", "fix-v1.2", "--prompt", "go"]
+                            )
+
+                            assert result.exit_code == 0
+                            agent = mock_state.return_value.add_agent.call_args[0][0]
+                            assert agent.branch == "fix-v1.2-A"
+                            assert agent.session == "ai_fix-v1-2-A"
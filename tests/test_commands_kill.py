@@ -22,7 +22,9 @@ class TestKillCommand:
                 "aifleet.commands.kill.ensure_project_config"
             ) as mock_ensure_config_kill:
                 with patch("aifleet.commands.kill.StateManager") as mock_state:
-                    with patch("aifleet.commands.kill.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.kill.get_session_manager"
+                    ) as mock_tmux:
                         with patch(
                             "aifleet.commands.kill.WorktreeManager"
                         ) as mock_worktree:
@@ -90,7 +92,9 @@ class TestKillCommand:
                 "aifleet.commands.kill.ensure_project_config"
             ) as mock_ensure_config_kill:
                 with patch("aifleet.commands.kill.StateManager") as mock_state:
-                    with patch("aifleet.commands.kill.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.kill.get_session_manager"
+                    ) as mock_tmux:
                         with patch(
                             "aifleet.commands.kill.WorktreeManager"
                         ) as mock_worktree:
@@ -182,7 +186,9 @@ class TestKillCommand:
                 "aifleet.commands.kill.ensure_project_config"
             ) as mock_ensure_config_kill:
                 with patch("aifleet.commands.kill.StateManager") as mock_state:
-                    with patch("aifleet.commands.kill.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.kill.get_session_manager"
+                    ) as mock_tmux:
                         with patch(
                             "aifleet.commands.kill.WorktreeManager"
                         ) as mock_worktree:
@@ -259,7 +265,9 @@ class TestKillCommand:
                 "aifleet.commands.kill.ensure_project_config"
             ) as mock_ensure_config_kill:
                 with patch("aifleet.commands.kill.StateManager") as mock_state:
-                    with patch("aifleet.commands.kill.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.kill.get_session_manager"
+                    ) as mock_tmux:
                         with patch(
                             "aifleet.commands.kill.WorktreeManager"
                         ) as mock_worktree:
@@ -320,7 +328,7 @@ class TestKillCommand:
                 "aifleet.commands.kill.ensure_project_config"
             ) as mock_ensure_config_kill:
                 with patch("aifleet.commands.kill.StateManager") as mock_state:
-                    with patch("aifleet.commands.kill.TmuxManager"):
+                    with patch("aifleet.commands.kill.get_session_manager"):
                         with patch("aifleet.commands.kill.WorktreeManager"):
                             # Setup mocks - patch both base and kill module
                             mock_config = mock_ensure_config_base.return_value
@@ -343,7 +351,7 @@ class TestKillCommand:
                 "aifleet.commands.kill.ensure_project_config"
             ) as mock_ensure_config_kill:
                 with patch("aifleet.commands.kill.StateManager") as mock_state:
-                    with patch("aifleet.commands.kill.TmuxManager"):
+                    with patch("aifleet.commands.kill.get_session_manager"):
                         with patch("aifleet.commands.kill.WorktreeManager"):
                             with patch(
                                 "aifleet.commands.kill.click.confirm",
@@ -374,3 +382,93 @@ class TestKillCommand:
                                 result = runner.invoke(kill, ["test-branch"])
                                 assert result.exit_code == 0
                                 # Should not kill anything since user cancelled
+
+    def test_kill_archive_with_pattern(self, temp_dir):
+        """--archive takes no value and force-releases the archived worktree."""
+        with patch("aifleet.commands.kill.ensure_project_config") as mock_ensure_config:
+            with patch("aifleet.commands.kill.StateManager") as mock_state:
+                with patch("aifleet.commands.kill.get_session_manager"):
+                    with patch(
+                        "aifleet.commands.kill.WorktreeManager"
+                    ) as mock_worktree:
+                        with patch(
+                            "aifleet.commands.kill.archive_worktree",
+                            return_value="abc123",
+                        ):
+                            with patch(
+                                "aifleet.commands.kill.delete_archived_branches"
+                            ):
+                                mock_config = mock_ensure_config.return_value
+                                mock_config.repo_root = temp_dir
+                                mock_config.worktree_on_kill = "remove"
+                                mock_config.maintenance_schedule = "off"
+
+                                agent = Agent(
+                                    branch="feature-A",
+                                    worktree="/path/worktree",
+                                    session="ai_feature-A",
+                                    batch_id="batch1",
+                                    agent="claude",
+                                    created_at=datetime.now().isoformat(),
+                                    pid=12345,
+                                )
+                                mock_state.return_value.list_agents.return_value = [
+                                    agent
+                                ]
+                                mock_worktree_rm = (
+                                    mock_worktree.return_value.remove_worktree
+                                )
+                                mock_worktree_rm.return_value = True
+
+                                with patch("pathlib.Path.exists", return_value=True):
+                                    runner = CliRunner()
+                                    result = runner.invoke(
+                                        kill, ["--force", "--archive", "feature-*"]
+                                    )
+                                    assert result.exit_code == 0, result.output
+
+                                    mock_worktree_rm.assert_called_once_with(
+                                        Path("/path/worktree"), force=True
+                                    )
+                                    mock_state.return_value.remove_agent.assert_called_once_with(
+                                        "feature-A"
+                                    )
+
+    def test_kill_stops_session_before_parking(self, temp_dir):
+        """The agent is stopped before its worktree is recycled."""
+        calls = []
+        with patch("aifleet.commands.kill.ensure_project_config") as mock_ensure_config:
+            with patch("aifleet.commands.kill.StateManager") as mock_state:
+                with patch("aifleet.commands.kill.get_session_manager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.kill.WorktreeManager"
+                    ) as mock_worktree:
+                        mock_config = mock_ensure_config.return_value
+                        mock_config.repo_root = temp_dir
+                        mock_config.worktree_on_kill = "recycle"
+                        mock_config.maintenance_schedule = "off"
+
+                        agent = Agent(
+                            branch="test-branch",
+                            worktree="/path/worktree",
+                            session="ai_test-branch",
+                            batch_id="batch1",
+                            agent="claude",
+                            created_at=datetime.now().isoformat(),
+                            pid=12345,
+                        )
+                        mock_state.return_value.list_agents.return_value = [agent]
+                        mock_tmux.return_value.session_exists.return_value = True
+                        mock_tmux.return_value.kill_session.side_effect = lambda *a: (
+                            calls.append("kill") or True
+                        )
+                        mock_worktree.return_value.park_worktree.side_effect = (
+                            lambda *a, **k: calls.append("park") or True
+                        )
+
+                        with patch("pathlib.Path.exists", return_value=True):
+                            runner = CliRunner()
+                            result = runner.invoke(kill, ["--force", "test-branch"])
+                            assert result.exit_code == 0, result.output
+
+                        assert calls == ["kill", "park"]
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import click.testing
 import pytest
 
-from aifleet.commands.list import create_agents_table, list
+from aifleet.commands.list import ListQuery, create_agents_table, list
 from aifleet.config import ConfigManager
 from aifleet.state import Agent, StateManager
 from aifleet.tmux import TmuxManager
@@ -15,6 +15,12 @@ from aifleet.tmux import TmuxManager
 class TestListCommand:
     """Tests for list command."""
 
+    @pytest.fixture(autouse=True)
+    def live_panes(self):
+        """Treat the made-up pane PIDs as running processes."""
+        with patch("aifleet.status.process_alive", return_value=True):
+            yield
+
     @pytest.fixture
     def sample_agents(self):
         """Create sample agents for testing."""
@@ -53,13 +59,14 @@ class TestListCommand:
         state.reconcile_with_tmux.return_value = []
 
         tmux_mgr = MagicMock(spec=TmuxManager)
+        tmux_mgr.session_activity.return_value = {}
         tmux_mgr.list_sessions.return_value = [
             ("ai_feature-1", 1234),
             ("ai_feature-2", 5678),
         ]
 
         # Mock status detection
-        def mock_get_agent_status(branch):
+        def mock_get_agent_status(branch, alive=None):
             if branch == "feature-1":
                 return "ready"
             elif branch == "feature-2":
@@ -98,6 +105,7 @@ class TestListCommand:
         state.reconcile_with_tmux.return_value = []
 
         tmux_mgr = MagicMock(spec=TmuxManager)
+        tmux_mgr.session_activity.return_value = {}
         tmux_mgr.list_sessions.return_value = [
             ("ai_feature-1", 1234),
             ("ai_feature-2", 5678),
@@ -124,7 +132,7 @@ class TestListCommand:
         with (
             patch("aifleet.commands.list.ensure_project_config") as mock_config,
             patch("aifleet.commands.list.StateManager"),
-            patch("aifleet.commands.list.TmuxManager"),
+            patch("aifleet.commands.list.get_session_manager"),
             patch("aifleet.commands.list.create_agents_table") as mock_create,
             patch("aifleet.commands.list.console"),
         ):
@@ -143,38 +151,39 @@ class TestListCommand:
             # Check create_agents_table was called once
             mock_create.assert_called_once()
 
-    def test_list_command_watch_mode(self):
+    def test_list_command_watch_mode(self, sample_agents):
         """Test list command in watch mode."""
         runner = click.testing.CliRunner()
 
         with (
             patch("aifleet.commands.list.ensure_project_config") as mock_config,
             patch("aifleet.commands.list.StateManager"),
-            patch("aifleet.commands.list.TmuxManager"),
-            patch("aifleet.commands.list.create_agents_table") as mock_create,
-            patch("aifleet.commands.list.console"),
-            patch("time.sleep") as mock_sleep,
+            patch("aifleet.commands.list.get_session_manager"),
+            patch("aifleet.commands.list.load_agents") as mock_load,
+            patch("aifleet.commands.list.get_process_stats", return_value=(0, 0)),
+            patch("aifleet.commands.list.console") as mock_console,
+            patch("aifleet.commands.viewport.KeyReader") as mock_reader,
         ):
             # Setup mocks
             config = MagicMock(spec=ConfigManager)
             config.repo_root = "/test/repo"
             config.tmux_prefix = "ai_"
             mock_config.return_value = config
+            mock_load.return_value = (sample_agents, {}, [])
+            mock_console.size.height = 40
 
-            # Simulate KeyboardInterrupt after 2 iterations
-            mock_sleep.side_effect = [None, KeyboardInterrupt]
+            # Two refresh ticks, one key press, then quit
+            keys = mock_reader.return_value.__enter__.return_value
+            keys.read.side_effect = [None, "j", None, "q"]
 
             # Run command with --watch
             result = runner.invoke(list, ["--watch"])
 
-            # Check it exited with code 0 (handled KeyboardInterrupt)
+            # Check it exited cleanly
             assert result.exit_code == 0
 
-            # Check create_agents_table was called multiple times
-            assert mock_create.call_count >= 2
-
-            # Check exit code is 0 (successfully handled interruption)
-            # Note: Rich console output might not be captured in test runner
+            # Agents are probed on the first frame and on every tick
+            assert mock_load.call_count == 3
 
     def test_list_command_all_statuses(self, sample_agents):
         """Test that all status types are handled correctly."""
@@ -185,6 +194,7 @@ class TestListCommand:
         config.tmux_prefix = "ai_"
         state = MagicMock(spec=StateManager)
         tmux_mgr = MagicMock(spec=TmuxManager)
+        tmux_mgr.session_activity.return_value = {}
 
         # Create one agent for each status
         agents = []
@@ -207,7 +217,7 @@ class TestListCommand:
         ]
 
         # Mock status detection to return each status type
-        def mock_get_status(branch):
+        def mock_get_status(branch, alive=None):
             for status in statuses:
                 if f"feature-{status}" in branch:
                     return status
@@ -224,3 +234,118 @@ class TestListCommand:
             caption = table.caption
             for status in statuses:
                 assert f"{status}: 1" in caption
+
+    @pytest.mark.parametrize("output_format", ["json", "ndjson", "tsv"])
+    def test_list_machine_formats(self, sample_agents, output_format):
+        """Test machine-readable formats emit one record per agent."""
+        import json
+
+        runner = click.testing.CliRunner()
+
+        with (
+            patch("aifleet.commands.list.ensure_project_config") as mock_config,
+            patch("aifleet.commands.list.StateManager") as mock_state_class,
+            patch("aifleet.commands.list.get_session_manager") as mock_tmux_class,
+            patch("aifleet.commands.list.get_process_stats", return_value=(1.5, 64)),
+        ):
+            config = MagicMock(spec=ConfigManager)
+            config.repo_root = "/test/repo"
+            config.tmux_prefix = "ai_"
+            mock_config.return_value = config
+
+            mock_state_class.return_value.list_agents.return_value = sample_agents
+            mock_state_class.return_value.remove_agents.return_value = []
+            tmux_mgr = mock_tmux_class.return_value
+            tmux_mgr.list_sessions.return_value = [("ai_feature-1", 1234)]
+            tmux_mgr.get_agent_status.side_effect = lambda branch, alive=None: (
+                "ready" if alive else "dead"
+            )
+
+            result = runner.invoke(list, ["--all", "--format", output_format])
+
+        assert result.exit_code == 0
+        lines = result.output.strip().splitlines()
+
+        if output_format == "json":
+            records = json.loads(result.output)
+        elif output_format == "ndjson":
+            records = [json.loads(line) for line in lines]
+        else:
+            header = lines[0].split("\t")
+            records = [dict(zip(header, line.split("\t"))) for line in lines[1:]]
+
+        assert [r["branch"] for r in records] == ["feature-1", "feature-2"]
+        assert [r["status"] for r in records] == ["ready", "dead"]
+
+    def test_list_watch_rejects_machine_format(self):
+        """Test watch mode only renders tables."""
+        runner = click.testing.CliRunner()
+        result = runner.invoke(list, ["--watch", "--format", "json"])
+        assert result.exit_code != 0
+        assert "--watch only supports the table format" in result.output
+
+    def test_list_filters_before_probing(self, sample_agents):
+        """Cheap filters run before any probe; unused probes are skipped."""
+        config = MagicMock(spec=ConfigManager)
+        config.tmux_prefix = "ai_"
+        state = MagicMock(spec=StateManager)
+        state.list_agents.return_value = sample_agents + [
+            Agent(
+                branch="other-1",
+                session="ai_other-1",
+                agent="claude",
+                batch_id="batch2",
+                created_at=datetime.now().isoformat(),
+                worktree="/path/to/other",
+                pid=4321,
+            )
+        ]
+        state.remove_agents.return_value = []
+        tmux_mgr = MagicMock(spec=TmuxManager)
+        tmux_mgr.session_activity.return_value = {}
+        tmux_mgr.list_sessions.return_value = [
+            ("ai_feature-1", 1234),
+            ("ai_feature-2", 5678),
+            ("ai_other-1", 4321),
+        ]
+
+        query = ListQuery(columns=["branch", "batch_id"], batch="batch2")
+        with patch("aifleet.commands.list.get_process_stats") as mock_stats:
+            table = create_agents_table(
+                config, state, tmux_mgr, grouped=False, all=False, query=query
+            )
+
+        assert [c.header for c in table.columns] == ["BRANCH", "BATCH"]
+        assert table.row_count == 1
+        tmux_mgr.get_agent_status.assert_not_called()
+        mock_stats.assert_not_called()
+
+    def test_list_status_filter_probes_only_selected(self, sample_agents):
+        """The status filter probes status for cheaply-selected agents only."""
+        config = MagicMock(spec=ConfigManager)
+        config.tmux_prefix = "ai_"
+        state = MagicMock(spec=StateManager)
+        state.list_agents.return_value = sample_agents
+        state.remove_agents.return_value = []
+        tmux_mgr = MagicMock(spec=TmuxManager)
+        tmux_mgr.session_activity.return_value = {}
+        tmux_mgr.list_sessions.return_value = [
+            ("ai_feature-1", 1234),
+            ("ai_feature-2", 5678),
+        ]
+        tmux_mgr.get_agent_status.return_value = "running"
+
+        query = ListQuery(columns=["branch"], pattern="*-2", statuses=("running",))
+        table = create_agents_table(
+            config, state, tmux_mgr, grouped=False, all=False, query=query
+        )
+
+        assert table.row_count == 1
+        tmux_mgr.get_agent_status.assert_called_once_with("feature-2", alive=True)
+
+    def test_list_unknown_column(self):
+        """Test unknown columns are rejected."""
+        runner = click.testing.CliRunner()
+        result = runner.invoke(list, ["--columns", "branch,bogus"])
+        assert result.exit_code != 0
+        assert "Unknown column 'bogus'" in result.output
@@ -21,7 +21,9 @@ class TestLogsCommand:
                 "aifleet.commands.logs.ensure_project_config"
             ) as mock_ensure_config_logs:
                 with patch("aifleet.commands.logs.StateManager") as mock_state:
-                    with patch("aifleet.commands.logs.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.logs.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and logs module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_logs.return_value = mock_config
@@ -72,7 +74,9 @@ class TestLogsCommand:
                 "aifleet.commands.logs.ensure_project_config"
             ) as mock_ensure_config_logs:
                 with patch("aifleet.commands.logs.StateManager") as mock_state:
-                    with patch("aifleet.commands.logs.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.logs.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and logs module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_logs.return_value = mock_config
@@ -117,7 +121,7 @@ class TestLogsCommand:
                 "aifleet.commands.logs.ensure_project_config"
             ) as mock_ensure_config_logs:
                 with patch("aifleet.commands.logs.StateManager") as mock_state:
-                    with patch("aifleet.commands.logs.TmuxManager") as _:
+                    with patch("aifleet.commands.logs.get_session_manager") as _:
                         # Setup mocks - patch both base and logs module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_logs.return_value = mock_config
@@ -142,7 +146,9 @@ class TestLogsCommand:
                 "aifleet.commands.logs.ensure_project_config"
             ) as mock_ensure_config_logs:
                 with patch("aifleet.commands.logs.StateManager") as mock_state:
-                    with patch("aifleet.commands.logs.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.logs.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and logs module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_logs.return_value = mock_config
@@ -183,7 +189,9 @@ class TestLogsCommand:
                 "aifleet.commands.logs.ensure_project_config"
             ) as mock_ensure_config_logs:
                 with patch("aifleet.commands.logs.StateManager") as mock_state:
-                    with patch("aifleet.commands.logs.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.logs.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and logs module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_logs.return_value = mock_config
@@ -215,3 +223,32 @@ class TestLogsCommand:
 
                         # Should still succeed but with different message
                         mock_tmux.return_value.get_session_output.assert_called_once()
+
+    def test_logs_stitches_spilled_output(self, temp_dir):
+        """Test spilled output is shown before the live pane, without repeats."""
+        with patch("aifleet.commands.logs.ensure_project_config") as mock_ensure:
+            with patch("aifleet.commands.logs.StateManager") as mock_state:
+                with patch("aifleet.commands.logs.get_session_manager") as mock_tmux:
+                    mock_ensure.return_value.repo_root = temp_dir
+                    agent = Agent(
+                        branch="test-branch",
+                        worktree="/path/worktree",
+                        session="ai_test-branch",
+                        batch_id="batch1",
+                        agent="claude",
+                        created_at=datetime.now().isoformat(),
+                    )
+                    mock_state.return_value.get_agent.return_value = agent
+
+                    directory = temp_dir / ".aifleet" / "logs" / "ai_test-branch"
+                    directory.mkdir(parents=True)
+                    (directory / "current.log").write_text("one\ntwo\nthree\n")
+                    mock_tmux.return_value.session_exists.return_value = True
+                    mock_tmux.return_value.get_session_output.return_value = (
+                        "two\nthree\nfour\n\n"
+                    )
+
+                    runner = CliRunner()
+                    result = runner.invoke(logs, ["test-branch", "--lines", "3"])
+                    assert result.exit_code == 0
+                    assert result.output == "two\nthree\nfour\n"
@@ -0,0 +1,43 @@
+"""Tests for the multi command."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from aifleet.commands.multi import multi
+from aifleet.tmux import TmuxManager
+
+
+class TestMultiCommand:
+    """Test the multi command."""
+
+    def test_multi_records_real_session_name(self, temp_dir):
+        """Agents on dotted branches are stored under tmux's session name."""
+        with patch("aifleet.commands.multi.ensure_project_config") as mock_config:
+            with patch("aifleet.commands.multi.StateManager") as mock_state:
+                with patch(
+                    "aifleet.commands.multi.get_session_manager",
+                    return_value=TmuxManager("ai_"),
+                ):
+                    with patch(
+                        "aifleet.commands.multi.WorktreeManager"
+                    ) as mock_worktree:
+                        with patch(
+                            "aifleet.commands.multi.launch_agent", return_value=True
+                        ):
+                            config = mock_config.return_value
+                            config.repo_root = temp_dir
+                            config.default_agent = "claude"
+                            mock_state.return_value.get_agent.return_value = None
+                            mock_worktree.return_value.setup_worktrees.return_value = [
+                                Path(temp_dir / "fix-v1.2")
+                            ]
+
+                            runner = CliRunner()
+                            result = runner.invoke(multi, ["fix-v1.2:bump the version"])
+
+                            assert result.exit_code == 0
+                            agent = mock_state.return_value.add_agent.call_args[0][0]
+                            assert agent.branch == "fix-v1.2"
+                            assert agent.session == "ai_fix-v1-2"
@@ -1,11 +1,12 @@
 """Tests for the prompt command."""
 
+import io
 from datetime import datetime
 from unittest.mock import patch
 
 from click.testing import CliRunner
 
-from aifleet.commands.prompt import prompt
+from aifleet.commands.prompt import prompt, read_prompt_map
 from aifleet.state import Agent
 
 
@@ -22,7 +23,9 @@ class TestPromptCommand:
                 "aifleet.commands.prompt.ensure_project_config"
             ) as mock_ensure_config_prompt:
                 with patch("aifleet.commands.prompt.StateManager") as mock_state:
-                    with patch("aifleet.commands.prompt.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.prompt.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and prompt module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_prompt.return_value = mock_config
@@ -44,7 +47,7 @@ class TestPromptCommand:
 
                         # Mock tmux operations
                         mock_tmux.return_value.session_exists.return_value = True
-                        mock_tmux.return_value.send_command.return_value = True
+                        mock_tmux.return_value.send_prompt.return_value = True
 
                         # Run command
                         runner = CliRunner()
@@ -60,7 +63,7 @@ class TestPromptCommand:
                     mock_tmux.return_value.session_exists.assert_called_once_with(
                         "test-branch"
                     )
-                    mock_tmux.return_value.send_command.assert_called_once_with(
+                    mock_tmux.return_value.send_prompt.assert_called_once_with(
                         "test-branch", "New prompt message"
                     )
 
@@ -73,7 +76,7 @@ class TestPromptCommand:
                 "aifleet.commands.prompt.ensure_project_config"
             ) as mock_ensure_config_prompt:
                 with patch("aifleet.commands.prompt.StateManager") as mock_state:
-                    with patch("aifleet.commands.prompt.TmuxManager") as _:
+                    with patch("aifleet.commands.prompt.get_session_manager") as _:
                         # Setup mocks - patch both base and prompt module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_prompt.return_value = mock_config
@@ -98,13 +101,16 @@ class TestPromptCommand:
                 "aifleet.commands.prompt.ensure_project_config"
             ) as mock_ensure_config_prompt:
                 with patch("aifleet.commands.prompt.StateManager") as mock_state:
-                    with patch("aifleet.commands.prompt.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.prompt.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and prompt module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_prompt.return_value = mock_config
                         mock_config.repo_root = temp_dir
                         mock_config.project_root = temp_dir
                         mock_config.tmux_prefix = "ai_"
+                        mock_config.tmux_shards = 1
 
                     # Mock agent
                     agent = Agent(
@@ -139,7 +145,9 @@ class TestPromptCommand:
                 "aifleet.commands.prompt.ensure_project_config"
             ) as mock_ensure_config_prompt:
                 with patch("aifleet.commands.prompt.StateManager") as mock_state:
-                    with patch("aifleet.commands.prompt.TmuxManager") as mock_tmux:
+                    with patch(
+                        "aifleet.commands.prompt.get_session_manager"
+                    ) as mock_tmux:
                         # Setup mocks - patch both base and prompt module
                         mock_config = mock_ensure_config_base.return_value
                         mock_ensure_config_prompt.return_value = mock_config
@@ -162,9 +170,86 @@ class TestPromptCommand:
                     # Mock tmux operations
                     mock_tmux.return_value.session_exists.return_value = True
                     # Send fails
-                    mock_tmux.return_value.send_command.return_value = False
+                    mock_tmux.return_value.send_prompt.return_value = False
 
                     # Run command and expect exit
                     runner = CliRunner()
                     result = runner.invoke(prompt, ["test-branch", "Message"])
                     assert result.exit_code == 1
+
+    def test_prompt_from_file_and_stdin(self, temp_dir):
+        """Test reading the prompt from --file and from stdin."""
+        spec = temp_dir / "spec.md"
+        spec.write_text('line one\nit\'s "quoted"\n')
+
+        with patch("aifleet.commands.prompt.ensure_project_config") as mock_config:
+            with patch("aifleet.commands.prompt.StateManager"):
+                with patch("aifleet.commands.prompt.get_session_manager") as mock_tmux:
+                    mock_config.return_value.repo_root = temp_dir
+                    mock_tmux.return_value.session_exists.return_value = True
+                    mock_tmux.return_value.send_prompt.return_value = True
+                    runner = CliRunner()
+
+                    result = runner.invoke(prompt, ["b", "--file", str(spec)])
+                    assert result.exit_code == 0
+                    mock_tmux.return_value.send_prompt.assert_called_with(
+                        "b", 'line one\nit\'s "quoted"'
+                    )
+
+                    result = runner.invoke(prompt, ["b", "-"], input="from stdin\n")
+                    assert result.exit_code == 0
+                    mock_tmux.return_value.send_prompt.assert_called_with(
+                        "b", "from stdin"
+                    )
+
+                    result = runner.invoke(prompt, ["b", "x", "--file", str(spec)])
+                    assert result.exit_code == 2
+
+    def test_prompt_batch_broadcast(self, temp_dir):
+        """Test a batch broadcast is one delivery call with a per-agent report."""
+        agents = [
+            Agent(
+                branch=branch,
+                worktree=f"/wt/{branch}",
+                session=f"ai_{branch}",
+                batch_id="batch1",
+                agent="claude",
+                created_at=datetime.now().isoformat(),
+            )
+            for branch in ["a", "b", "dead"]
+        ]
+
+        with patch("aifleet.commands.prompt.ensure_project_config") as mock_config:
+            with patch("aifleet.commands.prompt.StateManager") as mock_state:
+                with patch("aifleet.commands.prompt.get_session_manager") as mock_tmux:
+                    mock_config.return_value.repo_root = temp_dir
+                    mock_state.return_value.list_agents.return_value = agents
+                    tmux = mock_tmux.return_value
+                    tmux.list_sessions.return_value = [("ai_a", 1), ("ai_b", 2)]
+                    tmux.send_prompts.return_value = {"a": True, "b": False}
+
+                    result = CliRunner().invoke(
+                        prompt, ["--batch", "batch1", "run the tests"]
+                    )
+
+                    assert result.exit_code == 1
+                    tmux.send_prompts.assert_called_once_with(
+                        {"a": "run the tests", "b": "run the tests"}
+                    )
+                    tmux.session_exists.assert_not_called()
+                    assert "✓ a" in result.output
+                    assert "✗ b (delivery failed)" in result.output
+                    assert "✗ dead (no session)" in result.output
+                    assert "Sent prompt to 1/3 agent(s)" in result.output
+
+    def test_read_prompt_map(self):
+        """Test JSON and branch:prompt map formats."""
+        assert read_prompt_map(io.StringIO('{"a": "one", "b": "two"}')) == {
+            "a": "one",
+            "b": "two",
+        }
+        lines = "# comment\na: fix: the bug\n\nb:add tests\n"
+        assert read_prompt_map(io.StringIO(lines)) == {
+            "a": "fix: the bug",
+            "b": "add tests",
+        }
@@ -157,6 +157,14 @@ class TestConfigManager:
         errors = config.validate()
         assert len(errors) == 0
 
+        # Credential patterns must stay inside the repository
+        config.set("setup.credential_files", ["../secrets/*.key"])
+        errors = config.validate()
+        assert errors == [
+            "Credential file outside the repository: ../secrets/*.key "
+            "(use a path relative to the repository root)"
+        ]
+
     def test_backward_compatibility_properties(self, tmp_path):
         """Test backward compatibility properties."""
         git_repo = tmp_path / "test-project"
@@ -170,6 +178,7 @@ class TestConfigManager:
         assert config.repo_root == git_repo
         assert isinstance(config.worktree_root, Path)
         assert config.tmux_prefix == "ai_"
+        assert config.tmux_socket is None
         assert config.default_agent == "claude"
         assert config.claude_flags == "--dangerously-skip-permissions"
         assert config.credential_files == []
@@ -0,0 +1,81 @@
+"""Tests for credential file sync."""
+
+import os
+
+from aifleet.credentials import expand_sources, sync_credentials
+
+
+def make_sources(root):
+    """Create a project with a few credential files."""
+    (root / "config").mkdir(parents=True)
+    (root / "config" / "master.key").write_text("secret-key")
+    (root / ".env").write_text("API_KEY=test")
+    (root / ".env.local").write_text("DEBUG=1")
+    (root / "certs" / "dev").mkdir(parents=True)
+    (root / "certs" / "dev" / "ca.pem").write_text("ca")
+
+
+class TestCredentialSync:
+    """Test incremental credential sync."""
+
+    def test_expand_globs_and_directories(self, temp_dir):
+        """Test patterns expand to files and unmatched ones are reported."""
+        make_sources(temp_dir)
+
+        files, missing = expand_sources(
+            temp_dir, [".env*", "certs", "config/master.key", "nope/*", "gone.key"]
+        )
+
+        assert files == [".env", ".env.local", "certs/dev/ca.pem", "config/master.key"]
+        assert missing == ["nope/*", "gone.key"]
+
+    def test_patterns_outside_root_never_match(self, temp_dir):
+        """Test patterns reaching outside the root are reported, not copied."""
+        make_sources(temp_dir / "repo")
+        (temp_dir / "outside.key").write_text("not ours")
+
+        patterns = ["../outside.key", "../*.key", str(temp_dir / "outside.key")]
+        files, missing = expand_sources(temp_dir / "repo", patterns)
+
+        assert files == []
+        assert missing == patterns
+
+    def test_only_changed_files_are_written(self, temp_dir):
+        """Test a second sync leaves unchanged files alone."""
+        source, target = temp_dir / "repo", temp_dir / "worktree"
+        make_sources(source)
+        patterns = [".env*", "config/master.key"]
+
+        first = sync_credentials(source, target, patterns)
+        assert sorted(first.updated) == [".env", ".env.local", "config/master.key"]
+
+        # Same content with a new mtime is detected by hash and not rewritten
+        os.utime(source / ".env", ns=(0, 1_000_000_000))
+        inode = (target / ".env").stat().st_ino
+        (source / ".env.local").write_text("DEBUG=0")
+
+        second = sync_credentials(source, target, patterns)
+
+        assert second.updated == [".env.local"]
+        assert sorted(second.unchanged) == [".env", "config/master.key"]
+        assert (target / ".env").stat().st_ino == inode
+        assert (target / ".env").stat().st_mtime_ns == 1_000_000_000
+        assert (target / ".env.local").read_text() == "DEBUG=0"
+
+    def test_link_strategies(self, temp_dir):
+        """Test hardlink, symlink and reflink (or its copy fallback)."""
+        source = temp_dir / "repo"
+        make_sources(source)
+        src = source / ".env"
+
+        sync_credentials(source, temp_dir / "hard", [".env"], "hardlink")
+        assert (temp_dir / "hard" / ".env").stat().st_ino == src.stat().st_ino
+
+        sync_credentials(source, temp_dir / "sym", [".env"], "symlink")
+        assert os.readlink(temp_dir / "sym" / ".env") == str(src)
+        again = sync_credentials(source, temp_dir / "sym", [".env"], "symlink")
+        assert again.unchanged == [".env"]
+
+        result = sync_credentials(source, temp_dir / "ref", [".env"], "reflink")
+        assert result.updated == [".env"]
+        assert (temp_dir / "ref" / ".env").read_text() == "API_KEY=test"
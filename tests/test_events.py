@@ -0,0 +1,88 @@
+"""Tests for tmux-pushed agent events."""
+
+from unittest.mock import MagicMock, patch
+
+from aifleet.events import Event, parse_event, read_events, rotate_event_log
+from aifleet.tmux import TmuxManager
+
+
+class TestEvents:
+    """Test event records and hook installation."""
+
+    def test_parse_and_read(self, temp_dir):
+        """Hook names map to event kinds; malformed lines are skipped."""
+        log = temp_dir / "events.log"
+        log.write_text(
+            "100 alert-silence ai_a\n"
+            "garbage\n"
+            "101 alert-activity ai_a\n"
+            "102 session-closed[42] ai_b\n"
+        )
+
+        assert parse_event("100 alert-silence ai_a") == Event(100, "idle", "ai_a")
+        assert [e.kind for e in read_events(log)] == ["idle", "active", "closed"]
+        assert read_events(log, limit=1) == [Event(102, "closed", "ai_b")]
+        assert read_events(temp_dir / "missing.log") == []
+
+    def test_install_event_hooks(self):
+        """Hooks are installed in one tmux call and log to the given file."""
+        tmux_mgr = TmuxManager()
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert tmux_mgr.install_event_hooks("feature", "/p/events.log", 30)
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert "alert-silence" in args and "alert-activity" in args
+        assert args[args.index("monitor-silence") + 1] == "30"
+        hooks = [a for a in args if a.startswith("run-shell")]
+        assert hooks and all('>> "/p/events.log"' in h for h in hooks)
+        # The user's own server gets no global hooks
+        assert "-g" not in args
+
+    def test_global_hook_only_on_fleet_server(self):
+        """The session-closed hook is set and removed on a dedicated server."""
+        with patch("libtmux.Server"):
+            tmux_mgr = TmuxManager(socket_name="fleet")
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert tmux_mgr.install_event_hooks("feature", "/p/events.log", 30)
+            args = mock_run.call_args[0][0]
+            slot = args[args.index("-g") + 1]
+            assert slot.startswith("session-closed[")
+
+            assert tmux_mgr.remove_event_hooks("/p/events.log")
+            assert mock_run.call_args[0][0] == [
+                "tmux",
+                "-L",
+                "fleet",
+                "set-hook",
+                "-gu",
+                slot,
+            ]
+
+        with patch("subprocess.run") as mock_run:
+            assert TmuxManager().remove_event_hooks("/p/events.log")
+        mock_run.assert_not_called()
+
+    def test_rotate_event_log(self, temp_dir):
+        """A large log is moved aside and still read."""
+        log = temp_dir / "events.log"
+        log.write_text("100 alert-silence ai_a\n")
+        assert not rotate_event_log(log, 100)
+        assert rotate_event_log(log, 10)
+        assert not log.exists()
+
+        log.write_text("101 session-closed ai_a\n")
+        assert [e.kind for e in read_events(log)] == ["idle", "closed"]
+        assert not rotate_event_log(temp_dir / "missing.log", 10)
+
+    def test_install_event_hooks_rejects_unsafe_path(self):
+        """Paths that would break the hook's shell quoting are refused."""
+        with patch("subprocess.run") as mock_run:
+            assert not TmuxManager().install_event_hooks("b", "/p/it's.log", 30)
+        mock_run.assert_not_called()
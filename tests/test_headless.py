@@ -0,0 +1,96 @@
+"""Tests for the headless session backend."""
+
+import time
+
+from aifleet.headless import (
+    HeadlessManager,
+    Supervisor,
+    _Session,
+    control_socket_path,
+    run_dir,
+    tail_log,
+)
+
+
+def wait_for(check, timeout=5.0):
+    """Poll until check() is truthy or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = check()
+        if result:
+            return result
+        time.sleep(0.05)
+    return check()
+
+
+class TestHeadless:
+    """Tests for the PTY supervisor and its client."""
+
+    def test_session_lifecycle(self, temp_dir):
+        """Test create, prompt, output, list and kill without tmux."""
+        manager = HeadlessManager(temp_dir)
+        events = temp_dir / "events.log"
+
+        assert manager.create_session("a", str(temp_dir), "cat")
+        assert manager.install_event_hooks("a", str(events), 60)
+        assert manager.send_prompt("a", "first line\nsecond line")
+
+        output = wait_for(
+            lambda: "second line" in (manager.get_session_output("a", 10) or "")
+        )
+        assert output
+        assert (
+            manager.get_session_info("a")["pid"]
+            == dict(manager.list_sessions())["ai_a"]
+        )
+        assert "ai_a" in manager.session_activity()
+        assert len(manager.server_pids()) == 1
+        assert manager.status_cache_misses == 0
+
+        assert manager.kill_session("a")
+        assert not manager.session_exists("a")
+        assert wait_for(lambda: "session-closed ai_a" in events.read_text())
+
+        # Output stays readable after the session is gone
+        assert "first line" in manager.get_session_output("a", 10)
+        # The supervisor exits with its last session
+        assert wait_for(lambda: manager._request({"op": "ping"}) is None)
+
+    def test_session_exit_is_noticed(self, temp_dir):
+        """Test a session whose process exits disappears from the list."""
+        manager = HeadlessManager(temp_dir)
+
+        assert manager.create_session("a", str(temp_dir), "echo bye")
+        assert wait_for(lambda: not manager.session_exists("a"))
+        assert manager.get_session_output("a", 5) == "bye\n"
+        assert not manager.kill_session("a")
+
+    def test_tail_log(self, temp_dir):
+        """Test only the last lines are returned, without terminal escapes."""
+        log = temp_dir / "a.log"
+        log.write_bytes(b"".join(b"\x1b[1mline%d\x1b[0m\r\n" % i for i in range(1000)))
+
+        assert tail_log(log, 2) == ["line998", "line999"]
+        assert tail_log(temp_dir / "missing.log", 2) is None
+
+    def test_log_rotation(self, temp_dir):
+        """Test a rotated log keeps one segment and tails read across it."""
+        supervisor = Supervisor(temp_dir)
+        log = open(temp_dir / "ai_a.log", "wb", buffering=0)
+        session = _Session("ai_a", 0, -1, log, 0)
+        session.log.write(b"old\r\n")
+
+        supervisor._rotate_log(session)
+        session.log.write(b"new\r\n")
+
+        assert (temp_dir / "ai_a.log.1").read_bytes() == b"old\r\n"
+        assert session.log_bytes == 0
+        assert tail_log(temp_dir / "ai_a.log", 2) == ["old", "new"]
+        assert tail_log(temp_dir / "ai_a.log", 1) == ["new"]
+        session.log.close()
+
+    def test_long_socket_path(self, temp_dir):
+        """Test socket paths too long for AF_UNIX move to the temp dir."""
+        deep = temp_dir / ("x" * 120)
+        assert len(control_socket_path(run_dir(deep))) < 100
+        assert control_socket_path(run_dir(temp_dir)).startswith(str(temp_dir))
@@ -0,0 +1,69 @@
+"""Tests for agent launching."""
+
+import shlex
+import subprocess
+from unittest.mock import MagicMock
+
+from aifleet.launcher import (
+    agent_environment,
+    build_agent_argv,
+    direct_command,
+    launch_agent,
+)
+
+
+class TestLauncher:
+    """Tests for launcher helpers."""
+
+    def test_build_agent_argv(self):
+        """Flags only apply to claude and the prompt stays one argument."""
+        argv = build_agent_argv("claude", "--a --b=1", 'it\'s a "test"')
+        assert argv == ["claude", "--a", "--b=1", 'it\'s a "test"']
+        assert build_agent_argv("aider", "--a") == ["aider"]
+
+    def test_agent_environment(self, monkeypatch):
+        """Only allowlisted variables are copied."""
+        monkeypatch.setenv("PATH", "/usr/bin")
+        monkeypatch.setenv("SECRET", "x")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+
+        env = agent_environment(["ANTHROPIC_API_KEY"], {"EXTRA": "1"})
+
+        assert env["PATH"] == "/usr/bin"
+        assert env["ANTHROPIC_API_KEY"] == "key"
+        assert env["EXTRA"] == "1"
+        assert "SECRET" not in env
+
+    def test_direct_command_round_trips_prompt(self):
+        """A prompt with quotes and shell syntax reaches the agent verbatim."""
+        prompt = 'don\'t $(rm -rf) `x` "quoted"; echo hi'
+        command = direct_command(["printf", "%s", prompt], {}, fallback_shell=False)
+
+        assert shlex.split(command)[-1] == prompt
+        result = subprocess.run(
+            ["/bin/sh", "-c", command], capture_output=True, text=True
+        )
+        assert result.stdout == prompt
+
+    def test_launch_modes(self):
+        """Direct mode passes the command to the session; shell mode types it."""
+        tmux = MagicMock()
+        config = MagicMock()
+        config.claude_flags = ""
+        config.env_passthrough = []
+        config.fallback_shell = True
+        config.history_limit = 0
+        config.spill_logs = False
+        config.event_hooks = False
+
+        config.launch_mode = "direct"
+        assert launch_agent(tmux, config, "b", "/wt", "claude", "hi")
+        command = tmux.create_session.call_args.kwargs["command"]
+        assert shlex.split(command)[-2:] == ["claude", "hi"]
+        tmux.send_command.assert_not_called()
+
+        tmux.reset_mock()
+        config.launch_mode = "shell"
+        assert launch_agent(tmux, config, "b", "/wt", "claude", "hi")
+        tmux.create_session.assert_called_once_with("b", "/wt", history_limit=0)
+        tmux.send_command.assert_called_once_with("b", "claude hi")
@@ -0,0 +1,71 @@
+"""Tests for repository maintenance."""
+
+import shutil
+import subprocess
+
+from aifleet.maintenance import (
+    due_reason,
+    load_schedule,
+    maintain,
+    read_history,
+    record_kills,
+)
+from aifleet.worktree import WorktreeManager
+
+
+def git(repo, *args):
+    """Run git in a repository and return its output."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True
+    ).stdout
+
+
+class TestSchedule:
+    """Test when maintenance is due."""
+
+    def test_due_after_kills(self):
+        """Test enough kills trigger a run."""
+        schedule = {"last_run": 1000, "kills": 50, "branches": []}
+        assert due_reason(schedule, 3600, 50, now=1001) == "50 kills"
+        assert due_reason(schedule, 3600, 51, now=1001) is None
+
+    def test_due_on_schedule_only_after_use(self):
+        """Test the interval only triggers a run once agents were killed."""
+        schedule = {"last_run": 1000, "kills": 0, "branches": []}
+        assert due_reason(schedule, 3600, 0, now=5000) is None
+        schedule["kills"] = 1
+        assert due_reason(schedule, 3600, 0, now=5000) == "schedule"
+        assert due_reason(schedule, 0, 0, now=5000) is None
+
+
+class TestMaintain:
+    """Test maintenance runs against a real repository."""
+
+    def test_cleans_up_after_killed_agents(self, git_repo, temp_dir):
+        """Test admin dirs, loose objects and killed branches' reflogs go."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        for branch in ("kept", "killed"):
+            path = worktree_mgr.create_worktree(branch)
+            (path / "file.txt").write_text(branch)
+            git(path, "add", ".")
+            git(path, "commit", "-m", branch)
+            shutil.rmtree(path)
+        record_kills(git_repo, 2, ["killed", "deleted"])
+
+        run = maintain(git_repo, worktree_mgr, trigger="test")
+
+        assert run is not None and run.ok
+        assert run.before["worktree_admin"] == 2
+        assert run.after["worktree_admin"] == 0
+        assert run.before["loose_objects"] > 0
+        assert run.after["loose_objects"] == 0
+        assert run.after["loose_refs"] == 0
+        assert "reflog expire" in [step.name for step in run.steps]
+        assert git(git_repo, "reflog", "show", "killed") == ""
+        assert git(git_repo, "reflog", "show", "kept") != ""
+
+        schedule = load_schedule(git_repo)
+        assert schedule["kills"] == 0
+        assert schedule["branches"] == []
+        assert schedule["last_run"] == run.started
+        assert [r.trigger for r in read_history(git_repo)] == ["test"]
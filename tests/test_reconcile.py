@@ -0,0 +1,131 @@
+"""Tests for state/tmux/worktree reconciliation."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from aifleet.reconcile import FleetSnapshot, Reconciler, compute_report
+from aifleet.state import Agent, StateManager
+from aifleet.tmux import TmuxManager
+
+
+def make_agent(branch: str, worktree: str) -> Agent:
+    """Create an agent record for tests."""
+    return Agent(
+        branch=branch,
+        worktree=worktree,
+        session=f"ai_{branch}",
+        batch_id="batch1",
+        agent="claude",
+        created_at=datetime.now().isoformat(),
+    )
+
+
+class TestComputeReport:
+    """Test mismatch detection."""
+
+    def test_sessions_only(self):
+        """Without worktree data only session drift is reported."""
+        snapshot = FleetSnapshot(
+            agents=[make_agent("alive", "/wt/alive"), make_agent("gone", "/wt/gone")],
+            sessions={"ai_alive": 100, "ai_stray": 200},
+        )
+
+        report = compute_report(snapshot, TmuxManager())
+
+        assert [a.branch for a in report.healthy] == ["alive"]
+        assert [a.branch for a in report.dead] == ["gone"]
+        assert report.orphan_sessions == ["ai_stray"]
+        assert report.missing_worktree == []
+        assert report.orphan_worktrees == []
+
+    def test_three_way(self, temp_dir):
+        """Test every category with a worktree listing."""
+        root = temp_dir / "worktrees"
+        paths = {name: str(root / name) for name in ["ok", "dead", "pair", "lone"]}
+
+        snapshot = FleetSnapshot(
+            agents=[
+                make_agent("ok", paths["ok"]),
+                make_agent("dead", paths["dead"]),
+                make_agent("vanished", str(root / "vanished")),
+            ],
+            sessions={"ai_ok": 1, "ai_pair": 2, "ai_stray": 3},
+            worktrees={
+                paths["ok"]: "ok",
+                paths["dead"]: "dead",
+                paths["pair"]: "pair",
+                paths["lone"]: "lone",
+                str(temp_dir / "main-repo"): "main",
+            },
+        )
+
+        report = compute_report(snapshot, TmuxManager(), root)
+
+        assert [a.branch for a in report.healthy] == ["ok"]
+        assert [a.branch for a in report.dead] == ["dead"]
+        assert [a.branch for a in report.missing_worktree] == ["vanished"]
+        assert report.adoptable == [("ai_pair", paths["pair"], "pair")]
+        assert report.orphan_sessions == ["ai_stray"]
+        # The main checkout is outside worktree_root and never an orphan
+        assert report.orphan_worktrees == [(paths["lone"], "lone")]
+        assert not report.is_clean
+
+    def test_sessions_outside_worktree_root_are_not_orphans(self, temp_dir):
+        """Test unknown sessions of other projects on the same server are kept."""
+        root = temp_dir / "worktrees"
+        snapshot = FleetSnapshot(
+            agents=[],
+            sessions={"ai_mine": 1, "ai_theirs": 2, "ai_headless": 3},
+            session_paths={
+                "ai_mine": str(root / "mine" / "src"),
+                "ai_theirs": str(temp_dir / "other" / "worktrees" / "theirs"),
+            },
+        )
+
+        report = compute_report(snapshot, TmuxManager(), root)
+
+        assert report.orphan_sessions == ["ai_headless", "ai_mine"]
+
+    def test_clean(self):
+        """Test a fleet where everything agrees."""
+        snapshot = FleetSnapshot(
+            agents=[make_agent("ok", "/wt/ok")], sessions={"ai_ok": 1}
+        )
+
+        assert compute_report(snapshot, TmuxManager()).is_clean
+
+
+class TestReconciler:
+    """Test bulk fixes."""
+
+    def test_adopt_and_collect(self, temp_dir):
+        """Adopted pairs land in state; stale records are removed in bulk."""
+        state = StateManager(temp_dir)
+        state.add_agent(make_agent("dead", str(temp_dir / "dead")))
+
+        config = MagicMock()
+        config.default_agent = "claude"
+        tmux = MagicMock()
+        tmux.kill_sessions.return_value = True
+        worktree = MagicMock()
+        worktree.remove_worktrees.side_effect = lambda paths: paths
+
+        reconciler = Reconciler(config, state, tmux, worktree)
+        report = compute_report(
+            FleetSnapshot(
+                agents=state.list_agents(),
+                sessions={"ai_stray": 1},
+            ),
+            TmuxManager(),
+        )
+        report.adoptable = [("ai_pair", str(temp_dir / "pair"), "pair")]
+        report.orphan_worktrees = [(str(temp_dir / "lone"), "lone")]
+
+        assert reconciler.adopt(report) == ["pair"]
+        collected = reconciler.collect_garbage(report)
+
+        assert [a.branch for a in state.list_agents()] == ["pair"]
+        tmux.kill_sessions.assert_called_once_with(["ai_stray"])
+        worktree.remove_worktrees.assert_called_once()
+        assert "state record dead" in collected
+        assert "session ai_stray" in collected
@@ -0,0 +1,92 @@
+"""Tests for scrollback spilling."""
+
+import gzip
+import shlex
+import shutil
+import subprocess
+
+import pytest
+
+from aifleet.scrollback import (
+    clean_output,
+    remove_spill,
+    render_output,
+    spill_command,
+    spill_dir,
+    spilled_lines,
+    stitch_output,
+    tail_spilled,
+)
+
+
+class TestScrollback:
+    """Tests for spilled output segments."""
+
+    def test_spill_command_writes_segments(self, temp_dir):
+        """Test output is compressed chunk by chunk, including the last one."""
+        directory = spill_dir(temp_dir, "ai_a")
+        command = spill_command(directory, 12)
+        assert "%%" in command
+
+        # tmux turns %% back into % before running the command
+        argv = shlex.split(command.replace("%%", "%"))
+        output = "".join(f"line{i}\n" for i in range(5))
+        subprocess.run(argv, input=output, text=True, check=True)
+
+        # Two full chunks, then the remainder once the pane's output ends
+        assert len(list(directory.glob("seg-*.gz"))) == 3
+        assert (directory / "current.log").read_text() == ""
+        assert tail_spilled(directory, 3) == ["line2", "line3", "line4"]
+        assert tail_spilled(directory, 100) == [f"line{i}" for i in range(5)]
+
+    def test_tail_spilled_reads_only_needed_segments(self, temp_dir):
+        """Test older segments are not opened once enough lines are found."""
+        directory = temp_dir / "logs"
+        directory.mkdir()
+        (directory / "seg-1-000000.gz").write_bytes(b"not gzip")
+        with gzip.open(directory / "seg-2-000001.gz", "wt") as f:
+            f.write("a\nb\nc\n")
+        (directory / "current.log").write_text("d\n")
+
+        assert tail_spilled(directory, 2) == ["c", "d"]
+        assert tail_spilled(temp_dir / "missing", 5) == []
+
+    def test_clean_output(self):
+        """Test terminal escapes and carriage returns are removed."""
+        assert clean_output("\x1b[1;32mok\x1b[0m\r\nnext\r") == "ok\nnext\n"
+
+    def test_spill_command_keeps_newest_segments(self, temp_dir):
+        """Test the oldest segments are deleted beyond the cap."""
+        directory = spill_dir(temp_dir, "ai_a")
+        argv = shlex.split(spill_command(directory, 6, 2).replace("%%", "%"))
+        output = "".join(f"line{i}\n" for i in range(5))
+        subprocess.run(argv, input=output, text=True, check=True)
+
+        assert len(list(directory.glob("seg-*.gz"))) == 2
+        assert tail_spilled(directory, 100) == ["line3", "line4"]
+
+        remove_spill(temp_dir, "ai_a")
+        assert not directory.exists()
+
+    def test_stitch_output(self):
+        """Test lines shared by the spill and the live pane appear once."""
+        assert stitch_output(["a", "b", "c  "], ["b", "c", "d"]) == [
+            "a",
+            "b",
+            "c  ",
+            "d",
+        ]
+        assert stitch_output(["a"], ["b"]) == ["a", "b"]
+        assert stitch_output([], ["b"]) == ["b"]
+
+    @pytest.mark.skipif(not shutil.which("tmux"), reason="tmux not installed")
+    def test_spilled_lines_renders_cursor_movement(self, temp_dir):
+        """Test output redrawn in place reads as it was displayed."""
+        directory = temp_dir / "logs"
+        directory.mkdir()
+        # A progress line rewritten in place, then a status line erased
+        raw = "start\r\nstep 1\x1b[1Gstep 2\r\nbusy\x1b[2K\rdone\r\n"
+        (directory / "current.log").write_text(raw)
+
+        assert render_output(raw, 40, 10) == ["start", "step 2", "done"]
+        assert spilled_lines(directory, 2, lambda: (40, 10)) == ["step 2", "done"]
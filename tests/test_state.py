@@ -350,3 +350,25 @@ class TestStateManager:
         remaining = state.list_agents()
         assert len(remaining) == 2
         assert all(a.branch in ["branch0", "branch2"] for a in remaining)
+
+    def test_bulk_add_and_remove(self, temp_dir):
+        """Test adding and removing several agents with one write each."""
+        state = StateManager(temp_dir)
+        agents = [
+            Agent(
+                branch=f"branch-{i}",
+                worktree=f"/path/{i}",
+                session=f"ai_branch-{i}",
+                batch_id="batch1",
+                agent="claude",
+                created_at=datetime.now().isoformat(),
+            )
+            for i in range(3)
+        ]
+
+        state.add_agents(agents)
+        assert len(state.list_agents()) == 3
+
+        removed = state.remove_agents(["branch-0", "branch-2", "missing"])
+        assert removed == ["branch-0", "branch-2"]
+        assert [a.branch for a in state.list_agents()] == ["branch-1"]
@@ -0,0 +1,118 @@
+"""Tests for incremental status detection."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from aifleet.status import StatusTracker
+from aifleet.tmux import TmuxManager
+
+
+class TestStatusTracker:
+    """Test activity-based capture skipping."""
+
+    def test_captures_only_when_activity_changes(self):
+        """Unchanged panes reuse their status; changed panes are captured."""
+        tmux = MagicMock(spec=TmuxManager)
+        tmux.session_activity.return_value = {"ai_a": 1000}
+        tmux.get_agent_status.return_value = "running"
+        tracker = StatusTracker(tmux, idle_after=30)
+
+        assert tracker.status("a", "ai_a", True, now=1005) == "running"
+        assert tracker.status("a", "ai_a", True, now=1006) == "running"
+        assert tmux.get_agent_status.call_count == 1
+
+        # Silent long enough: reported idle without a capture
+        assert tracker.status("a", "ai_a", True, now=1031) == "idle"
+        assert tmux.get_agent_status.call_count == 1
+
+        # New output moves the activity time and forces a capture
+        tmux.session_activity.return_value = {"ai_a": 1040}
+        tmux.get_agent_status.return_value = "ready"
+        assert tracker.status("a", "ai_a", True, now=1041) == "ready"
+        assert tmux.get_agent_status.call_count == 2
+        assert (tracker.captures, tracker.reused) == (2, 2)
+
+    def test_same_second_activity_is_rechecked(self):
+        """Output in the second of the last check may be newer than it."""
+        tmux = MagicMock(spec=TmuxManager)
+        tmux.session_activity.return_value = {"ai_a": 1000}
+        tmux.get_agent_status.return_value = "running"
+        tracker = StatusTracker(tmux)
+
+        tracker.status("a", "ai_a", True, now=1000.2)
+        tracker.status("a", "ai_a", True, now=1000.9)
+        assert tmux.get_agent_status.call_count == 2
+
+    def test_prefetch_skips_unchanged_panes(self):
+        """Only panes whose activity moved are captured ahead of time."""
+        tmux = MagicMock(spec=TmuxManager)
+        tmux.session_activity.return_value = {"ai_a": 1000, "ai_b": 1000}
+        tmux.get_agent_status.return_value = "running"
+        tracker = StatusTracker(tmux)
+        tracker.status("a", "ai_a", True, now=1005)
+
+        tracker.prefetch([("a", "ai_a"), ("b", "ai_b")])
+        tmux.prefetch_panes.assert_called_once_with(["b"])
+
+    def test_dead_sessions_are_not_captured(self):
+        """Sessions missing from the snapshot are dead without probing."""
+        tmux = MagicMock(spec=TmuxManager)
+        tracker = StatusTracker(tmux)
+
+        assert tracker.status("a", "ai_a", False) == "dead"
+        tmux.get_agent_status.assert_not_called()
+
+    def test_summary_reports_savings(self):
+        """The footer line combines activity skips and hash hits."""
+        tmux = MagicMock(spec=TmuxManager)
+        tmux.session_activity.return_value = {"ai_a": 1000}
+        tmux.get_agent_status.return_value = "ready"
+        tmux.status_cache_hits = 3
+        tmux.status_cache_misses = 1
+        tracker = StatusTracker(tmux)
+
+        assert tracker.summary() == []
+        tracker.status("a", "ai_a", True, now=1005)
+        tracker.status("a", "ai_a", True, now=1006)
+
+        assert tracker.summary() == [
+            "Probes: 1/2 skipped (no activity), 3/4 captures unchanged (75% hash hits)"
+        ]
+
+    def test_first_sight_of_silent_agent_is_idle(self):
+        """A running agent silent for idle_after is idle on the first check."""
+        tmux = MagicMock(spec=TmuxManager)
+        tmux.session_activity.return_value = {"ai_a": 1000}
+        tmux.get_agent_status.return_value = "running"
+        tracker = StatusTracker(tmux, idle_after=30)
+
+        assert tracker.status("a", "ai_a", True, now=1100) == "idle"
+
+    def test_exited_pane_process_is_dead(self):
+        """A session whose pane process is gone is dead without probing."""
+        tmux = MagicMock(spec=TmuxManager)
+        process = subprocess.Popen(["true"])
+        process.wait()
+        tracker = StatusTracker(tmux)
+
+        assert tracker.status("a", "ai_a", True, pid=process.pid) == "dead"
+        tmux.get_agent_status.assert_not_called()
+
+    def test_process_change_forces_capture(self):
+        """The agent exiting to its shell is noticed without new output."""
+        tmux = MagicMock(spec=TmuxManager)
+        tmux.session_activity.return_value = {"ai_a": 1000}
+        tmux.get_agent_status.return_value = "running"
+        tracker = StatusTracker(tmux)
+
+        with patch("aifleet.status.process_alive", return_value=True):
+            with patch("aifleet.status.pane_processes") as processes:
+                processes.return_value = frozenset({43})
+                tracker.status("a", "ai_a", True, now=1005, pid=42)
+                tracker.status("a", "ai_a", True, now=1006, pid=42)
+                assert tmux.get_agent_status.call_count == 1
+
+                processes.return_value = frozenset()
+                tmux.get_agent_status.return_value = "ready"
+                assert tracker.status("a", "ai_a", True, now=1007, pid=42) == "ready"
+                assert tmux.get_agent_status.call_count == 2
@@ -141,3 +141,235 @@ class TestTmuxManager:
         with patch.object(tmux_mgr, "get_pane_content", return_value="short"):
             status = tmux_mgr.get_agent_status("feature-branch")
             assert status == "idle"
+
+    def test_send_prompt_uses_paste_buffer(self):
+        """Test prompts are loaded from stdin and pasted in one tmux call."""
+        tmux_mgr = TmuxManager()
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert tmux_mgr.send_prompt("feature", "big\nprompt")
+
+            mock_run.assert_called_once()
+            args = mock_run.call_args[0][0]
+            assert args[:2] == ["tmux", "load-buffer"]
+            assert "paste-buffer" in args and "-p" in args
+            assert args[-4:] == ["send-keys", "-t", "ai_feature", "Enter"]
+            assert mock_run.call_args.kwargs["input"] == "big\nprompt"
+
+    def test_send_prompts_retries_only_undelivered(self):
+        """Test a failed chain only retries prompts that were not delivered."""
+        tmux_mgr = TmuxManager()
+
+        def fake_run(args, **kwargs):
+            result = MagicMock()
+            if "list-panes" in args:
+                result.returncode = 0
+                result.stdout = "ai_a#1\t%1\nai_b\t%2\nai_b\t%3\n"
+            else:
+                result.returncode = 1
+                result.stdout = "0\n"
+            return result
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            with patch.object(tmux_mgr, "send_prompt", return_value=False) as single:
+                results = tmux_mgr.send_prompts({"a#1": "go", "b": "go"})
+
+            assert results == {"a#1": True, "b": False}
+            single.assert_called_once_with("b", "go")
+            chain = mock_run.call_args_list[1][0][0]
+            assert chain.count("paste-buffer") == 2
+            assert chain.count("load-buffer") == 1
+            # Panes are targeted by ID and only numbers are displayed
+            targets = [chain[i + 1] for i, a in enumerate(chain) if a == "-t"]
+            assert set(targets) == {"%1", "%2"}
+            assert [
+                chain[i + 2] for i, a in enumerate(chain) if a == "display-message"
+            ] == [
+                "0",
+                "1",
+            ]
+
+    def test_session_name_replaces_target_separators(self):
+        """Test branch characters tmux reads as target separators are replaced."""
+        assert TmuxManager().session_name("fix/v1.2:x#3") == "ai_fix-v1-2-x#3"
+
+    def test_socket_name_is_passed_to_every_call(self):
+        """Test a dedicated socket adds -L to tmux invocations."""
+        with patch("libtmux.Server") as mock_server:
+            tmux_mgr = TmuxManager(socket_name="fleet")
+        mock_server.assert_called_once_with(socket_name="fleet")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            tmux_mgr.list_sessions()
+            tmux_mgr.kill_sessions(["ai_a", "ai_b"])
+
+            for call in mock_run.call_args_list:
+                assert call[0][0][:3] == ["tmux", "-L", "fleet"]
+
+    def test_sharded_operations_fan_out(self):
+        """Test sessions are placed by hash and fleet calls merge all shards."""
+        with patch("libtmux.Server"):
+            tmux_mgr = TmuxManager(socket_name="fleet", shard_count=3)
+
+        assert [s.socket_name for s in tmux_mgr.shards] == [
+            "fleet-0",
+            "fleet-1",
+            "fleet-2",
+        ]
+        # Placement is stable across managers
+        with patch("libtmux.Server"):
+            other = TmuxManager(socket_name="fleet", shard_count=3)
+        for name in ["ai_a", "ai_b", "ai_c"]:
+            assert (
+                tmux_mgr.shard_for(name).socket_name
+                == other.shard_for(name).socket_name
+            )
+
+        def fake_run(args, **kwargs):
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = f"ai_on-{args[2]}\t1\n"
+            return result
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            sessions = tmux_mgr.list_sessions()
+
+        assert mock_run.call_count == 3
+        assert sorted(name for name, _ in sessions) == [
+            "ai_on-fleet-0",
+            "ai_on-fleet-1",
+            "ai_on-fleet-2",
+        ]
+
+        with patch("subprocess.run") as mock_run:
+            tmux_mgr.get_pane_content("a")
+        args = mock_run.call_args[0][0]
+        assert args[2] == tmux_mgr.shard_for("ai_a").socket_name
+
+    def test_list_sessions_records_activity(self):
+        """Test the pane snapshot also yields per-session activity times."""
+        tmux_mgr = TmuxManager()
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "ai_a\t10\t100\nai_a\t11\t150\nother\t12\t200\n"
+
+        with patch("subprocess.run", return_value=mock_result):
+            assert tmux_mgr.list_sessions() == [("ai_a", 10)]
+
+        assert tmux_mgr.session_activity() == {"ai_a": 150}
+
+    def test_list_sessions_records_server_pid(self):
+        """Test the snapshot also yields the tmux server PID."""
+        tmux_mgr = TmuxManager()
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "ai_a\t10\t100\t99\nother\t12\t200\t99\n"
+
+        with patch("subprocess.run", return_value=mock_result):
+            tmux_mgr.list_sessions()
+
+        assert tmux_mgr.server_pids() == [99]
+
+    def test_list_sessions_records_paths(self):
+        """Test the snapshot also yields each session's working directory."""
+        tmux_mgr = TmuxManager()
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "ai_a\t10\t100\t99\t/wt/a\tb\nai_a\t11\t100\t99\t/x\n"
+
+        with patch("subprocess.run", return_value=mock_result):
+            tmux_mgr.list_sessions()
+
+        assert tmux_mgr.session_paths() == {"ai_a": "/wt/a\tb"}
+
+    def test_kill_sessions_skips_missing_sessions(self):
+        """Test a session that is already gone doesn't stop the others."""
+        tmux_mgr = TmuxManager()
+
+        def fake_run(args, **kwargs):
+            result = MagicMock()
+            missing = "=ai_gone" in args
+            result.returncode = 1 if missing else 0
+            result.stderr = "can't find session: ai_gone\n" if missing else ""
+            return result
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            assert tmux_mgr.kill_sessions(["ai_gone", "ai_b"])
+
+        singles = [call[0][0] for call in mock_run.call_args_list[1:]]
+        assert singles == [
+            ["tmux", "kill-session", "-t", "=ai_gone"],
+            ["tmux", "kill-session", "-t", "=ai_b"],
+        ]
+
+    def test_create_session_with_history_limit(self):
+        """Test a history limit recreates the first window after setting it."""
+        tmux_mgr = TmuxManager()
+        tmux_mgr.server = MagicMock()
+        tmux_mgr.server.find_where.return_value = None
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            session = tmux_mgr.create_session("a", "/wt", "agent", history_limit=500)
+
+        assert session is tmux_mgr.server.sessions.get.return_value
+        args = mock_run.call_args[0][0]
+        set_at = args.index("history-limit")
+        assert args[set_at + 1] == "500"
+        assert args.index("new-window") > set_at
+        assert args[-1] == "agent"
+        tmux_mgr.server.new_session.assert_not_called()
+
+    def test_prefetch_panes_serves_next_capture(self):
+        """Test prefetched captures replace the next tmux call per branch."""
+        tmux_mgr = TmuxManager()
+
+        async def fake_run(args, resource, *rest, **kwargs):
+            return 0, f"pane of {args[-2]}", ""
+
+        with patch("aifleet.aio.run", side_effect=fake_run):
+            tmux_mgr.prefetch_panes(["a", "b"])
+
+        with patch("subprocess.run") as mock_run:
+            assert tmux_mgr.get_pane_content("a") == "pane of ai_a"
+            assert tmux_mgr.get_pane_content("b") == "pane of ai_b"
+            mock_run.assert_not_called()
+            tmux_mgr.get_pane_content("a")
+            mock_run.assert_called_once()
+
+    def test_agent_status_skips_scan_for_identical_capture(self):
+        """Test an unchanged capture reuses its status without rescanning."""
+        tmux_mgr = TmuxManager()
+
+        with patch.object(tmux_mgr, "get_pane_content", return_value="Thinking..."):
+            with patch("aifleet.tmux.classify_pane", return_value="running") as scan:
+                assert tmux_mgr.get_agent_status("a", alive=True) == "running"
+                assert tmux_mgr.get_agent_status("a", alive=True) == "running"
+                assert scan.call_count == 1
+
+        with patch.object(tmux_mgr, "get_pane_content", return_value="$ "):
+            assert tmux_mgr.get_agent_status("a", alive=True) == "ready"
+
+        assert (tmux_mgr.status_cache_hits, tmux_mgr.status_cache_misses) == (1, 2)
+
+    def test_status_cache_forgets_gone_sessions(self):
+        """Test a snapshot drops cached statuses of sessions that are gone."""
+        tmux_mgr = TmuxManager()
+        with patch.object(tmux_mgr, "get_pane_content", return_value="$ "):
+            tmux_mgr.get_agent_status("a", alive=True)
+            tmux_mgr.get_agent_status("b", alive=True)
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "ai_a\t10\t100\t99\t/wt/a\n"
+        with patch("subprocess.run", return_value=mock_result):
+            tmux_mgr.list_sessions()
+
+        assert list(tmux_mgr._status_cache) == ["a"]
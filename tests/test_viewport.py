@@ -0,0 +1,90 @@
+"""Tests for the watch-mode viewport."""
+
+from rich.console import Console
+
+from aifleet.commands.viewport import Viewport
+
+
+def make_records(count: int, batches: int = 1):
+    """Create lightweight agent records."""
+    return [
+        {
+            "branch": f"branch-{i:03d}",
+            "batch_id": f"batch-{i % batches}",
+            "agent": "claude",
+            "status": "running" if i % 2 else "idle",
+            "cpu": float(i),
+            "memory": 10.0,
+            "uptime": 60.0,
+            "created": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}",
+        }
+        for i in range(count)
+    ]
+
+
+def render_text(viewport: Viewport, records, height: int) -> str:
+    """Render a viewport to plain text."""
+    console = Console(width=160, record=True)
+    console.print(viewport.render(records, height))
+    return console.export_text()
+
+
+class TestViewport:
+    """Test the viewport renderer."""
+
+    def test_only_visible_rows_are_rendered(self):
+        """Rendered rows depend on the height; the summary covers everything."""
+        viewport = Viewport(["branch", "status", "cpu"])
+        records = make_records(300)
+
+        text = render_text(viewport, records, height=20)
+
+        assert "branch-000" in text
+        assert "branch-299" not in text
+        assert "Total: 300 agents (300 active)" in text
+        assert viewport.page_size < 20
+
+    def test_scrolling(self):
+        """Moving past the window scrolls it."""
+        viewport = Viewport(["branch"])
+        records = make_records(100)
+        render_text(viewport, records, height=20)
+
+        viewport.handle_key("G")
+        text = render_text(viewport, records, height=20)
+
+        assert "branch-099" in text
+        assert "branch-000" not in text
+        assert viewport.offset == 100 - viewport.page_size
+
+    def test_sorting(self):
+        """Sorting cycles through available keys and can be reversed."""
+        viewport = Viewport(["branch", "cpu"])
+        records = make_records(50)
+
+        viewport.handle_key("s")
+        assert viewport.sort_key == "branch"
+        viewport.handle_key("s")
+        assert viewport.sort_key == "cpu"
+        viewport.handle_key("r")
+
+        rows = viewport.build_rows(records)
+        assert rows[0][1]["branch"] == "branch-049"
+
+    def test_collapsible_batches(self):
+        """Folded batches show only their header row."""
+        viewport = Viewport(["branch"], grouped=True)
+        records = make_records(30, batches=3)
+        render_text(viewport, records, height=50)
+
+        # Cursor starts on the first batch header
+        viewport.handle_key("enter")
+        rows = viewport.build_rows(records)
+        assert rows[0] == ("batch", ("batch-0", 10, True))
+        assert rows[1][0] == "batch"
+        assert len(rows) == 1 + 11 + 11
+
+        viewport.handle_key("c")
+        assert len(viewport.build_rows(records)) == 3
+        viewport.handle_key("e")
+        assert len(viewport.build_rows(records)) == 33
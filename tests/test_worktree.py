@@ -1,8 +1,11 @@
 """Tests for worktree operations."""
 
+import os
 import subprocess
+from pathlib import Path
+from unittest.mock import patch
 
-from aifleet.worktree import WorktreeManager
+from aifleet.worktree import WorktreeManager, WorktreeSetup
 
 
 class TestWorktreeManager:
@@ -163,10 +166,11 @@ class TestWorktreeManager:
 
         # Setup worktree
         path = worktree_mgr.setup_worktree(
-            branch="test-setup",
-            credential_files=[".env"],
-            setup_commands=["echo 'Setup complete' > setup.log"],
-            quick_setup=False,
+            "test-setup",
+            WorktreeSetup(
+                credential_files=[".env"],
+                commands=["echo 'Setup complete' > setup.log"],
+            ),
         )
 
         assert path is not None
@@ -179,15 +183,261 @@ class TestWorktreeManager:
 
         # Setup worktree with quick mode
         path = worktree_mgr.setup_worktree(
-            branch="test-quick",
-            credential_files=[],
-            setup_commands=["echo 'Should not run' > setup.log"],
-            quick_setup=True,
+            "test-quick",
+            WorktreeSetup(commands=["echo 'Should not run' > setup.log"], quick=True),
         )
 
         assert path is not None
         assert not (path / "setup.log").exists()  # Command should not run
 
+    def test_setup_worktrees_concurrently(self, git_repo, temp_dir):
+        """Test several worktrees are prepared in one event loop."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+
+        paths = worktree_mgr.setup_worktrees(
+            ["one", "two", "three"], WorktreeSetup(commands=["pwd > setup.log"])
+        )
+
+        assert [p.name for p in paths] == ["one", "two", "three"]
+        for path in paths:
+            assert (path / "setup.log").read_text().strip() == str(path)
+        branches = [b for _, b in worktree_mgr.list_worktrees()]
+        assert {"refs/heads/one", "refs/heads/two", "refs/heads/three"} <= set(branches)
+
+    def test_park_and_reuse_worktree(self, git_repo, temp_dir):
+        """Test a parked worktree keeps its caches and is reused."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        path = worktree_mgr.create_worktree("first")
+        (path / "node_modules").mkdir()
+        (path / "node_modules" / "dep.js").write_text("cached")
+        (path / "scratch.txt").write_text("agent output")
+        (path / "README.md").write_text("edited")
+
+        # Uncommitted changes need force
+        assert not worktree_mgr.park_worktree(path, ["node_modules"], pool_size=2)
+        assert worktree_mgr.park_worktree(
+            path, ["node_modules"], pool_size=2, force=True
+        )
+        assert not path.exists()
+        assert len(worktree_mgr.parked_worktrees()) == 1
+
+        reused = worktree_mgr.create_worktree("second")
+        assert reused == temp_dir / "worktrees" / "second"
+        assert worktree_mgr.parked_worktrees() == []
+        assert (reused / "node_modules" / "dep.js").read_text() == "cached"
+        assert not (reused / "scratch.txt").exists()
+        assert (reused / "README.md").read_text() == "# Test Repo"
+        info = worktree_mgr.get_worktree_info(reused)
+        assert info["branch"] == "second"
+
+    def test_park_removes_when_pool_is_full(self, git_repo, temp_dir):
+        """Test worktrees beyond the pool size are removed."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        path = worktree_mgr.create_worktree("only")
+
+        assert worktree_mgr.park_worktree(path, [], pool_size=0)
+        assert not path.exists()
+        assert worktree_mgr.parked_worktrees() == []
+
+    def test_resolve_base_fetches_once_per_ttl(self, git_repo, temp_dir):
+        """Test a remote base is fetched, pinned and reused within the TTL."""
+        upstream = temp_dir / "upstream"
+        subprocess.run(["git", "clone", "-q", str(git_repo), str(upstream)])
+        subprocess.run(
+            ["git", "-c", "user.name=T", "-c", "user.email=t@e", "commit", "-q"]
+            + ["--allow-empty", "-m", "upstream"],
+            cwd=upstream,
+        )
+        subprocess.run(["git", "remote", "add", "origin", str(upstream)], cwd=git_repo)
+        upstream_head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=upstream, capture_output=True, text=True
+        ).stdout.strip()
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        branch = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=upstream,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        assert worktree_mgr.resolve_base(f"origin/{branch}") == upstream_head
+        fetch_head = git_repo / ".git" / "FETCH_HEAD"
+        fetched_at = fetch_head.stat().st_mtime_ns
+        assert worktree_mgr.resolve_base(f"origin/{branch}") == upstream_head
+        assert fetch_head.stat().st_mtime_ns == fetched_at
+        assert worktree_mgr.resolve_base("no-such-ref") is None
+
+        path = worktree_mgr.create_worktree("pinned", base=upstream_head)
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=path, capture_output=True, text=True
+        ).stdout.strip()
+        assert head == upstream_head
+
+    def test_git_performance_profile(self, git_repo, temp_dir):
+        """Test the profile is scoped to the worktree and reported active."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        path = worktree_mgr.setup_worktree("fast", WorktreeSetup(git_performance=True))
+        plain = worktree_mgr.create_worktree("plain")
+
+        assert all(worktree_mgr.git_performance_status(path).values())
+        assert not any(worktree_mgr.git_performance_status(plain).values())
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=path, capture_output=True, text=True
+        )
+        assert status.returncode == 0
+
+    def test_fsmonitor_daemon_stopped_on_removal(self, git_repo, temp_dir):
+        """Test a worktree's fsmonitor daemon is stopped before it goes away."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        watched = worktree_mgr.create_worktree("watched")
+        plain = worktree_mgr.create_worktree("plain")
+        (git_repo / ".git" / "worktrees" / "watched" / "fsmonitor--daemon.ipc").touch()
+
+        with patch.object(
+            worktree_mgr, "_run_git", wraps=worktree_mgr._run_git
+        ) as run_git:
+            assert worktree_mgr.remove_worktree(watched, force=True)
+            assert worktree_mgr.remove_worktree(plain, force=True)
+
+        stops = [
+            c for c in run_git.call_args_list if c.args[0][0] == "fsmonitor--daemon"
+        ]
+        assert [c.kwargs["cwd"] for c in stops] == [watched]
+
+    def test_seed_build_outputs(self, git_repo, temp_dir):
+        """Test build outputs are cloned in without touching checked out files."""
+        build = git_repo / "build" / "obj"
+        build.mkdir(parents=True)
+        (build / "main.o").write_bytes(b"object")
+        os.utime(build / "main.o", (1000, 1000))
+        (git_repo / "build" / "latest").symlink_to("obj")
+        (git_repo / "README.md").write_text("uncommitted edit")
+
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+        path = worktree_mgr.setup_worktree(
+            "seeded", WorktreeSetup(seed_paths=["build/", "README.md", "dist/"])
+        )
+
+        seeded = path / "build" / "obj" / "main.o"
+        assert seeded.read_bytes() == b"object"
+        assert seeded.stat().st_mtime == 1000
+        assert seeded.stat().st_ino != (build / "main.o").stat().st_ino
+        assert os.readlink(path / "build" / "latest") == "obj"
+        assert (path / "README.md").read_text() != "uncommitted edit"
+
+    def test_clone_mode_shares_objects_and_returns_branch(self, git_repo, temp_dir):
+        """Test clones read objects via alternates and hand back their branch."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees", "clone")
+
+        path = worktree_mgr.create_worktree("agent-1")
+
+        assert worktree_mgr.is_clone(path)
+        alternates = path / ".git" / "objects" / "info" / "alternates"
+        assert alternates.read_text().strip() == str(git_repo / ".git" / "objects")
+        assert (path / "README.md").exists()
+        assert (str(path), "refs/heads/agent-1") in worktree_mgr.list_worktrees()
+
+        (path / "work.txt").write_text("work")
+        subprocess.run(["git", "add", "."], cwd=path)
+        identity = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(["git", *identity, "commit", "-m", "work"], cwd=path)
+        (path / "dirty.txt").write_text("dirty")
+        assert not worktree_mgr.remove_worktree(path)
+
+        (path / "dirty.txt").unlink()
+        assert worktree_mgr.remove_worktree(path)
+        assert not path.exists()
+        log = subprocess.run(
+            ["git", "log", "-1", "--format=%s", "agent-1"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+        )
+        assert log.stdout.strip() == "work"
+
+    def test_clone_objects_survive_gc_in_main_repo(self, git_repo, temp_dir):
+        """Test a clone's starting commit stays reachable in the main repo."""
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees", "clone")
+        identity = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+        def git(*args, cwd=git_repo):
+            return subprocess.run(
+                ["git", *identity, *args], cwd=cwd, capture_output=True, text=True
+            )
+
+        git("checkout", "-q", "-b", "doomed")
+        (git_repo / "doomed.txt").write_text("only in this branch")
+        git("add", ".")
+        git("commit", "-q", "-m", "doomed")
+        git("checkout", "-q", "-")
+
+        path = worktree_mgr.create_worktree("agent-1", base="doomed")
+        assert path is not None
+        git("branch", "-D", "doomed")
+        git("reflog", "expire", "--expire=now", "--all")
+        git("gc", "-q", "--prune=now")
+
+        assert git("fsck", "--connectivity-only", cwd=path).returncode == 0
+        assert (path / "doomed.txt").exists()
+        assert git("show-ref", "refs/aifleet/clones/agent-1").returncode == 0
+
+        assert worktree_mgr.remove_worktree(path, force=True)
+        assert git("show-ref", "refs/aifleet/clones/agent-1").returncode != 0
+
+    def test_clone_mode_partial_clone(self, git_repo, temp_dir):
+        """Test a clone filter makes a partial clone of the main repository."""
+        worktree_mgr = WorktreeManager(
+            git_repo, temp_dir / "worktrees", "clone", "blob:none"
+        )
+
+        path = worktree_mgr.create_worktree("agent-1")
+
+        assert path is not None
+        assert not (path / ".git" / "objects" / "info" / "alternates").exists()
+        result = subprocess.run(
+            ["git", "config", "remote.origin.partialclonefilter"],
+            cwd=path,
+            capture_output=True,
+            text=True,
+        )
+        assert result.stdout.strip() == "blob:none"
+        assert (path / "README.md").read_text() == "# Test Repo"
+
+    def test_submodules_use_main_checkout_objects(
+        self, git_repo, temp_dir, monkeypatch
+    ):
+        """Test submodules are initialized with the main checkout's modules."""
+        # Local paths as submodule URLs need the file protocol
+        monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+        monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.file.allow")
+        monkeypatch.setenv("GIT_CONFIG_VALUE_0", "always")
+        library = temp_dir / "library"
+        library.mkdir()
+        for args in (
+            ["init", "-q"],
+            ["-c", "user.name=T", "-c", "user.email=t@e", "commit", "-q"]
+            + ["--allow-empty", "-m", "lib"],
+        ):
+            subprocess.run(["git", *args], cwd=library, check=True)
+        for args in (
+            ["submodule", "add", "-q", str(library), "vendor/lib"],
+            ["commit", "-q", "-m", "Add submodule"],
+        ):
+            subprocess.run(["git", *args], cwd=git_repo, check=True)
+        worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")
+
+        path = worktree_mgr.setup_worktree("agent-1", WorktreeSetup(submodules=True))
+
+        alternates = subprocess.run(
+            ["git", "rev-parse", "--git-path", "objects/info/alternates"],
+            cwd=path / "vendor" / "lib",
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        store = git_repo / ".git" / "modules" / "vendor" / "lib" / "objects"
+        text = (path / "vendor" / "lib" / alternates).read_text().strip()
+        assert Path(text).resolve() == store.resolve()
+
     def test_get_worktree_info(self, git_repo, temp_dir):
         """Test getting worktree information."""
         worktree_mgr = WorktreeManager(git_repo, temp_dir / "worktrees")